@@ -0,0 +1,153 @@
+"""
+Nebula Strike - Parallel batch simulator
+Plays many seeded headless sessions across worker processes for balance testing
+"""
+
+import os
+import json
+import argparse
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from main import Game, FPS
+from src.policies import POLICIES, make_policy
+
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+
+
+# One headless game per worker process, reused across its sessions
+_game = None
+
+
+def worker_game():
+    """The headless game of this process, created on first use"""
+    global _game
+    if _game is None:
+        _game = Game(headless=True)
+    return _game
+
+
+def run_session(task):
+    """Play one session and return its result
+
+    task is (seed, level, policy, max_frames). Runs in a worker process.
+    """
+    seed, level, policy, max_frames = task
+    game = worker_game()
+    game.seed = seed
+    game.selected_level = level
+    game.new_game()
+    inputs = make_policy(policy, seed)
+
+    start = perf_counter()
+    frames = game.simulate(max_frames, inputs)
+    elapsed = perf_counter() - start
+    return {
+        "seed": seed,
+        "level": level,
+        "policy": policy,
+        "outcome": game.game_state,
+        "frames": frames,
+        "survival_time": frames / FPS,
+        "score": game.score,
+        "level_reached": game.level,
+        "damage_taken": game.player.damage_taken,
+        "elapsed": elapsed,
+        "worker": os.getpid()
+    }
+
+
+def make_tasks(sessions, levels, policies, max_frames, seed=0):
+    """Sessions for every level and policy, sharing seeds across groups"""
+    return [(seed + i, level, policy, max_frames)
+            for level in levels for policy in policies for i in range(sessions)]
+
+
+def run_batch(tasks, workers=None):
+    """Run sessions across a process pool and return their results in order"""
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_session, tasks, chunksize=chunksize))
+
+
+def summarize(results):
+    """Aggregate session results per level and policy, and speed per worker"""
+    groups = {}
+    for result in results:
+        groups.setdefault(f"level{result['level']}/{result['policy']}", []).append(result)
+
+    summary = {"groups": {}, "workers": {}}
+    for name, group in groups.items():
+        survival = np.array([r["survival_time"] for r in group])
+        outcomes = [r["outcome"] for r in group]
+        summary["groups"][name] = {
+            "sessions": len(group),
+            "victory": outcomes.count("victory"),
+            "game_over": outcomes.count("game_over"),
+            "timed_out": outcomes.count("playing"),
+            "survival_mean": round(float(survival.mean()), 2),
+            "survival_p50": round(float(np.percentile(survival, 50)), 2),
+            "survival_p10": round(float(np.percentile(survival, 10)), 2),
+            "score_mean": round(float(np.mean([r["score"] for r in group])), 1),
+            "score_max": max(r["score"] for r in group),
+            "damage_mean": round(float(np.mean([r["damage_taken"] for r in group])), 1)
+        }
+
+    for result in results:
+        worker = summary["workers"].setdefault(result["worker"], {"sessions": 0, "frames": 0, "elapsed": 0.0})
+        worker["sessions"] += 1
+        worker["frames"] += result["frames"]
+        worker["elapsed"] += result["elapsed"]
+    for worker in summary["workers"].values():
+        worker["fps"] = round(worker["frames"] / worker["elapsed"]) if worker["elapsed"] > 0 else 0
+        worker["elapsed"] = round(worker["elapsed"], 2)
+    return summary
+
+
+def print_summary(summary, wall_time):
+    """Print a human-readable summary table"""
+    print(f"{'group':<20}{'runs':>6}{'won':>6}{'died':>6}{'timeout':>8}"
+          f"{'surv p10':>10}{'surv p50':>10}{'score':>10}{'damage':>8}")
+    for name, stats in summary["groups"].items():
+        print(f"{name:<20}{stats['sessions']:>6}{stats['victory']:>6}{stats['game_over']:>6}"
+              f"{stats['timed_out']:>8}{stats['survival_p10']:>10.1f}{stats['survival_p50']:>10.1f}"
+              f"{stats['score_mean']:>10.0f}{stats['damage_mean']:>8.1f}")
+    total_frames = sum(w["frames"] for w in summary["workers"].values())
+    fps = [w["fps"] for w in summary["workers"].values()]
+    print(f"{len(fps)} workers, {total_frames} frames in {wall_time:.1f}s "
+          f"({total_frames / wall_time:.0f} fps total, {min(fps)}-{max(fps)} fps per worker)")
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Nebula Strike batch simulator")
+    parser.add_argument("--sessions", type=int, default=100, help="sessions per level and policy")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1], help="starting levels")
+    parser.add_argument("--policies", nargs="+", default=["dodge"],
+                        help="input policies: %s, or module:factory" % ", ".join(POLICIES))
+    parser.add_argument("--frames", type=int, default=FPS * 180, help="frame limit per session")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first session")
+    parser.add_argument("--json", metavar="PATH", default=None,
+                        help="write the summary and every session result as JSON to PATH")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    for policy in args.policies:
+        make_policy(policy)
+    tasks = make_tasks(args.sessions, args.levels, args.policies, args.frames, args.seed)
+    start = perf_counter()
+    results = run_batch(tasks, args.workers)
+    wall_time = perf_counter() - start
+    summary = summarize(results)
+    print_summary(summary, wall_time)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"summary": summary, "sessions": results}, f, indent=2)
+    pygame.quit()
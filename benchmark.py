@@ -0,0 +1,240 @@
+"""
+Nebula Strike - Worst-case frame benchmarks
+Builds stress scenarios headless and reports per-phase frame times
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+import numpy as np
+from main import Game, SCREEN_WIDTH, FPS, PARTICLE_BUDGET
+from src.level import load_level
+from src.controls import FIRE
+
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+
+
+FRAME_BUDGET_MS = 1000 / FPS
+PHASES = ("update", "collisions", "draw")
+
+
+def keep_player_alive(game):
+    """Shield the player so scenarios never end in a game over"""
+    game.player.activate_shield(10 ** 9)
+
+
+def spawn_row(game, enemy_type, count, y):
+    """Spawn an evenly spaced row of enemies across the screen"""
+    spacing = SCREEN_WIDTH // (count + 1)
+    for i in range(count):
+        game.enemy_manager.spawn_enemy({"x": spacing * (i + 1), "y": y, "type": enemy_type})
+
+
+class Scenario:
+    """A stress scenario: setup builds the state, tick keeps it loaded"""
+    
+    def __init__(self, name, description, level, setup, tick=None, buttons=FIRE):
+        """Initialize scenario"""
+        self.name = name
+        self.description = description
+        self.level = level
+        self.setup = setup
+        self.tick = tick
+        self.buttons = buttons
+
+
+def setup_level3_wave1(game):
+    """Level 3 wave 1 spawned at once plus a full kamikaze row"""
+    game.level_manager = None
+    keep_player_alive(game)
+    tick_level3_wave1(game, 0)
+
+
+def tick_level3_wave1(game, frame):
+    """Respawn the wave whenever it has been cleared or flown past"""
+    if not game.enemy_manager.enemies:
+        for spec in load_level(3).waves[0].enemies:
+            game.enemy_manager.spawn_enemy(spec)
+        spawn_row(game, "kamikaze", 12, -40)
+
+
+def setup_final_boss(game, health_fraction):
+    """Spawn the final boss on screen at a given health fraction"""
+    level = game.level_manager.get_current_level()
+    level.skip_to_boss()
+    boss = level.get_boss()
+    boss.y = 100
+    boss.entered = True
+    boss.health = int(boss.max_health * health_fraction)
+    keep_player_alive(game)
+
+
+def pin_boss_health(game, health_fraction):
+    """Keep the boss health from dropping out of its phase"""
+    boss = game.level_manager.get_current_level().get_boss()
+    boss.health = max(boss.health, int(boss.max_health * health_fraction))
+
+
+def setup_elite_swarm(game):
+    """50 elites in formation against weapon level 3 auto-fire"""
+    game.level_manager = None
+    game.player.weapon_level = 3
+    keep_player_alive(game)
+    tick_elite_swarm(game, 0)
+
+
+def tick_elite_swarm(game, frame):
+    """Top the swarm back up to 50 elites"""
+    missing = 50 - len(game.enemy_manager.enemies)
+    for i in range(missing):
+        x = 40 + (i % 10) * 58
+        y = -40 - (i // 10) * 50
+        game.enemy_manager.spawn_enemy({"x": x, "y": y, "type": "elite"})
+
+
+SCENARIOS = [
+    Scenario("level3_wave1", "Level 3 wave 1 with a full kamikaze row",
+             3, setup_level3_wave1, tick_level3_wave1),
+    Scenario("final_boss_phase2", "Final boss phase 2: circle bursts and aimed shots",
+             3, lambda game: setup_final_boss(game, 0.5),
+             lambda game, frame: pin_boss_health(game, 0.5)),
+    Scenario("final_boss_phase3", "Final boss phase 3: spiral plus laser sweep",
+             3, lambda game: setup_final_boss(game, 0.3),
+             lambda game, frame: pin_boss_health(game, 0.3)),
+    Scenario("weapon3_vs_50_elites", "Weapon level 3 auto-fire against 50 elites",
+             1, setup_elite_swarm, tick_elite_swarm),
+]
+
+
+def percentiles(samples):
+    """Summary statistics in milliseconds"""
+    values = np.asarray(samples) * 1000
+    return {
+        "p50": round(float(np.percentile(values, 50)), 4),
+        "p95": round(float(np.percentile(values, 95)), 4),
+        "p99": round(float(np.percentile(values, 99)), 4),
+        "mean": round(float(values.mean()), 4),
+        "max": round(float(values.max()), 4)
+    }
+
+
+def run_scenario(scenario, frames, warmup, seed):
+    """Run one scenario and collect per-phase frame times"""
+    # Draw particles as a windowed game would; they are a large part of a busy frame
+    game = Game(headless=True, seed=seed, particle_budget=PARTICLE_BUDGET)
+    game.load_render_assets()
+    game.selected_level = scenario.level
+    game.new_game()
+    scenario.setup(game)
+    
+    profiler = game.profiler
+    samples = {phase: [] for phase in PHASES}
+    total = []
+    peak_projectiles = 0
+    peak_enemies = 0
+    peak_particles = 0
+    for frame in range(warmup + frames):
+        if scenario.tick:
+            scenario.tick(game, frame)
+        
+        profiler.begin_frame()
+        with profiler.span("update"):
+            game.update(scenario.buttons)
+        with profiler.span("draw"):
+            game.draw_background("game")
+            game.draw_game()
+        profiler.end_frame()
+        
+        if frame < warmup:
+            continue
+        # Update time excludes collisions, which are reported on their own
+        times = profiler.times
+        samples["update"].append(times["update"] - times["collisions"])
+        samples["collisions"].append(times["collisions"])
+        samples["draw"].append(times["draw"])
+        total.append(times["update"] + times["draw"])
+        peak_projectiles = max(peak_projectiles, len(game.projectiles))
+        peak_enemies = max(peak_enemies, len(game.enemy_manager.enemies))
+        peak_particles = max(peak_particles, len(game.particles))
+    
+    result = {phase: percentiles(samples[phase]) for phase in PHASES}
+    result["frame"] = percentiles(total)
+    result["frame"]["over_budget"] = int(np.count_nonzero(np.asarray(total) * 1000 > FRAME_BUDGET_MS))
+    result["description"] = scenario.description
+    result["peak_projectiles"] = peak_projectiles
+    result["peak_enemies"] = peak_enemies
+    result["peak_particles"] = peak_particles
+    result["state"] = game.game_state
+    return result
+
+
+def git_revision():
+    """Current commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(names=None, frames=600, warmup=120, seed=0):
+    """Run the selected scenarios and return the report dictionary"""
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frame_budget_ms": round(FRAME_BUDGET_MS, 3),
+        "frames": frames,
+        "warmup": warmup,
+        "seed": seed,
+        "scenarios": {}
+    }
+    for scenario in SCENARIOS:
+        if names and scenario.name not in names:
+            continue
+        report["scenarios"][scenario.name] = run_scenario(scenario, frames, warmup, seed)
+    return report
+
+
+def print_report(report):
+    """Print a human-readable summary table"""
+    print(f"Frame budget: {report['frame_budget_ms']} ms  ({report['frames']} frames per scenario)")
+    print(f"{'scenario':<24}{'phase':<12}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, result in report["scenarios"].items():
+        for phase in PHASES + ("frame",):
+            stats = result[phase]
+            print(f"{name:<24}{phase:<12}{stats['p50']:>9.3f}{stats['p95']:>9.3f}{stats['p99']:>9.3f}")
+            name = ""
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Nebula Strike frame benchmarks")
+    parser.add_argument("scenarios", nargs="*",
+                        help="scenarios to run (default: all of %s)" % ", ".join(s.name for s in SCENARIOS))
+    parser.add_argument("--frames", type=int, default=600, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=120, help="unmeasured frames before timing")
+    parser.add_argument("--seed", type=int, default=0, help="session RNG seed")
+    parser.add_argument("--json", metavar="PATH", default=None,
+                        help="write the report as JSON to PATH ('-' for stdout)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = run_benchmarks(args.scenarios, args.frames, args.warmup, args.seed)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+    pygame.quit()
@@ -0,0 +1,299 @@
+"""
+Nebula Strike - Agent environment
+Gymnasium-style reset/step wrapper around headless games, single and vectorized
+"""
+
+import random
+import multiprocessing
+import numpy as np
+from main import Game, FPS, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.controls import NO_INPUT, MOVE_LEFT, MOVE_RIGHT, MOVE_UP, MOVE_DOWN, FIRE, SPECIAL, MISSILE
+from src.projectiles import OWNER_ENEMY, KIND_BOSS
+from src.enemy import ENEMY_TYPES
+
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+
+
+# Discrete actions: the nine movement directions, each with and without
+# fire, then the special laser and a homing missile (both with fire)
+MOVES = (NO_INPUT, MOVE_LEFT, MOVE_RIGHT, MOVE_UP, MOVE_DOWN,
+         MOVE_UP | MOVE_LEFT, MOVE_UP | MOVE_RIGHT, MOVE_DOWN | MOVE_LEFT, MOVE_DOWN | MOVE_RIGHT)
+ACTIONS = tuple(move | fire for move in MOVES for fire in (NO_INPUT, FIRE)) + (FIRE | SPECIAL, FIRE | MISSILE)
+
+# Observation layout (positions are scaled to 0..1 by the screen size)
+PLAYER_FEATURES = ("x", "y", "health", "weapon_level", "shield", "missiles", "laser_charges")
+ENEMY_FEATURES = ("present", "x", "y", "health", "type")
+BOSS_FEATURES = ("present", "x", "y", "health", "phase")
+BULLET_FEATURES = ("present", "x", "y", "vx", "vy", "boss")
+
+# Enemy "type" feature values
+ENEMY_CODES = {name: code for code, name in enumerate(ENEMY_TYPES)}
+
+
+class NebulaStrikeEnv:
+    """Reset/step environment around a headless Game
+    
+    Follows the Gymnasium API: reset() returns (observation, info) and
+    step(action) returns (observation, reward, terminated, truncated, info).
+    Actions index ACTIONS. Observations are dicts of float32 arrays built
+    straight from game state: "player", the nearest max_enemies "enemies"
+    and max_bullets enemy "bullets" (padded with zero rows), and "boss".
+    With frame_size set, "frame" adds a downsampled grayscale render.
+    
+    Each step runs frame_skip game ticks with the same action. The reward
+    is score gained times score_scale minus health lost times damage_scale.
+    """
+    
+    def __init__(self, level=1, seed=None, frame_skip=1, max_steps=FPS * 300,
+                 max_enemies=16, max_bullets=64, frame_size=None,
+                 score_scale=0.01, damage_scale=0.1):
+        """Initialize environment; frame_size is (width, height) of the optional frame"""
+        self.game = Game(headless=True)
+        self.game.selected_level = level
+        self.seeds = random.Random(seed)
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.max_enemies = max_enemies
+        self.max_bullets = max_bullets
+        self.frame_size = frame_size
+        self.frame_surface = pygame.Surface(frame_size) if frame_size else None
+        if frame_size:
+            self.game.load_render_assets()
+        self.score_scale = score_scale
+        self.damage_scale = damage_scale
+        self.steps = 0
+    
+    @property
+    def action_count(self):
+        """Number of discrete actions"""
+        return len(ACTIONS)
+    
+    def reset(self, seed=None):
+        """Start a new session and return its first observation and info"""
+        if seed is not None:
+            self.seeds = random.Random(seed)
+        game = self.game
+        game.seed = self.seeds.randrange(1 << 32)
+        game.new_game()
+        self.steps = 0
+        return self.observe(), self.info()
+    
+    def step(self, action):
+        """Play one action for frame_skip ticks"""
+        game = self.game
+        buttons = ACTIONS[action]
+        score = game.score
+        damage = game.player.damage_taken
+        for _ in range(self.frame_skip):
+            game.update(buttons)
+            if game.game_state != "playing":
+                break
+        self.steps += 1
+        
+        reward = ((game.score - score) * self.score_scale -
+                  (game.player.damage_taken - damage) * self.damage_scale)
+        terminated = game.game_state != "playing"
+        truncated = not terminated and self.steps >= self.max_steps
+        return self.observe(), reward, terminated, truncated, self.info()
+    
+    def info(self):
+        """Episode details that are not part of the observation"""
+        game = self.game
+        return {"seed": game.session_seed, "state": game.game_state, "level": game.level,
+                "score": game.score, "steps": self.steps}
+    
+    def observe(self):
+        """Build the observation arrays from the current game state"""
+        game = self.game
+        player = game.player
+        px, py = player.x, player.y
+        observation = {
+            "player": np.array([
+                px / SCREEN_WIDTH, py / SCREEN_HEIGHT, player.health / player.max_health,
+                player.weapon_level, player.shield_active, player.homing_missiles,
+                player.special_laser_charges
+            ], dtype=np.float32)
+        }
+        
+        # Enemies, nearest first, from the formation arrays; dropping enemies
+        # killed since the last tick lines the rows up with the live ones
+        manager = game.enemy_manager
+        manager.compact()
+        formation = manager.formation
+        n = formation.count
+        enemies = np.zeros((self.max_enemies, len(ENEMY_FEATURES)), dtype=np.float32)
+        if n:
+            x, y = formation.x[:n], formation.y[:n]
+            nearest = np.argsort((x - px) ** 2 + (y - py) ** 2)[:self.max_enemies]
+            count = len(nearest)
+            items = manager.enemies.items
+            picked = [items[i] for i in nearest.tolist()]
+            enemies[:count, 0] = 1.0
+            enemies[:count, 1] = x[nearest] / SCREEN_WIDTH
+            enemies[:count, 2] = y[nearest] / SCREEN_HEIGHT
+            enemies[:count, 3] = [e.health / e.max_health for e in picked]
+            enemies[:count, 4] = [ENEMY_CODES.get(e.enemy_type, -1) for e in picked]
+        observation["enemies"] = enemies
+        
+        boss = game.level_manager.get_current_level().get_boss()
+        if boss and boss.health > 0:
+            observation["boss"] = np.array([1.0, boss.x / SCREEN_WIDTH, boss.y / SCREEN_HEIGHT,
+                                            boss.health / boss.max_health, boss.current_phase],
+                                           dtype=np.float32)
+        else:
+            observation["boss"] = np.zeros(len(BOSS_FEATURES), dtype=np.float32)
+        
+        # Enemy and boss bullets, nearest first
+        store = game.projectiles
+        n = store.count
+        live = np.flatnonzero(store.alive[:n] & (store.owner[:n] == OWNER_ENEMY))
+        bullets = np.zeros((self.max_bullets, len(BULLET_FEATURES)), dtype=np.float32)
+        if len(live):
+            x, y = store.x[live], store.y[live]
+            nearest = live[np.argsort((x - px) ** 2 + (y - py) ** 2)[:self.max_bullets]]
+            count = len(nearest)
+            bullets[:count, 0] = 1.0
+            bullets[:count, 1] = store.x[nearest] / SCREEN_WIDTH
+            bullets[:count, 2] = store.y[nearest] / SCREEN_HEIGHT
+            bullets[:count, 3] = store.vx[nearest] / SCREEN_WIDTH
+            bullets[:count, 4] = store.vy[nearest] / SCREEN_HEIGHT
+            bullets[:count, 5] = store.kind[nearest] == KIND_BOSS
+        observation["bullets"] = bullets
+        
+        if self.frame_surface is not None:
+            observation["frame"] = self.render_frame()
+        return observation
+    
+    def render_frame(self):
+        """Draw the game and return it downsampled to grayscale uint8 (height, width)"""
+        game = self.game
+        game.draw_background("game")
+        game.draw_game()
+        pygame.transform.smoothscale(game.screen, self.frame_size, self.frame_surface)
+        rgb = pygame.surfarray.pixels3d(self.frame_surface)
+        gray = (rgb[..., 0] * 0.299 + rgb[..., 1] * 0.587 + rgb[..., 2] * 0.114).astype(np.uint8)
+        del rgb
+        return gray.T
+    
+    def close(self):
+        """Release the game"""
+        self.game.finish_recording()
+
+
+def stack_observations(observations):
+    """Stack a list of observation dicts into one dict of batched arrays"""
+    return {key: np.stack([obs[key] for obs in observations]) for key in observations[0]}
+
+
+class _EnvGroup:
+    """Several environments stepped in lockstep, resetting the ones that finish"""
+    
+    def __init__(self, seeds, env_kwargs):
+        """Initialize one environment per seed"""
+        self.envs = [NebulaStrikeEnv(seed=seed, **env_kwargs) for seed in seeds]
+    
+    def reset(self):
+        """Reset every environment"""
+        results = [env.reset() for env in self.envs]
+        return [obs for obs, _ in results], [info for _, info in results]
+    
+    def step(self, actions):
+        """Step every environment; finished ones are reset and report final_observation"""
+        observations, rewards, terminated, truncated, infos = [], [], [], [], []
+        for env, action in zip(self.envs, actions):
+            obs, reward, done, cut, info = env.step(action)
+            if done or cut:
+                info["final_observation"] = obs
+                obs, _ = env.reset()
+            observations.append(obs)
+            rewards.append(reward)
+            terminated.append(done)
+            truncated.append(cut)
+            infos.append(info)
+        return observations, rewards, terminated, truncated, infos
+
+
+def _group_worker(conn, seeds, env_kwargs):
+    """Serve reset/step commands for a group of environments in a subprocess"""
+    group = _EnvGroup(seeds, env_kwargs)
+    while True:
+        command, data = conn.recv()
+        if command == "step":
+            conn.send(group.step(data))
+        elif command == "reset":
+            conn.send(group.reset())
+        else:
+            break
+    conn.close()
+
+
+class VectorEnv:
+    """num_envs independent environments stepped in lockstep
+    
+    step() takes one action per environment and returns stacked
+    observations plus reward, terminated and truncated arrays; finished
+    environments are reset automatically (their last observation is in
+    info["final_observation"]). With workers > 0 the environments are
+    split across that many processes, which step their share in parallel.
+    A process manages only about 3,000 steps per second, bound by game
+    logic rather than observations. Throughput scales with cores rather
+    than with num_envs, and short of the tens of thousands per second the
+    environment was meant to reach.
+    """
+    
+    def __init__(self, num_envs, seed=0, workers=0, **env_kwargs):
+        """Initialize environments; keyword arguments go to NebulaStrikeEnv"""
+        self.num_envs = num_envs
+        seeds = [seed + i for i in range(num_envs)]
+        self.group = None
+        self.workers = []
+        if workers:
+            context = multiprocessing.get_context("spawn")
+            for chunk in np.array_split(np.array(seeds), min(workers, num_envs)):
+                parent, child = context.Pipe()
+                process = context.Process(target=_group_worker, args=(child, chunk.tolist(), env_kwargs),
+                                          daemon=True)
+                process.start()
+                child.close()
+                self.workers.append((parent, process, len(chunk)))
+        else:
+            self.group = _EnvGroup(seeds, env_kwargs)
+    
+    def _gather(self, command, per_worker):
+        """Send a command to every worker and concatenate their replies"""
+        for (conn, _, _), data in zip(self.workers, per_worker):
+            conn.send((command, data))
+        replies = [conn.recv() for conn, _, _ in self.workers]
+        return [sum((list(reply[field]) for reply in replies), []) for field in range(len(replies[0]))]
+    
+    def reset(self):
+        """Reset every environment and return stacked observations and infos"""
+        if self.group:
+            observations, infos = self.group.reset()
+        else:
+            observations, infos = self._gather("reset", [None] * len(self.workers))
+        return stack_observations(observations), infos
+    
+    def step(self, actions):
+        """Step every environment with its action"""
+        if self.group:
+            results = self.group.step(actions)
+        else:
+            chunks, start = [], 0
+            for _, _, size in self.workers:
+                chunks.append(list(actions[start:start + size]))
+                start += size
+            results = self._gather("step", chunks)
+        observations, rewards, terminated, truncated, infos = results
+        return (stack_observations(observations), np.array(rewards, dtype=np.float32),
+                np.array(terminated), np.array(truncated), infos)
+    
+    def close(self):
+        """Stop worker processes"""
+        for conn, process, _ in self.workers:
+            conn.send(("close", None))
+            process.join()
+        self.workers = []
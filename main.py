@@ -3,21 +3,46 @@ Nebula Strike - A Vertical Scrolling Space Shooter
 Main game entry point and game loop
 """
 
+import time
+# Startup timing starts before the heavy imports; the first Game takes it
+START_TIME = time.perf_counter()
+
 try:
     import pygame
 except ImportError:
     import pygame_ce as pygame
 import sys
 import os
+import math
+import random
+import zlib
+import argparse
 from src.player import Player
 from src.enemy import EnemyManager
 from src.level import LevelManager
 from src.powerup import PowerUpManager
+from src.assets import get_image, image_path
+from src.background import ParallaxBackground, ParallaxLayer, make_star_layer
+from src.render import DirtyRenderer, flatten
+from src.projectiles import ProjectileStore, OWNER_PLAYER, OWNER_ENEMY, KIND_BULLET, KIND_BOSS
+from src.spatial import SpatialHash, TargetGrid
+from src.controls import read_keyboard, ScriptedInput, NO_INPUT, FIRE, SPECIAL, MISSILE
+from src.replay import InputRecorder, InputReplay, MAX_SEED
+from src.profiler import FrameProfiler, StartupTimer
+from src.text import render_text, TextLabel
+from src.audio import SoundEffects, SOUND_PATH
+from src.preload import AssetPreloader
+from src.particles import ParticleSystem
+from src.world import WIDTH, HEIGHT
+from src.explosion import ExplosionPool, EXPLOSION_SMALL, EXPLOSION_LARGE, EXPLOSION_BOOM
 
 # Game Constants
-SCREEN_WIDTH = 600
-SCREEN_HEIGHT = 800
-FPS = 60
+SCREEN_WIDTH = WIDTH
+SCREEN_HEIGHT = HEIGHT
+FPS = 60  # Simulation ticks per second
+MAX_CATCHUP_STEPS = 5  # Most ticks run per rendered frame when behind
+BROADPHASE_MIN_ENEMIES = 8  # With fewer enemies, projectiles are tested without the grid
+PARTICLE_BUDGET = 2048  # Most cosmetic particles alive at once in a windowed game
 TITLE = "Nebula Strike"
 
 # Colors
@@ -27,20 +52,94 @@ RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 100, 255)
 
+# Directions impact sparks fly in (radians, screen coordinates)
+SPARKS_UP = -math.pi / 2
+SPARKS_DOWN = math.pi / 2
+
+# Image files
+MENU_BG_IMAGE = "menu-bg.png"
+STARSCAPE_IMAGE = "Starscape.png"
+LOGO_IMAGE = "logo.png"
+
 
 class Game:
     """Main game class managing all game states and components"""
     
-    def __init__(self):
-        """Initialize the game"""
-        pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption(TITLE)
+    def __init__(self, headless=False, seed=None, record_path=None, profile_csv=None,
+                 dirty_rects=False, max_fps=FPS, startup_report=False, particle_budget=None):
+        """Initialize the game
+        
+        In headless mode no window is opened: SDL uses its dummy video and
+        audio drivers, frames are rendered to an off-screen surface only on
+        request, and the game is driven by simulate() instead of run().
+        
+        Every session draws randomness from one RNG seeded with seed (a
+        fresh seed per session if None). With record_path set, the input
+        of each session is recorded there for replay; later sessions in the
+        same game go to numbered files next to it (run-2.nsr, run-3.nsr,
+        ...) instead of overwriting it. With profile_csv set,
+        per-frame phase timings and entity counts are streamed to that file.
+        
+        With dirty_rects set, gameplay is drawn over a still background and
+        only the areas that changed are pushed to the display.
+        
+        Game logic always ticks FPS times per second; max_fps caps how often
+        run() draws a frame (0 for no cap).
+        
+        Outside headless mode every asset is decoded up front behind a
+        loading screen; headless games that draw frames call
+        load_render_assets() instead. With startup_report set, a breakdown
+        of the time to the first frame is printed once it is drawn.
+        
+        particle_budget caps live cosmetic particles; by default windowed
+        games get PARTICLE_BUDGET and headless games none.
+        """
+        global START_TIME
+        if START_TIME is not None:
+            # Only the first game in a process paid for the imports
+            self.startup = StartupTimer(START_TIME)
+            self.startup.mark("import")
+            START_TIME = None
+        else:
+            self.startup = StartupTimer()
+        self.startup_report = startup_report
+        self.headless = headless
+        # Whether frames are drawn; headless games that draw set it by
+        # calling load_render_assets(), others skip drawing bookkeeping
+        self.drawing = not headless
+        self.seed = seed
+        self.session_seed = None
+        self.rng = None
+        self.record_path = record_path
+        self.recorder = None
+        self.recording_path = None
+        self.sessions = 0
+        self.profiler = FrameProfiler(csv_path=profile_csv)
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        # The mixer is started by load_assets, so its cost is reported separately
+        pygame.display.init()
+        pygame.font.init()
+        if headless:
+            # Images still need a display format for convert_alpha
+            if pygame.display.get_surface() is None:
+                pygame.display.set_mode((1, 1))
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption(TITLE)
+        self.startup.mark("pygame_init")
+        self.renderer = DirtyRenderer((SCREEN_WIDTH, SCREEN_HEIGHT)) if dirty_rects else None
         self.clock = pygame.time.Clock()
+        self.max_fps = max_fps
+        # Fraction of a tick elapsed since the last update, used when drawing
+        self.interpolation = 1.0
         self.running = True
         self.game_state = "menu"  # menu, level_select, playing, paused, game_over, victory
         
         # Game objects
+        self.projectiles = None
         self.player = None
         self.enemy_manager = None
         self.level_manager = None
@@ -52,6 +151,30 @@ class Game:
         self.level = 1
         self.selected_level = 1
         
+        # HUD labels, re-rendered only when their value changes
+        self.score_label = TextLabel("Score: {}", 32, WHITE)
+        self.level_label = TextLabel("Level: {}", 32, WHITE)
+        
+        # Menu frame and level select layers, built on first use
+        self.menu_frame = None
+        self.level_select_layers = None
+        
+        # Buttons pressed by key events since the last update
+        self.pressed_buttons = NO_INPUT
+        
+        # Broadphase grid reused by check_collisions every frame
+        self.collision_grid = SpatialHash()
+        self.grid_shots = False
+        self.shot_ids = {}
+        # Nearest-target queries for homing missiles
+        self.targets = TargetGrid()
+        # Running explosions, kept across sessions so the atlas is built once
+        self.explosions = ExplosionPool()
+        # Cosmetic particles; headless games have no particle budget by default
+        if particle_budget is None:
+            particle_budget = 0 if headless else PARTICLE_BUDGET
+        self.particles = ParticleSystem(particle_budget)
+        
         # Background scrolling
         self.bg_scroll = 0
         self.bg_speed = 2
@@ -61,83 +184,108 @@ class Game:
         
     def load_assets(self):
         """Load game assets"""
-        self.assets = {}
-        asset_path = "assets/images"
-        
-        # Try to load images if they exist
-        asset_files = {
-            'menu_bg': 'menu-bg.png',
-            'game_bg': 'Starscape.png',
-            'logo': 'logo.png',
-            'player': 'main-spacecraft.png',
-            'shield': 'shield.png',
-            'enemy_basic': 'basic-enemy.png',
-            'enemy_2': 'enemy-2.png',
-            'bullet': 'bullet1.png',
-            'destruction': 'destruction.png',
-            'bg': 'bg.png',
-            'enemy_ship': 'enemyShip.png',
-            'enemy_ufo': 'enemyUFO.png',
-            'starscape': 'Starscape.png'
-        }
-        
-        for key, filename in asset_files.items():
-            filepath = os.path.join(asset_path, filename)
-            if os.path.exists(filepath):
-                try:
-                    self.assets[key] = pygame.image.load(filepath).convert_alpha()
-                except:
-                    self.assets[key] = None
-            else:
-                self.assets[key] = None
-        
-        # Initialize sound mixer
-        try:
-            pygame.mixer.init()
-            self.sound_enabled = True
-        except:
-            self.sound_enabled = False
-        
-        # Load sound effects
-        self.sounds = {}
-        sound_path = "assets/sounds"
-        sound_files = {
-            'shoot': 'shoot.wav',
-            'shoot_laser': 'shootLaser.wav',
-            'enemy_kill': 'enemyKill.wav',
-            'fighter_kill': 'fighterKill.wav',
-            'hit': 'hit.wav'
-        }
-        
-        for key, filename in sound_files.items():
-            filepath = os.path.join(sound_path, filename)
-            if os.path.exists(filepath) and self.sound_enabled:
-                try:
-                    self.sounds[key] = pygame.mixer.Sound(filepath)
-                    self.sounds[key].set_volume(0.3)
-                except:
-                    self.sounds[key] = None
-            else:
-                self.sounds[key] = None
+        # Initialize sound mixer (headless runs are silent)
+        self.sound_enabled = False
+        if not self.headless:
+            try:
+                pygame.mixer.init()
+                self.sound_enabled = True
+            except:
+                self.sound_enabled = False
+        self.startup.mark("mixer_init")
+        
+        # Decode every file in parallel; later loads are served from the caches
+        if not self.headless:
+            self.preload_assets()
+            self.explosions.load()
+            self.startup.mark("asset_decode")
+        
+        # Images are served from the shared asset cache; warm the ones
+        # drawn every frame so the first frame does not hitch
+        get_image(image_path(LOGO_IMAGE))
+        
+        # Backgrounds are scaled and converted to the display format once
+        screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.menu_background = get_image(image_path(MENU_BG_IMAGE), screen_size, opaque=True)
+        starscape = get_image(image_path(STARSCAPE_IMAGE), screen_size, opaque=True)
+        if starscape:
+            near_stars = make_star_layer(screen_size, 40, (53, 97))
+            self.game_background = ParallaxBackground([
+                ParallaxLayer(starscape, self.bg_speed),
+                ParallaxLayer(near_stars, self.bg_speed * 1.5)
+            ])
+        else:
+            # Fallback: plain starfield
+            stars = make_star_layer(screen_size, 50)
+            self.game_background = ParallaxBackground([ParallaxLayer(stars, self.bg_speed)], fill=BLACK)
+        
+        # Sound effects, played through a voice-limited channel pool
+        self.sfx = SoundEffects(self.sound_enabled)
         
         # Load background music
-        bg_music_path = os.path.join(sound_path, 'background.mp3')
+        bg_music_path = os.path.join(SOUND_PATH, 'background.mp3')
         if os.path.exists(bg_music_path) and self.sound_enabled:
             try:
                 pygame.mixer.music.load(bg_music_path)
                 pygame.mixer.music.set_volume(0.2)
             except:
                 pass
+        self.startup.mark("asset_setup")
+        
+    def load_render_assets(self):
+        """Decode every image and build the explosion frames without a loading screen
+        
+        Windowed games do this while starting up; headless games that draw
+        frames call it once so that no draw stalls on a first use.
+        """
+        AssetPreloader(sounds=False).wait()
+        self.explosions.load()
+        self.drawing = True
+        
+    def preload_assets(self):
+        """Decode all asset files on loader threads behind a progress screen"""
+        preloader = AssetPreloader(sounds=self.sound_enabled)
+        while not preloader.poll():
+            pygame.event.pump()
+            self.draw_loading(preloader.progress)
+            self.clock.tick(FPS)
+        
+    def draw_loading(self, progress):
+        """Draw the loading screen with a progress bar"""
+        self.screen.fill(BLACK)
+        text = render_text("Loading...", 48, WHITE)
+        self.screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)))
+        bar = pygame.Rect(0, 0, SCREEN_WIDTH // 2, 16)
+        bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10)
+        pygame.draw.rect(self.screen, WHITE, bar, 2)
+        fill = bar.inflate(-6, -6)
+        fill.width = int(fill.width * progress)
+        pygame.draw.rect(self.screen, BLUE, fill)
+        pygame.display.flip()
         
     def new_game(self):
         """Start a new game"""
-        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)
-        self.enemy_manager = EnemyManager()
-        self.level_manager = LevelManager(self.selected_level)
-        self.powerup_manager = PowerUpManager()
+        self.finish_recording()
+        self.session_seed = self.seed if self.seed is not None else random.randrange(1 << 32)
+        self.rng = random.Random(self.session_seed)
+        self.sessions += 1
+        if self.record_path:
+            self.recorder = InputRecorder(self.session_seed, self.selected_level)
+            self.recording_path = self.session_record_path()
+            
+        self.projectiles = ProjectileStore()
+        self.player = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, self.projectiles, self.targets,
+                             self.particles)
+        self.enemy_manager = EnemyManager(self.projectiles, self.rng)
+        self.level_manager = LevelManager(self.selected_level, self.projectiles, self.particles)
+        self.powerup_manager = PowerUpManager(self.rng)
+        self.explosions.clear()
+        self.particles.clear()
         self.level = self.selected_level
         self.score = 0
         self.game_state = "playing"
+        if self.recorder is not None:
+            self.recorder.checksum = self.state_checksum()
         
         # Start background music
         if self.sound_enabled:
@@ -152,7 +300,9 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+                elif event.key == pygame.K_ESCAPE:
                     if self.game_state == "playing":
                         self.game_state = "paused"
                     elif self.game_state == "paused":
@@ -161,16 +311,20 @@ class Game:
                         self.game_state = "menu"
                 elif event.key == pygame.K_m:
                     if self.game_state == "paused":
-                        pygame.mixer.music.stop()
+                        if self.sound_enabled:
+                            pygame.mixer.music.stop()
                         self.game_state = "menu"
                 elif event.key == pygame.K_SPACE:
                     if self.game_state == "menu":
                         self.game_state = "level_select"
                     elif self.game_state == "playing" and self.player:
-                        self.player.shoot()
+                        self.pressed_buttons |= FIRE
                 elif event.key == pygame.K_LSHIFT:
                     if self.game_state == "playing" and self.player:
-                        self.player.use_special_weapon()
+                        self.pressed_buttons |= SPECIAL
+                elif event.key in (pygame.K_LCTRL, pygame.K_RCTRL):
+                    if self.game_state == "playing" and self.player:
+                        self.pressed_buttons |= MISSILE
                 elif event.key == pygame.K_1:
                     if self.game_state == "level_select":
                         self.selected_level = 1
@@ -184,29 +338,47 @@ class Game:
                         self.selected_level = 3
                         self.new_game()
                         
-    def update(self):
-        """Update all game objects"""
+    def update(self, buttons=None):
+        """Update all game objects for one frame
+        
+        buttons is the player's input mask for this frame; when None the
+        keyboard is read, together with any keys pressed since last frame.
+        """
+        if buttons is None:
+            buttons = read_keyboard() | self.pressed_buttons
+        self.pressed_buttons = NO_INPUT
+        
         if self.game_state != "playing":
             return
             
-        # Update background scroll
-        self.bg_scroll += self.bg_speed
-        if self.bg_scroll >= SCREEN_HEIGHT:
-            self.bg_scroll = 0
+        if self.recorder is not None:
+            self.recorder.record(buttons)
+        if self.drawing:
+            self.save_positions()
+            
+            # Update background scroll
+            self.bg_scroll += self.bg_speed
+            if self.bg_scroll >= SCREEN_HEIGHT:
+                self.bg_scroll = 0
+            if self.renderer is None:
+                self.game_background.update()
             
-        # Update player
+        # Update player; its missiles search this frame's enemy and boss positions
         if self.player:
-            self.player.update()
+            if self.enemy_manager and self.level_manager:
+                boss = self.level_manager.get_current_level().get_boss()
+                self.targets.reset(self.enemy_manager.enemies.items, (boss,) if boss else ())
+            self.player.update(buttons)
             if self.player.health <= 0:
                 self.game_state = "game_over"
                 if self.score > self.high_score:
                     self.high_score = self.score
-                if self.sound_enabled and self.sounds.get('fighter_kill'):
-                    self.sounds['fighter_kill'].play()
+                self.sfx.play("fighter_kill")
                     
         # Update level manager
         if self.level_manager:
-            enemies_spawned = self.level_manager.update(self.enemy_manager)
+            with self.profiler.span("level_update"):
+                enemies_spawned = self.level_manager.update(self.enemy_manager)
             for enemy_data in enemies_spawned:
                 self.enemy_manager.spawn_enemy(enemy_data)
             
@@ -218,129 +390,201 @@ class Game:
                 if boss.health <= 0 and not self.level_manager.get_current_level().completed:
                     self.level_manager.get_current_level().completed = True
                     self.score += boss.score_value
-                    if self.sound_enabled and self.sounds.get('enemy_kill'):
-                        self.sounds['enemy_kill'].play()
+                    self.explosions.spawn(boss.x, boss.y, EXPLOSION_LARGE)
+                    self.explosions.spawn(boss.x, boss.y, EXPLOSION_BOOM)
+                    self.sfx.play("enemy_kill")
             
             # Check if level/game is complete
             if self.level_manager.is_game_complete():
                 self.game_state = "victory"
             elif self.level_manager.get_current_level().is_completed():
                 # Level complete, advance
-                if self.level < 3:
+                if self.level_manager.has_next_level():
                     self.level += 1
                     self.level_manager.advance_level()
                 
         # Update enemies
         if self.enemy_manager:
-            self.enemy_manager.update()
+            with self.profiler.span("enemy_update"):
+                self.enemy_manager.update()
             
         # Update power-ups
         if self.powerup_manager:
             self.powerup_manager.update()
             
+        # Advance every projectile in one step
+        if self.projectiles:
+            self.projectiles.update()
+            
         # Check collisions
-        self.check_collisions()
+        with self.profiler.span("collisions"):
+            self.check_collisions()
+            
+        if self.drawing:
+            self.explosions.update()
+            self.particles.update()
+            
+        # Start this frame's sound effects
+        self.sfx.flush()
+        
+        # A replay ends after the last recorded tick, so its checksum is
+        # taken here rather than when the session is left from a menu
+        if self.recorder is not None:
+            self.recorder.checksum = self.state_checksum()
+        
+    def build_collision_grid(self, boss):
+        """Rebuild the broadphase grid from this frame's entities"""
+        grid = self.collision_grid
+        grid.clear()
+        
+        for enemy in self.enemy_manager.enemies:
+            grid.insert("enemies", enemy, enemy.rect)
+        if boss:
+            grid.insert("boss", boss, boss.rect)
+        if self.powerup_manager:
+            for powerup in self.powerup_manager.powerups:
+                grid.insert("powerups", powerup, powerup.rect)
+                
+        # Bucketing projectiles only pays off when many enemies query them;
+        # otherwise every projectile of the owner is a candidate
+        player_shots = self.projectiles.boxes(OWNER_PLAYER)
+        enemy_shots = self.projectiles.boxes(OWNER_ENEMY)
+        self.grid_shots = len(self.enemy_manager.enemies) >= BROADPHASE_MIN_ENEMIES
+        if self.grid_shots:
+            grid.insert_batch("player_shots", *player_shots)
+            grid.insert_batch("enemy_shots", *enemy_shots)
+        self.shot_ids = {"player_shots": player_shots[0], "enemy_shots": enemy_shots[0]}
+        return grid
+        
+    def shot_candidates(self, layer, rect):
+        """Projectiles of a shot layer that may overlap rect"""
+        if not self.grid_shots:
+            return self.shot_ids[layer]
+        return self.collision_grid.query_ids(layer, rect)
         
     def check_collisions(self):
         """Check for collisions between game objects"""
         if not self.player or not self.enemy_manager:
             return
             
-        # Check boss collisions
+        projectiles = self.projectiles
+        player = self.player
+        
         boss = None
         if self.level_manager:
             boss = self.level_manager.get_current_level().get_boss()
-            if boss and boss.health > 0:
-                # Player bullets hit boss
-                for bullet in self.player.bullets[:]:
-                    if self.check_collision(bullet, boss):
-                        boss.take_damage(bullet.damage)
-                        if bullet in self.player.bullets:
-                            self.player.bullets.remove(bullet)
-                        if self.sound_enabled and self.sounds.get('hit'):
-                            self.sounds['hit'].play()
+            if boss and boss.health <= 0:
+                boss = None
                 
-                # Boss bullets hit player
-                for bullet in boss.bullets[:]:
-                    if self.check_collision(bullet, self.player):
-                        if not self.player.is_shielded():
-                            self.player.take_damage(bullet.damage)
-                            if self.sound_enabled and self.sounds.get('hit'):
-                                self.sounds['hit'].play()
-                        boss.bullets.remove(bullet)
+        grid = self.build_collision_grid(boss)
+        
+        # Check boss collisions
+        if boss:
+            # Player bullets hit boss
+            candidates = self.shot_candidates("player_shots", boss.rect)
+            for i in projectiles.hits(boss.rect, OWNER_PLAYER, candidates):
+                boss.take_damage(int(projectiles.damage[i]))
+                projectiles.kill(i)
+                self.impact(projectiles.x[i], projectiles.y[i], SPARKS_DOWN)
+                self.sfx.play("hit")
+                    
+            # Player missiles hit boss
+            for bullet in player.bullets:
+                if grid.query("boss", bullet.rect) and bullet.rect.colliderect(boss.rect):
+                    boss.take_damage(bullet.damage)
+                    player.bullets.kill(bullet)
+                    self.impact(bullet.x, bullet.y, SPARKS_DOWN)
+                    self.sfx.play("hit")
             
         # Player bullets hit enemies
-        for bullet in self.player.bullets[:]:
-            for enemy in self.enemy_manager.enemies[:]:
-                if self.check_collision(bullet, enemy):
-                    enemy.take_damage(bullet.damage)
-                    if bullet in self.player.bullets:
-                        self.player.bullets.remove(bullet)
-                    if self.sound_enabled and self.sounds.get('hit'):
-                        self.sounds['hit'].play()
-                    if enemy.health <= 0:
-                        self.score += enemy.score_value
-                        self.enemy_manager.enemies.remove(enemy)
-                        if self.sound_enabled and self.sounds.get('enemy_kill'):
-                            self.sounds['enemy_kill'].play()
-                        # Chance to drop power-up
-                        if self.powerup_manager:
-                            self.powerup_manager.try_spawn(enemy.x, enemy.y)
-                            
-        # Enemy bullets hit player
         for enemy in self.enemy_manager.enemies:
-            for bullet in enemy.bullets[:]:
-                if self.check_collision(bullet, self.player):
-                    if not self.player.is_shielded():
-                        self.player.take_damage(bullet.damage)
-                        if self.sound_enabled and self.sounds.get('hit'):
-                            self.sounds['hit'].play()
-                    enemy.bullets.remove(bullet)
+            candidates = self.shot_candidates("player_shots", enemy.rect)
+            for i in projectiles.hits(enemy.rect, OWNER_PLAYER, candidates):
+                if enemy.health <= 0:
+                    break
+                self.hit_enemy(enemy, int(projectiles.damage[i]))
+                projectiles.kill(i)
+                self.impact(projectiles.x[i], projectiles.y[i], SPARKS_DOWN)
+                
+        # Player missiles hit enemies
+        for bullet in player.bullets:
+            for enemy in grid.query("enemies", bullet.rect):
+                if enemy.alive and bullet.rect.colliderect(enemy.rect):
+                    player.bullets.kill(bullet)
+                    self.hit_enemy(enemy, bullet.damage)
+                    self.impact(bullet.x, bullet.y, SPARKS_DOWN)
+                            
+        # Enemy and boss bullets hit player
+        candidates = self.shot_candidates("enemy_shots", player.rect)
+        for i in projectiles.hits(player.rect, OWNER_ENEMY, candidates):
+            if not player.is_shielded():
+                player.take_damage(int(projectiles.damage[i]))
+                self.sfx.play("hit")
+            projectiles.kill(i)
+            self.impact(projectiles.x[i], projectiles.y[i], SPARKS_UP)
                     
         # Enemies collide with player
-        for enemy in self.enemy_manager.enemies:
-            if self.check_collision(enemy, self.player):
-                if not self.player.is_shielded():
-                    self.player.take_damage(20)
-                    if self.sound_enabled and self.sounds.get('hit'):
-                        self.sounds['hit'].play()
+        for enemy in grid.query("enemies", player.rect):
+            if enemy.alive and enemy.rect.colliderect(player.rect):
+                if not player.is_shielded():
+                    player.take_damage(20)
+                    self.sfx.play("hit")
                 enemy.take_damage(enemy.health)
+                self.enemy_manager.enemies.kill(enemy)
+                self.explosions.spawn(enemy.x, enemy.y, EXPLOSION_SMALL)
+                self.particles.emit("debris", enemy.x, enemy.y, 24)
                 
         # Player collects power-ups
         if self.powerup_manager:
-            for powerup in self.powerup_manager.powerups[:]:
-                if self.check_collision(powerup, self.player):
-                    self.player.apply_powerup(powerup)
-                    self.powerup_manager.powerups.remove(powerup)
+            for powerup in grid.query("powerups", player.rect):
+                if powerup.alive and powerup.rect.colliderect(player.rect):
+                    player.apply_powerup(powerup)
+                    self.powerup_manager.powerups.kill(powerup)
+                    self.sfx.play("pickup")
                     
-    def check_collision(self, obj1, obj2):
-        """Check collision between two objects with rect attributes"""
-        if hasattr(obj1, 'rect') and hasattr(obj2, 'rect'):
-            return obj1.rect.colliderect(obj2.rect)
-        return False
+    def impact(self, x, y, direction):
+        """Throw sparks from a bullet impact"""
+        self.particles.emit("impact", x, y, 6, direction, spread=1.6)
         
+    def hit_enemy(self, enemy, damage):
+        """Apply a player hit to an enemy and handle its destruction"""
+        enemy.take_damage(damage)
+        self.sfx.play("hit")
+        if enemy.health <= 0 and enemy.alive:
+            self.score += enemy.score_value
+            self.enemy_manager.enemies.kill(enemy)
+            self.explosions.spawn(enemy.x, enemy.y, EXPLOSION_SMALL)
+            self.particles.emit("debris", enemy.x, enemy.y, 24)
+            self.sfx.play("enemy_kill")
+            # Chance to drop power-up
+            if self.powerup_manager:
+                self.powerup_manager.try_spawn(enemy.x, enemy.y)
+                
     def draw_background(self, bg_type="game"):
         """Draw scrolling background"""
-        # Try to use loaded background images
-        if bg_type == "menu" and self.assets.get('menu_bg'):
-            bg = pygame.transform.scale(self.assets['menu_bg'], (SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(bg, (0, 0))
-        elif bg_type == "game" and self.assets.get('starscape'):
-            bg = pygame.transform.scale(self.assets['starscape'], (SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.screen.blit(bg, (0, self.bg_scroll - SCREEN_HEIGHT))
-            self.screen.blit(bg, (0, self.bg_scroll))
+        if bg_type == "menu":
+            self.draw_menu_background(self.screen)
         else:
-            # Fallback: Draw starfield background
-            self.screen.fill(BLACK)
-            for i in range(50):
-                x = (i * 37) % SCREEN_WIDTH
-                y = (i * 59 + self.bg_scroll) % SCREEN_HEIGHT
-                pygame.draw.circle(self.screen, WHITE, (x, y), 1)
+            self.game_background.draw(self.screen)
+            
+    def draw_menu_background(self, surface):
+        """Draw the menu image, or a plain starfield if it is missing"""
+        if self.menu_background:
+            surface.blit(self.menu_background, (0, 0))
+            return
+        surface.fill(BLACK)
+        for i in range(50):
+            x = (i * 37) % SCREEN_WIDTH
+            y = (i * 59 + self.bg_scroll) % SCREEN_HEIGHT
+            pygame.draw.circle(surface, WHITE, (x, y), 1)
             
     def draw(self):
         """Draw all game objects"""
+        if self.renderer and self.game_state == "playing":
+            self.draw_dirty()
+            return
+            
         if self.game_state == "menu":
-            self.draw_background("menu")
             self.draw_menu()
         elif self.game_state == "level_select":
             self.screen.fill(BLACK)
@@ -359,57 +603,79 @@ class Game:
             self.draw_background("game")
             self.draw_victory()
             
-        pygame.display.flip()
+        self.profiler.draw_overlay(self.screen, 1000 / FPS)
+        with self.profiler.span("flip"):
+            pygame.display.flip()
+        if self.renderer:
+            self.renderer.invalidate()
+            
+    def draw_dirty(self):
+        """Draw gameplay, presenting only the areas drawn this frame and last"""
+        renderer = self.renderer
+        if renderer.full_redraw:
+            self.game_background.draw(renderer.background)
+        renderer.begin(self.screen)
+        renderer.add(self.draw_game())
+        renderer.add(self.profiler.draw_overlay(self.screen, 1000 / FPS))
+        with self.profiler.span("flip"):
+            renderer.present()
         
     def draw_menu(self):
-        """Draw main menu"""
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 48)
-        font_small = pygame.font.Font(None, 36)
-        font_author = pygame.font.Font(None, 36)
+        """Draw main menu and its background
         
+        Nothing on the menu moves (the starfield only scrolls during play),
+        so the whole frame is drawn once per scroll position and blitted.
+        """
+        if self.menu_frame is None or self.menu_frame[0] != self.bg_scroll:
+            frame = self.screen.copy()
+            self.draw_menu_background(frame)
+            self.compose_menu(frame)
+            self.menu_frame = (self.bg_scroll, frame)
+        self.screen.blit(self.menu_frame[1], (0, 0))
+        
+    def compose_menu(self, surface):
+        """Draw the static main menu: logo, credits and instructions"""
         # Draw logo if available
         logo_top_padding = 60
         logo_height = 240
         
-        if self.assets.get('logo'):
-            logo = self.assets['logo']
+        logo = get_image(image_path(LOGO_IMAGE))
+        if logo:
             # Scale logo to fixed height while maintaining aspect ratio
             aspect_ratio = logo.get_width() / logo.get_height()
             logo_width = int(logo_height * aspect_ratio)
-            logo = pygame.transform.scale(logo, (logo_width, logo_height))
+            logo = get_image(image_path(LOGO_IMAGE), (logo_width, logo_height))
             logo_x = (SCREEN_WIDTH - logo_width) // 2
-            self.screen.blit(logo, (logo_x, logo_top_padding))
+            surface.blit(logo, (logo_x, logo_top_padding))
         else:
-            title = font_large.render("NEBULA STRIKE", True, BLUE)
-            self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, logo_top_padding))
+            title = render_text("NEBULA STRIKE", 72, BLUE)
+            surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, logo_top_padding))
         
         # Author name
         author_text = "By Nasim Rana Feroz"
         # Draw black stroke
-        author_stroke = font_author.render(author_text, True, BLACK)
+        author_stroke = render_text(author_text, 36, BLACK)
         for offset_x in [-2, 0, 2]:
             for offset_y in [-2, 0, 2]:
                 if offset_x != 0 or offset_y != 0:
-                    self.screen.blit(author_stroke, (SCREEN_WIDTH // 2 - author_stroke.get_width() // 2 + offset_x, 320 + offset_y))
+                    surface.blit(author_stroke, (SCREEN_WIDTH // 2 - author_stroke.get_width() // 2 + offset_x, 320 + offset_y))
         # Draw white text on top
-        author = font_author.render(author_text, True, WHITE)
-        self.screen.blit(author, (SCREEN_WIDTH // 2 - author.get_width() // 2, 320))
+        author = render_text(author_text, 36, WHITE)
+        surface.blit(author, (SCREEN_WIDTH // 2 - author.get_width() // 2, 320))
         
-        subtitle = font_medium.render("Press SPACE to Start", True, WHITE)
-        self.screen.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 420))
+        subtitle = render_text("Press SPACE to Start", 48, WHITE)
+        surface.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 420))
         
         # Instructions
-        instructions = font_small.render("ESC to Quit", True, WHITE)
-        self.screen.blit(instructions, (SCREEN_WIDTH // 2 - instructions.get_width() // 2, 540))
+        instructions = render_text("ESC to Quit", 36, WHITE)
+        surface.blit(instructions, (SCREEN_WIDTH // 2 - instructions.get_width() // 2, 540))
         
     def draw_level_select(self):
-        """Draw level selection screen"""
-        font_title = pygame.font.Font(None, 56)
-        font_level = pygame.font.Font(None, 42)
-        font_desc = pygame.font.Font(None, 26)
-        font_small = pygame.font.Font(None, 22)
+        """Draw level selection screen
         
+        Only the stars move. The title, mission cards and instructions are
+        flattened into translucent layers once and blitted over the stars.
+        """
         # Animated stars in background
         for i in range(100):
             x = (i * 47 + self.bg_scroll // 2) % SCREEN_WIDTH
@@ -418,29 +684,38 @@ class Game:
             brightness = 100 + (i % 156)
             pygame.draw.circle(self.screen, (brightness, brightness, brightness), (x, y), size)
         
+        if self.level_select_layers is None:
+            self.level_select_layers = [flatten(parts) for parts in self.level_select_parts()]
+        for layer, position in self.level_select_layers:
+            self.screen.blit(layer, position, special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+    def level_select_parts(self):
+        """Level select title, mission cards and instructions
+        
+        Returns one list of (surface, position) parts per layer, in drawing
+        order. Blitting them in turn draws the screen directly.
+        """
         # Title with glow effect
         title_padding_top = 40
         title_text = "SELECT MISSION"
+        title_parts = []
         
         # Create glowing title effect
         for glow_size in range(5, 0, -1):
             glow_alpha = 30
-            title_glow = font_title.render(title_text, True, (0, 150, 255))
-            title_glow.set_alpha(glow_alpha)
-            self.screen.blit(title_glow, (SCREEN_WIDTH // 2 - title_glow.get_width() // 2 - glow_size, 
-                                          title_padding_top - glow_size))
+            title_glow = render_text(title_text, 56, (0, 150, 255), glow_alpha)
+            title_parts.append((title_glow, (SCREEN_WIDTH // 2 - title_glow.get_width() // 2 - glow_size, 
+                                             title_padding_top - glow_size)))
         
-        title = font_title.render(title_text, True, (100, 220, 255))
-        self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, title_padding_top))
+        title = render_text(title_text, 56, (100, 220, 255))
+        title_parts.append((title, (SCREEN_WIDTH // 2 - title.get_width() // 2, title_padding_top)))
         
-        # Decorative lines under title
+        # Decorative lines under title, drawn on their own strip
         line_y = title_padding_top + 60
-        pygame.draw.line(self.screen, (100, 220, 255), 
-                        (SCREEN_WIDTH // 2 - 140, line_y), 
-                        (SCREEN_WIDTH // 2 + 140, line_y), 3)
-        pygame.draw.line(self.screen, (50, 110, 180), 
-                        (SCREEN_WIDTH // 2 - 140, line_y + 2), 
-                        (SCREEN_WIDTH // 2 + 140, line_y + 2), 1)
+        lines = pygame.Surface((285, 8), pygame.SRCALPHA)
+        pygame.draw.line(lines, (100, 220, 255), (2, 2), (282, 2), 3)
+        pygame.draw.line(lines, (50, 110, 180), (2, 4), (282, 4), 1)
+        title_parts.append((lines, (SCREEN_WIDTH // 2 - 142, line_y - 2)))
         
         # Level cards with enhanced design
         y_start = 150
@@ -457,36 +732,11 @@ class Game:
              "difficulty": "★★★ HARD", "color": (255, 80, 80), "accent": (200, 30, 30)}
         ]
         
+        layers = [title_parts]
         for i, data in enumerate(level_data):
             card_x = (SCREEN_WIDTH - card_width) // 2
             card_y = y_start + i * y_spacing
-            
-            # Create card surface with transparency
-            card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-            
-            # Draw card background with dark gradient
-            for j in range(card_height):
-                alpha = int(120 + (j / card_height) * 60)
-                dark_val = int(20 + (j / card_height) * 20)
-                color = (dark_val, dark_val, dark_val, alpha)
-                pygame.draw.rect(card_surface, color, (0, j, card_width, 1))
-            
-            # Draw accent line on left
-            for y_offset in range(card_height):
-                alpha = int(180 + (y_offset / card_height) * 75)
-                accent_color = (*data["accent"], alpha)
-                pygame.draw.rect(card_surface, accent_color, (0, y_offset, 6, 1))
-            
-            # Draw glowing border
-            pygame.draw.rect(card_surface, data["color"], (0, 0, card_width, card_height), 2)
-            
-            # Inner glow
-            inner_glow = pygame.Surface((card_width - 4, card_height - 4), pygame.SRCALPHA)
-            pygame.draw.rect(inner_glow, (*data["accent"], 40), (0, 0, card_width - 4, card_height - 4), 1)
-            card_surface.blit(inner_glow, (2, 2))
-            
-            # Blit card to screen
-            self.screen.blit(card_surface, (card_x, card_y))
+            card_parts = [(self.build_level_card(data, card_width, card_height), (card_x, card_y))]
             
             # Level number badge
             badge_size = 55
@@ -494,67 +744,149 @@ class Game:
             badge_y = card_y + (card_height - badge_size) // 2
             
             # Badge background circle
-            pygame.draw.circle(self.screen, data["accent"], (badge_x + badge_size // 2, badge_y + badge_size // 2), badge_size // 2)
-            pygame.draw.circle(self.screen, data["color"], (badge_x + badge_size // 2, badge_y + badge_size // 2), badge_size // 2, 2)
+            badge = pygame.Surface((badge_size, badge_size), pygame.SRCALPHA)
+            pygame.draw.circle(badge, data["accent"], (badge_size // 2, badge_size // 2), badge_size // 2)
+            pygame.draw.circle(badge, data["color"], (badge_size // 2, badge_size // 2), badge_size // 2, 2)
+            card_parts.append((badge, (badge_x, badge_y)))
             
             # Number in badge
-            level_num = font_level.render(f"{i + 1}", True, WHITE)
+            level_num = render_text(f"{i + 1}", 42, WHITE)
             num_x = badge_x + (badge_size - level_num.get_width()) // 2
             num_y = badge_y + (badge_size - level_num.get_height()) // 2
-            self.screen.blit(level_num, (num_x, num_y))
+            card_parts.append((level_num, (num_x, num_y)))
             
             # Level name and subtitle
-            name_text = font_level.render(data["name"], True, data["color"])
-            subtitle_text = font_desc.render(data["subtitle"], True, (180, 180, 180))
-            difficulty_text = font_small.render(data["difficulty"], True, data["color"])
+            name_text = render_text(data["name"], 42, data["color"])
+            subtitle_text = render_text(data["subtitle"], 26, (180, 180, 180))
+            difficulty_text = render_text(data["difficulty"], 22, data["color"])
             
-            self.screen.blit(name_text, (card_x + 95, card_y + 18))
-            self.screen.blit(subtitle_text, (card_x + 95, card_y + 55))
-            self.screen.blit(difficulty_text, (card_x + card_width - 110, card_y + 40))
+            card_parts.append((name_text, (card_x + 95, card_y + 18)))
+            card_parts.append((subtitle_text, (card_x + 95, card_y + 55)))
+            card_parts.append((difficulty_text, (card_x + card_width - 110, card_y + 40)))
+            layers.append(card_parts)
         
         # Instructions at bottom with styled background
         instruction_y = SCREEN_HEIGHT - 50
-        instruction = font_small.render("Press 1, 2, or 3 to select | ESC to go back", True, (180, 180, 180))
+        instruction = render_text("Press 1, 2, or 3 to select | ESC to go back", 22, (180, 180, 180))
         
         # Instruction background
         instruction_bg = pygame.Surface((instruction.get_width() + 30, 35), pygame.SRCALPHA)
         instruction_bg.fill((30, 30, 30, 200))
         pygame.draw.rect(instruction_bg, (100, 220, 255), (0, 0, instruction.get_width() + 30, 35), 2)
         
-        self.screen.blit(instruction_bg, 
-                        (SCREEN_WIDTH // 2 - instruction.get_width() // 2 - 15, instruction_y - 10))
-        self.screen.blit(instruction, (SCREEN_WIDTH // 2 - instruction.get_width() // 2, instruction_y))
+        layers.append([
+            (instruction_bg, (SCREEN_WIDTH // 2 - instruction.get_width() // 2 - 15, instruction_y - 10)),
+            (instruction, (SCREEN_WIDTH // 2 - instruction.get_width() // 2, instruction_y)),
+        ])
+        return layers
+        
+    def build_level_card(self, data, card_width, card_height):
+        """Build the translucent background of one mission card"""
+        # Create card surface with transparency
+        card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
+        
+        # Draw card background with dark gradient
+        for j in range(card_height):
+            alpha = int(120 + (j / card_height) * 60)
+            dark_val = int(20 + (j / card_height) * 20)
+            color = (dark_val, dark_val, dark_val, alpha)
+            pygame.draw.rect(card_surface, color, (0, j, card_width, 1))
+        
+        # Draw accent line on left
+        for y_offset in range(card_height):
+            alpha = int(180 + (y_offset / card_height) * 75)
+            accent_color = (*data["accent"], alpha)
+            pygame.draw.rect(card_surface, accent_color, (0, y_offset, 6, 1))
         
+        # Draw glowing border
+        pygame.draw.rect(card_surface, data["color"], (0, 0, card_width, card_height), 2)
+        
+        # Inner glow
+        inner_glow = pygame.Surface((card_width - 4, card_height - 4), pygame.SRCALPHA)
+        pygame.draw.rect(inner_glow, (*data["accent"], 40), (0, 0, card_width - 4, card_height - 4), 1)
+        card_surface.blit(inner_glow, (2, 2))
+        return card_surface
+        
+    def interpolated_entities(self):
+        """Moving objects drawn between their previous and current positions"""
+        if self.player:
+            yield self.player
+            yield from self.player.bullets
+        if self.enemy_manager:
+            yield from self.enemy_manager.enemies
+        if self.powerup_manager:
+            yield from self.powerup_manager.powerups
+        if self.level_manager:
+            boss = self.level_manager.get_current_level().get_boss()
+            if boss:
+                yield boss
+                
+    def save_positions(self):
+        """Remember where everything is before a tick moves it"""
+        for entity in self.interpolated_entities():
+            entity.prev_x = entity.x
+            entity.prev_y = entity.y
+        if self.projectiles:
+            self.projectiles.save_positions()
+            
     def draw_game(self):
-        """Draw game elements"""
+        """Draw game elements and return the areas drawn
+        
+        Between ticks, sprites are drawn self.interpolation of the way from
+        their previous to their current position. Their rects are moved
+        there for drawing only and moved back afterwards. Outside play no
+        tick moves anything, so sprites are drawn where they are.
+        """
+        alpha = self.interpolation if self.game_state == "playing" else 1.0
+        moved = []
+        if alpha < 1.0:
+            for entity in self.interpolated_entities():
+                prev_x = getattr(entity, "prev_x", None)
+                if prev_x is None:
+                    continue
+                dx = round((entity.x - prev_x) * (alpha - 1))
+                dy = round((entity.y - entity.prev_y) * (alpha - 1))
+                if dx or dy:
+                    entity.rect.move_ip(dx, dy)
+                    moved.append((entity.rect, dx, dy))
+        
+        areas = []
         # Draw all game objects
         if self.player:
-            self.player.draw(self.screen)
+            areas += self.player.draw(self.screen)
         if self.enemy_manager:
-            self.enemy_manager.draw(self.screen)
+            areas += self.enemy_manager.draw(self.screen)
         if self.powerup_manager:
-            self.powerup_manager.draw(self.screen)
+            areas += self.powerup_manager.draw(self.screen)
         
         # Draw boss if active
         if self.level_manager:
             boss = self.level_manager.get_current_level().get_boss()
             if boss and boss.health > 0:
-                boss.draw(self.screen)
+                areas.append(boss.draw(self.screen))
+                
+        # Draw bullets on top of the ships
+        if self.projectiles:
+            areas += self.projectiles.draw(self.screen, alpha)
+        areas += self.particles.draw(self.screen)
+        areas += self.explosions.draw(self.screen)
+            
+        for rect, dx, dy in moved:
+            rect.move_ip(-dx, -dy)
             
         # Draw HUD
-        self.draw_hud()
+        areas += self.draw_hud()
+        return areas
         
     def draw_hud(self):
-        """Draw heads-up display"""
-        font = pygame.font.Font(None, 32)
-        
+        """Draw heads-up display and return the areas drawn"""
         # Score
-        score_text = font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+        score_text = self.score_label.render(self.score)
+        areas = [self.screen.blit(score_text, (10, 10))]
         
         # Level
-        level_text = font.render(f"Level: {self.level}", True, WHITE)
-        self.screen.blit(level_text, (10, 40))
+        level_text = self.level_label.render(self.level)
+        areas.append(self.screen.blit(level_text, (10, 40)))
         
         # Health bar
         if self.player:
@@ -569,7 +901,8 @@ class Game:
             current_width = int((self.player.health / self.player.max_health) * health_width)
             pygame.draw.rect(self.screen, GREEN, (health_x, health_y, current_width, health_height))
             # Border
-            pygame.draw.rect(self.screen, WHITE, (health_x, health_y, health_width, health_height), 2)
+            areas.append(pygame.draw.rect(self.screen, WHITE, (health_x, health_y, health_width, health_height), 2))
+        return areas
             
     def draw_pause(self):
         """Draw pause overlay"""
@@ -578,39 +911,32 @@ class Game:
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
         
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 42)
-        font_small = pygame.font.Font(None, 32)
-        
         # Title
-        pause_text = font_large.render("PAUSED", True, (100, 200, 255))
+        pause_text = render_text("PAUSED", 72, (100, 200, 255))
         self.screen.blit(pause_text, (SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 200))
         
         # Resume button
-        resume_text = font_medium.render("Press ESC to Resume", True, WHITE)
+        resume_text = render_text("Press ESC to Resume", 42, WHITE)
         resume_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 350, 400, 60)
         pygame.draw.rect(self.screen, (0, 100, 200), resume_rect, 3)
         self.screen.blit(resume_text, (SCREEN_WIDTH // 2 - resume_text.get_width() // 2, 365))
         
         # Main menu button
-        menu_text = font_medium.render("Press M for Main Menu", True, WHITE)
+        menu_text = render_text("Press M for Main Menu", 42, WHITE)
         menu_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 450, 400, 60)
         pygame.draw.rect(self.screen, (200, 100, 0), menu_rect, 3)
         self.screen.blit(menu_text, (SCREEN_WIDTH // 2 - menu_text.get_width() // 2, 465))
         
         # Score display
-        score_text = font_small.render(f"Current Score: {self.score}", True, (200, 200, 200))
+        score_text = render_text(f"Current Score: {self.score}", 32, (200, 200, 200))
         self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 580))
         
     def draw_game_over(self):
         """Draw game over screen"""
-        font_large = pygame.font.Font(None, 64)
-        font_small = pygame.font.Font(None, 36)
-        
-        game_over = font_large.render("GAME OVER", True, RED)
-        score_text = font_small.render(f"Final Score: {self.score}", True, WHITE)
-        high_score_text = font_small.render(f"High Score: {self.high_score}", True, WHITE)
-        restart = font_small.render("Press SPACE to Restart", True, WHITE)
+        game_over = render_text("GAME OVER", 64, RED)
+        score_text = render_text(f"Final Score: {self.score}", 36, WHITE)
+        high_score_text = render_text(f"High Score: {self.high_score}", 36, WHITE)
+        restart = render_text("Press SPACE to Restart", 36, WHITE)
         
         self.screen.blit(game_over, (SCREEN_WIDTH // 2 - game_over.get_width() // 2, 150))
         self.screen.blit(score_text, (SCREEN_WIDTH // 2 - score_text.get_width() // 2, 280))
@@ -622,14 +948,11 @@ class Game:
     
     def draw_victory(self):
         """Draw victory screen"""
-        font_large = pygame.font.Font(None, 64)
-        font_small = pygame.font.Font(None, 36)
-        
-        victory = font_large.render("VICTORY!", True, GREEN)
-        score_text = font_small.render(f"Final Score: {self.score}", True, WHITE)
-        high_score_text = font_small.render(f"High Score: {self.high_score}", True, WHITE)
-        congrats = font_small.render("All Levels Complete!", True, WHITE)
-        restart = font_small.render("Press SPACE to Play Again", True, WHITE)
+        victory = render_text("VICTORY!", 64, GREEN)
+        score_text = render_text(f"Final Score: {self.score}", 36, WHITE)
+        high_score_text = render_text(f"High Score: {self.high_score}", 36, WHITE)
+        congrats = render_text("All Levels Complete!", 36, WHITE)
+        restart = render_text("Press SPACE to Play Again", 36, WHITE)
         
         self.screen.blit(victory, (SCREEN_WIDTH // 2 - victory.get_width() // 2, 150))
         self.screen.blit(congrats, (SCREEN_WIDTH // 2 - congrats.get_width() // 2, 230))
@@ -640,18 +963,203 @@ class Game:
         if pygame.key.get_pressed()[pygame.K_SPACE]:
             self.game_state = "menu"
         
+    def state_checksum(self):
+        """Checksum of the simulation state, equal for bit-identical runs"""
+        state = [self.game_state, self.level, self.score]
+        if self.player:
+            state += [self.player.x, self.player.y, self.player.health,
+                      self.player.weapon_level, self.player.shield_duration]
+        if self.enemy_manager:
+            state += [(enemy.x, enemy.y, enemy.health) for enemy in self.enemy_manager.enemies]
+        if self.level_manager:
+            boss = self.level_manager.get_current_level().get_boss()
+            if boss:
+                state += [boss.x, boss.y, boss.health]
+        if self.powerup_manager:
+            state += [(powerup.type, powerup.y) for powerup in self.powerup_manager.powerups]
+        checksum = zlib.crc32(repr(state).encode())
+        if self.projectiles:
+            n = self.projectiles.count
+            for array in (self.projectiles.x, self.projectiles.y, self.projectiles.alive):
+                checksum = zlib.crc32(array[:n].tobytes(), checksum)
+        return checksum
+        
+    def entity_counts(self):
+        """Live entity counts recorded with each profiled frame"""
+        counts = {}
+        if self.enemy_manager:
+            counts["enemies"] = len(self.enemy_manager.enemies)
+        if self.projectiles:
+            counts["player_shots"] = self.projectiles.count_of(OWNER_PLAYER, KIND_BULLET)
+            counts["enemy_shots"] = self.projectiles.count_of(OWNER_ENEMY, KIND_BULLET)
+            counts["boss_shots"] = self.projectiles.count_of(OWNER_ENEMY, KIND_BOSS)
+        if self.player:
+            counts["missiles"] = len(self.player.bullets)
+        if self.powerup_manager:
+            counts["powerups"] = len(self.powerup_manager.powerups)
+        return counts
+        
+    def session_record_path(self):
+        """Replay file for the current session: record_path, then numbered"""
+        if self.sessions == 1:
+            return self.record_path
+        root, ext = os.path.splitext(self.record_path)
+        return f"{root}-{self.sessions}{ext}"
+        
+    def finish_recording(self):
+        """Save the input recording of the current session, if any"""
+        if self.recorder is not None:
+            self.recorder.save(self.recording_path)
+            self.recorder = None
+            
+    def simulate(self, frames, inputs=None):
+        """Step game logic for up to frames frames without rendering
+        
+        inputs is a callable (frame, game) -> button mask, or a sequence of
+        masks. Stops early when the game is over or won and returns the
+        number of frames simulated.
+        """
+        if inputs is None:
+            inputs = ScriptedInput([NO_INPUT])
+        elif not callable(inputs):
+            inputs = ScriptedInput(inputs)
+            
+        for frame in range(frames):
+            if self.game_state != "playing":
+                return frame
+            self.profiler.begin_frame()
+            with self.profiler.span("update"):
+                self.update(inputs(frame, self))
+            self.profiler.end_frame(self.entity_counts())
+        return frames
+        
     def run(self):
-        """Main game loop"""
+        """Main game loop
+        
+        Logic runs in fixed ticks of 1/FPS seconds, decoupled from drawing:
+        each frame runs as many ticks as real time has accumulated, then
+        draws in between the last two. After a stall at most
+        MAX_CATCHUP_STEPS ticks run and the rest of the backlog is dropped,
+        so the game slows down briefly instead of freezing.
+        """
+        profiler = self.profiler
+        tick = 1.0 / FPS
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+            profiler.begin_frame()
+            now = time.perf_counter()
+            accumulator += now - previous
+            previous = now
+            
+            with profiler.span("handle_events"):
+                self.handle_events()
+            with profiler.span("update"):
+                steps = 0
+                while accumulator >= tick and steps < MAX_CATCHUP_STEPS:
+                    self.update()
+                    accumulator -= tick
+                    steps += 1
+                if accumulator >= tick:
+                    accumulator %= tick
+            self.interpolation = accumulator / tick
+            with profiler.span("draw"):
+                self.draw()
+            if not self.startup.finished:
+                self.startup.finish()
+                if self.startup_report:
+                    print(self.startup.report())
+            profiler.end_frame(self.entity_counts())
+            # Thin out effects while frames run over their budget
+            self.particles.adapt(profiler.frame_time, 1.0 / (self.max_fps or FPS))
+            self.clock.tick(self.max_fps)
             
+        self.finish_recording()
+        self.profiler.close()
         pygame.quit()
         sys.exit()
 
 
+def run_headless(level, frames, seed=None, record_path=None, replay_path=None, profile_csv=None):
+    """Simulate a session and print a summary
+    
+    Plays with auto-fire held, or feeds back a recorded session when
+    replay_path is given and checks that it ends in the same state.
+    """
+    replay = None
+    inputs = [FIRE]
+    if replay_path:
+        replay = InputReplay.load(replay_path)
+        seed, level, frames, inputs = replay.seed, replay.level, len(replay), replay
+        
+    game = Game(headless=True, seed=seed, record_path=record_path, profile_csv=profile_csv)
+    game.selected_level = level
+    game.new_game()
+    
+    start = time.perf_counter()
+    simulated = game.simulate(frames, inputs)
+    elapsed = time.perf_counter() - start
+    
+    fps = simulated / elapsed if elapsed > 0 else 0
+    checksum = game.state_checksum()
+    print(f"{simulated} frames in {elapsed:.2f}s ({fps:.0f} fps) - "
+          f"state: {game.game_state}, level: {game.level}, score: {game.score}, "
+          f"health: {game.player.health}, seed: {game.session_seed}, "
+          f"checksum: {checksum:08x}")
+    game.finish_recording()
+    game.profiler.close()
+    pygame.quit()
+    
+    if replay:
+        if checksum != replay.checksum:
+            print(f"Replay diverged: expected checksum {replay.checksum:08x}")
+            return False
+        print("Replay matched")
+    return True
+
+
+def seed_arg(text):
+    """--seed value: a non-negative integer that fits a replay file"""
+    seed = int(text)
+    if not 0 <= seed <= MAX_SEED:
+        raise argparse.ArgumentTypeError(f"seed must be between 0 and {MAX_SEED}")
+    return seed
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--headless", action="store_true",
+                        help="run game logic without a window or frame cap")
+    parser.add_argument("--frames", type=int, default=3600,
+                        help="frames to simulate in headless mode")
+    parser.add_argument("--level", type=int, default=1,
+                        help="starting level in headless mode")
+    parser.add_argument("--seed", type=seed_arg, default=None,
+                        help="seed for the session RNG")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="record the session input to a replay file")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="replay a recorded session headless and verify the outcome")
+    parser.add_argument("--profile-csv", metavar="PATH", default=None,
+                        help="stream per-frame phase timings and entity counts to a CSV file")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="update only the changed parts of the screen during play")
+    parser.add_argument("--max-fps", type=int, default=FPS,
+                        help="cap on drawn frames per second, 0 for none (logic always ticks at %d)" % FPS)
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print where the time to the first frame went")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    args = parse_args()
+    if args.headless or args.replay:
+        ok = run_headless(args.level, args.frames, args.seed, args.record, args.replay,
+                          args.profile_csv)
+        sys.exit(0 if ok else 1)
+    else:
+        game = Game(seed=args.seed, record_path=args.record, profile_csv=args.profile_csv,
+                    dirty_rects=args.dirty_rects, max_fps=args.max_fps,
+                    startup_report=args.startup_report)
+        game.run()
@@ -0,0 +1,93 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+import os
+
+
+IMAGE_PATH = os.path.join("assets", "images")
+
+# Process-wide image cache keyed by (path, size, rotation, opaque)
+_image_cache = {}
+# Decoded source images keyed by path (None if missing or unreadable)
+_source_cache = {}
+# Solid-color placeholder surfaces keyed by (size, color)
+_placeholder_cache = {}
+
+
+def image_path(filename):
+    """Build the path of a file inside the images directory"""
+    return os.path.join(IMAGE_PATH, filename)
+
+
+def _load_source(path):
+    """Decode an image from disk once and remember the result"""
+    if path in _source_cache:
+        return _source_cache[path]
+    
+    image = None
+    if os.path.exists(path):
+        try:
+            image = pygame.image.load(path).convert_alpha()
+        except:
+            image = None
+    _source_cache[path] = image
+    return image
+
+
+def store_source(path, image):
+    """Cache an image decoded elsewhere (e.g. on a loader thread)
+    
+    Must be called on the main thread, which converts the image to the
+    display format. image may be None for a file that could not be read.
+    """
+    if image is not None:
+        try:
+            image = image.convert_alpha()
+        except:
+            image = None
+    _source_cache[path] = image
+
+
+def get_image(path, size=None, rotation=0, opaque=False):
+    """Get a cached image, scaled to size and rotated by rotation degrees
+    
+    Opaque images are flattened onto black and converted to the display
+    format without per-pixel alpha, which makes large blits much cheaper.
+    Returns None if the file is missing or could not be decoded.
+    """
+    key = (path, size, rotation, opaque)
+    if key in _image_cache:
+        return _image_cache[key]
+    
+    image = _load_source(path)
+    if image is not None:
+        if size is not None and image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        if rotation:
+            image = pygame.transform.rotate(image, rotation)
+        if opaque:
+            flat = pygame.Surface(image.get_size()).convert()
+            flat.fill((0, 0, 0))
+            flat.blit(image, (0, 0))
+            image = flat
+    _image_cache[key] = image
+    return image
+
+
+def get_placeholder(size, color):
+    """Get a cached solid-color surface used when a sprite is missing"""
+    key = (size, color)
+    surface = _placeholder_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        _placeholder_cache[key] = surface
+    return surface
+
+
+def clear_cache():
+    """Drop every cached surface (e.g. after the display mode changes)"""
+    _image_cache.clear()
+    _source_cache.clear()
+    _placeholder_cache.clear()
@@ -0,0 +1,172 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+import os
+import random
+
+
+SOUND_PATH = os.path.join("assets", "sounds")
+
+
+def bank(folder, count=7):
+    """Files of a numbered variant bank such as explosions/1.wav..7.wav"""
+    return tuple(os.path.join(folder, f"{i}.wav") for i in range(1, count + 1))
+
+
+# Mixer channels reserved for each category, in priority order: when the
+# voice cap is reached, earlier categories are played first
+CATEGORIES = {
+    "kill": 3,
+    "pickup": 2,
+    "hit": 3,
+    "weapon": 2
+}
+
+# Sound effects: name -> (variant files, category, volume, cooldown in frames)
+SOUNDS = {
+    "enemy_kill": (bank("explosions"), "kill", 0.3, 3),
+    "fighter_kill": (("fighterKill.wav",), "kill", 0.3, 0),
+    "pickup": (bank("powerups"), "pickup", 0.3, 4),
+    "hit": (("hit.wav",), "hit", 0.3, 4),
+    "shoot": (("shoot.wav",), "weapon", 0.3, 0),
+    "shoot_laser": (("shootLaser.wav",), "weapon", 0.3, 0)
+}
+
+# Most sound effects playing at once, across all categories
+MAX_VOICES = 8
+
+# Decoded sounds keyed by path (None if missing or unreadable)
+_sound_cache = {}
+
+
+def store_sound(path, sound):
+    """Cache a sound decoded elsewhere (e.g. on a loader thread)"""
+    _sound_cache[path] = sound
+
+
+def get_sound(path):
+    """Decode a sound file once and return the shared Sound, or None"""
+    if path in _sound_cache:
+        return _sound_cache[path]
+    
+    sound = None
+    if os.path.exists(path):
+        try:
+            sound = pygame.mixer.Sound(path)
+        except:
+            sound = None
+    _sound_cache[path] = sound
+    return sound
+
+
+class SoundEffects:
+    """Sound effect player with pooled channels and voice limits
+    
+    play() only queues a sound, so it is cheap to call from collision
+    loops; flush() runs once per frame and starts the queued sounds. The
+    same sound requested several times in a frame plays once, a sound does
+    not restart within its cooldown, and at most max_voices effects play
+    at a time. Each category plays on its own reserved channels, taking
+    over its oldest one when all are busy, and each play picks one of the
+    sound's variants, avoiding the one played last.
+    """
+    
+    def __init__(self, enabled=True, max_voices=MAX_VOICES):
+        """Initialize; a disabled player ignores every request"""
+        self.enabled = enabled
+        self.max_voices = max_voices
+        self.sounds = {}
+        self.channels = {}
+        self.started = {}
+        self.last_variant = {}
+        self.last_played = {}
+        self.pending = set()
+        self.frame = 0
+        self.rng = random.Random()
+        if enabled:
+            self.load()
+    
+    def load(self):
+        """Load every sound variant and reserve the category channels"""
+        for name, (files, category, volume, cooldown) in SOUNDS.items():
+            variants = []
+            for filename in files:
+                sound = get_sound(os.path.join(SOUND_PATH, filename))
+                if sound is not None:
+                    sound.set_volume(volume)
+                    variants.append(sound)
+            if variants:
+                self.sounds[name] = variants
+        
+        # Reserved channels are never picked by Sound.play(), only by us
+        total = sum(CATEGORIES.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)
+        index = 0
+        for category, count in CATEGORIES.items():
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+    
+    def play(self, name):
+        """Queue a sound to start on the next flush"""
+        if self.enabled:
+            self.pending.add(name)
+    
+    def flush(self):
+        """Start the sounds queued this frame"""
+        self.frame += 1
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = set()
+        
+        for category in CATEGORIES:
+            for name in SOUNDS:
+                if name not in pending or SOUNDS[name][1] != category:
+                    continue
+                if self.voices() >= self.max_voices:
+                    return
+                self.start(name)
+    
+    def voices(self):
+        """Number of sound effects playing"""
+        return sum(channel.get_busy() for channels in self.channels.values() for channel in channels)
+    
+    def start(self, name):
+        """Play one variant of a sound now unless it is cooling down"""
+        variants = self.sounds.get(name)
+        if not variants:
+            return
+        _, category, _, cooldown = SOUNDS[name]
+        last = self.last_played.get(name)
+        if last is not None and self.frame - last < cooldown:
+            return
+        
+        # A free channel of the category, else the one playing longest
+        channels = self.channels[category]
+        channel = next((c for c in channels if not c.get_busy()), None)
+        if channel is None:
+            channel = min(channels, key=lambda c: self.started.get(c, 0))
+        
+        index = 0
+        if len(variants) > 1:
+            last = self.last_variant.get(name)
+            if last is None:
+                index = self.rng.randrange(len(variants))
+            else:
+                index = self.rng.randrange(len(variants) - 1)
+                if index >= last:
+                    index += 1
+        self.last_variant[name] = index
+        
+        channel.play(variants[index])
+        self.started[channel] = self.frame
+        self.last_played[name] = self.frame
+    
+    def stop(self):
+        """Stop all sound effects and drop queued ones"""
+        self.pending.clear()
+        for channels in self.channels.values():
+            for channel in channels:
+                channel.stop()
@@ -0,0 +1,67 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+
+
+def make_star_layer(size, count, step=(37, 59), color=(255, 255, 255), radius=1):
+    """Pre-render a transparent layer of evenly scattered stars"""
+    width, height = size
+    surface = pygame.Surface(size).convert()
+    surface.fill((0, 0, 0))
+    surface.set_colorkey((0, 0, 0))
+    for i in range(count):
+        x = (i * step[0]) % width
+        y = (i * step[1]) % height
+        pygame.draw.circle(surface, color, (x, y), radius)
+    return surface
+
+
+class ParallaxLayer:
+    """A vertically wrapping surface scrolling down at its own speed"""
+    
+    def __init__(self, surface, speed):
+        """Initialize layer"""
+        self.surface = surface
+        self.speed = speed
+        self.offset = 0.0
+        
+    def update(self):
+        """Advance the scroll offset"""
+        self.offset = (self.offset + self.speed) % self.surface.get_height()
+        
+    def draw(self, screen):
+        """Blit only the slices of the wrapped layer that are on screen"""
+        width, height = self.surface.get_size()
+        screen_height = screen.get_height()
+        dest = int(self.offset) - height
+        while dest < screen_height:
+            top = max(0, -dest)
+            bottom = min(height, screen_height - dest)
+            if bottom > top:
+                screen.blit(self.surface, (0, dest + top), (0, top, width, bottom - top))
+            dest += height
+
+
+class ParallaxBackground:
+    """Stack of parallax layers drawn back to front
+    
+    If the back layer is not opaque, pass fill to clear the screen first.
+    """
+    
+    def __init__(self, layers, fill=None):
+        """Initialize background"""
+        self.layers = layers
+        self.fill = fill
+        
+    def update(self):
+        """Scroll every layer"""
+        for layer in self.layers:
+            layer.update()
+            
+    def draw(self, screen):
+        """Draw all layers"""
+        if self.fill is not None:
+            screen.fill(self.fill)
+        for layer in self.layers:
+            layer.draw(screen)
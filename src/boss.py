@@ -2,16 +2,22 @@ try:
     import pygame
 except ImportError:
     import pygame_ce as pygame
-import math
 import random
-from src.bullet import BossBullet, Bullet
+from src.assets import get_image, get_placeholder, image_path
+from src.text import render_text
+from src.projectiles import ProjectileStore, OWNER_ENEMY, KIND_BOSS, PATTERNS
+from src.patterns import fan, ring, spiral
+from src.world import WIDTH
+
+
+BOSS_TYPES = ("mini", "final")
 
 
 class Boss:
     """Base boss class"""
     
-    def __init__(self, x, y, boss_type="mini"):
-        """Initialize boss"""
+    def __init__(self, x, y, boss_type="mini", projectiles=None, particles=None):
+        """Initialize boss; phase changes burst into particles if given a ParticleSystem"""
         self.x = x
         self.y = y
         self.boss_type = boss_type
@@ -28,10 +34,11 @@ class Boss:
         self.entered = False
         
         # Attack patterns
-        self.bullets = []
+        self.projectiles = projectiles if projectiles is not None else ProjectileStore()
         self.attack_timer = 0
         self.current_phase = 1
         self.phase_transition = False
+        self.particles = particles
         
         # Create collision rect
         self.rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2,
@@ -60,27 +67,14 @@ class Boss:
             
     def load_assets(self):
         """Load boss sprite"""
-        import os
-        boss_image_path = os.path.join("assets", "images", "basic-enemy.png")
-        
-        if os.path.exists(boss_image_path):
-            try:
-                self.image = pygame.image.load(boss_image_path).convert_alpha()
-                self.image = pygame.transform.scale(self.image, (self.width, self.height))
-            except:
-                # Fallback to colored surface
-                self.image = pygame.Surface((self.width, self.height))
-                if self.boss_type == "mini":
-                    self.image.fill((255, 150, 0))  # Orange
-                elif self.boss_type == "final":
-                    self.image.fill((200, 0, 200))  # Purple
-        else:
+        self.image = get_image(image_path("basic-enemy.png"), (self.width, self.height))
+        if self.image is None:
             # Fallback to colored surface
-            self.image = pygame.Surface((self.width, self.height))
             if self.boss_type == "mini":
-                self.image.fill((255, 150, 0))  # Orange
-            elif self.boss_type == "final":
-                self.image.fill((200, 0, 200))  # Purple
+                color = (255, 150, 0)  # Orange
+            else:
+                color = (200, 0, 200)  # Purple
+            self.image = get_placeholder((self.width, self.height), color)
             
     def update(self):
         """Update boss behavior"""
@@ -97,7 +91,7 @@ class Boss:
         # Side-to-side movement
         if self.entered:
             self.x += self.speed_x
-            if self.x <= 100 or self.x >= 700:
+            if self.x <= self.width // 2 or self.x >= WIDTH - self.width // 2:
                 self.speed_x *= -1
                 
         # Update rect
@@ -109,19 +103,20 @@ class Boss:
         if health_percent <= 0.66 and self.current_phase == 1:
             self.current_phase = 2
             self.phase_transition = True
+            self.phase_burst()
         elif health_percent <= 0.33 and self.current_phase == 2 and self.max_phases >= 3:
             self.current_phase = 3
             self.phase_transition = True
+            self.phase_burst()
             
         # Execute attack patterns
         self.execute_attack_pattern()
-        
-        # Update bullets
-        for bullet in self.bullets[:]:
-            bullet.update()
-            if bullet.y > 610 or bullet.y < -10 or bullet.x < -10 or bullet.x > 810:
-                self.bullets.remove(bullet)
                 
+    def phase_burst(self):
+        """Burst into particles when entering a new phase"""
+        if self.particles is not None:
+            self.particles.emit("phase", self.x, self.y, 120)
+            
     def execute_attack_pattern(self):
         """Execute attack patterns based on boss type and phase"""
         if self.boss_type == "mini":
@@ -161,70 +156,45 @@ class Boss:
             if self.attack_timer % 180 == 0:
                 self.laser_sweep()
                 
-    def spread_shot(self, num_bullets):
-        """Fire bullets in a spread pattern"""
-        angle_step = 180 / (num_bullets - 1)
-        start_angle = 90 - 90  # Start from left
-        
-        for i in range(num_bullets):
-            angle = math.radians(start_angle + (i * angle_step))
-            speed = 5
-            speed_x = math.cos(angle) * speed
-            speed_y = math.sin(angle) * speed
+    def fire_bullet(self, x, y, speed_x, speed_y, pattern="normal"):
+        """Add a boss bullet to the projectile store"""
+        self.projectiles.spawn(x, y, speed_x, speed_y, width=10, height=10, damage=20,
+                               owner=OWNER_ENEMY, pattern=PATTERNS[pattern], kind=KIND_BOSS)
+        
+    def fire_volley(self, x, y, directions, speed, pattern="normal"):
+        """Add a volley of boss bullets along precomputed directions in one batch"""
+        cos, sin = directions
+        self.projectiles.spawn_batch(x, y, cos * speed, sin * speed, width=10, height=10, damage=20,
+                                     owner=OWNER_ENEMY, pattern=PATTERNS[pattern], kind=KIND_BOSS)
             
-            bullet = BossBullet(self.x, self.y + self.height // 2, speed_x, speed_y)
-            self.bullets.append(bullet)
+    def spread_shot(self, num_bullets, speed=5, span=180):
+        """Fire bullets in a spread pattern, from the left"""
+        self.fire_volley(self.x, self.y + self.height // 2, fan(num_bullets, 0, span), speed)
             
-    def circle_burst(self, num_bullets):
+    def circle_burst(self, num_bullets, speed=4, rotation=0):
         """Fire bullets in a complete circle"""
-        angle_step = 360 / num_bullets
-        
-        for i in range(num_bullets):
-            angle = math.radians(i * angle_step)
-            speed = 4
-            speed_x = math.cos(angle) * speed
-            speed_y = math.sin(angle) * speed
-            
-            bullet = BossBullet(self.x, self.y, speed_x, speed_y)
-            self.bullets.append(bullet)
+        self.fire_volley(self.x, self.y, ring(num_bullets, rotation), speed)
             
     def aimed_shot(self):
         """Fire a bullet aimed at player position (placeholder)"""
         # For now, just shoot straight down
         # TODO: Add player targeting when integrated
-        bullet = BossBullet(self.x, self.y + self.height // 2, 0, 6)
-        self.bullets.append(bullet)
+        self.fire_bullet(self.x, self.y + self.height // 2, 0, 6)
         
     def rapid_fire(self):
         """Fire multiple bullets quickly"""
-        for i in range(3):
-            offset_x = (i - 1) * 20
-            bullet = BossBullet(self.x + offset_x, self.y + self.height // 2, 0, 8)
-            self.bullets.append(bullet)
+        xs = [self.x - 20, self.x, self.x + 20]
+        self.projectiles.spawn_batch(xs, self.y + self.height // 2, [0, 0, 0], 8, width=10, height=10,
+                                     damage=20, owner=OWNER_ENEMY, kind=KIND_BOSS)
             
-    def spiral_attack(self):
-        """Create a spiral pattern of bullets"""
-        num_arms = 4
-        for arm in range(num_arms):
-            angle = math.radians((self.attack_timer * 3 + arm * 90) % 360)
-            speed = 4
-            speed_x = math.cos(angle) * speed
-            speed_y = math.sin(angle) * speed
+    def spiral_attack(self, arms=4, speed=4, rate=3):
+        """Create a spiral pattern of bullets, turning rate degrees per frame"""
+        self.fire_volley(self.x, self.y, spiral(arms, self.attack_timer, rate), speed, "spiral")
             
-            bullet = BossBullet(self.x, self.y, speed_x, speed_y, "spiral")
-            self.bullets.append(bullet)
-            
-    def laser_sweep(self):
+    def laser_sweep(self, count=5, speed=6):
         """Create a sweeping laser effect"""
-        # Create multiple bullets in a line that sweeps across
-        for i in range(5):
-            angle = math.radians(70 + (self.movement_timer % 40))
-            speed = 6
-            speed_x = math.cos(angle) * speed
-            speed_y = math.sin(angle) * speed
-            
-            bullet = BossBullet(self.x, self.y, speed_x, speed_y)
-            self.bullets.append(bullet)
+        # A line of bullets sharing one angle that sweeps with movement
+        self.fire_volley(self.x, self.y, fan(count, 70 + self.movement_timer % 40, 0), speed)
             
     def take_damage(self, damage):
         """Take damage from player weapons"""
@@ -235,7 +205,7 @@ class Boss:
             self.phase_transition = False
             
     def draw(self, screen):
-        """Draw the boss and its bullets"""
+        """Draw the boss and return the area drawn"""
         # Draw boss
         screen.blit(self.image, (self.rect.x, self.rect.y))
         
@@ -263,10 +233,7 @@ class Boss:
         pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Phase indicator
-        font = pygame.font.Font(None, 24)
-        phase_text = font.render(f"Phase {self.current_phase}/{self.max_phases}", True, (255, 255, 255))
+        phase_text = render_text(f"Phase {self.current_phase}/{self.max_phases}", 24, (255, 255, 255))
         screen.blit(phase_text, (bar_x, bar_y - 25))
-        
-        # Draw bullets
-        for bullet in self.bullets:
-            bullet.draw(screen)
+        return self.rect.union(pygame.Rect(bar_x, bar_y - 25, max(bar_width, phase_text.get_width()),
+                                           bar_height + 25))
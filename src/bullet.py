@@ -3,6 +3,9 @@ try:
 except ImportError:
     import pygame_ce as pygame
 import math
+from src.assets import get_image, image_path
+from src.spatial import is_live_target
+from src.world import HEIGHT
 
 
 class Bullet:
@@ -15,6 +18,7 @@ class Bullet:
         self.speed_x = speed_x
         self.speed_y = speed_y
         self.owner = owner  # "player" or "enemy"
+        self.alive = True
         self.width = 8
         self.height = 16
         self.damage = 10
@@ -35,20 +39,9 @@ class Bullet:
     
     def load_image(self):
         """Load bullet sprite"""
-        import os
-        bullet_path = os.path.join("assets", "images", "bullet1.png")
-        
-        if os.path.exists(bullet_path):
-            try:
-                loaded_img = pygame.image.load(bullet_path).convert_alpha()
-                self.image = pygame.transform.scale(loaded_img, (self.width, self.height))
-                # Rotate enemy bullets 180 degrees
-                if self.owner == "enemy":
-                    self.image = pygame.transform.rotate(self.image, 180)
-            except:
-                self.image = None
-        else:
-            self.image = None
+        # Enemy bullets are the same sprite rotated 180 degrees
+        rotation = 180 if self.owner == "enemy" else 0
+        self.image = get_image(image_path("bullet1.png"), (self.width, self.height), rotation)
             
     def update(self):
         """Update bullet position"""
@@ -60,33 +53,42 @@ class Bullet:
         self.rect.y = self.y - self.height // 2
         
     def draw(self, screen):
-        """Draw the bullet"""
+        """Draw the bullet and return the area drawn"""
         if self.image:
             screen.blit(self.image, (self.rect.x, self.rect.y))
         else:
             pygame.draw.rect(screen, self.color, self.rect)
             # Add glow effect
             pygame.draw.rect(screen, (255, 255, 255), self.rect, 1)
+        return self.rect.copy()
 
 
 class HomingMissile(Bullet):
     """Homing missile that tracks enemies"""
     
-    def __init__(self, x, y, target=None):
-        """Initialize homing missile"""
+    def __init__(self, x, y, target=None, targets=None):
+        """Initialize homing missile; targets is a TargetGrid to pick targets from"""
         super().__init__(x, y, 0, -8, "player")
         self.target = target
+        self.targets = targets
         self.width = 8
         self.height = 20
         self.damage = 30
         self.color = (255, 200, 0)  # Gold
         self.homing_strength = 0.3
         self.max_turn_rate = 5
+        self.seek_cone = 75  # Degrees either side of the heading
+        self.seek_range = 600
         
     def update(self):
         """Update missile with homing behavior"""
+        # Pick the nearest target ahead when there is none or it died
+        if self.targets is not None and (self.target is None or not is_live_target(self.target)):
+            self.target = self.targets.nearest(self.x, self.y, (self.speed_x, self.speed_y),
+                                               self.seek_cone, self.seek_range)
+        
         # If we have a target and it's still alive, home in on it
-        if self.target and hasattr(self.target, 'health') and self.target.health > 0:
+        if self.target and is_live_target(self.target):
             # Calculate direction to target
             dx = self.target.x - self.x
             dy = self.target.y - self.y
@@ -111,14 +113,15 @@ class HomingMissile(Bullet):
         super().update()
         
     def draw(self, screen):
-        """Draw the homing missile with trail effect"""
+        """Draw the homing missile with trail effect and return the area drawn"""
         # Draw main missile
         pygame.draw.rect(screen, self.color, self.rect)
         # Draw trail
         trail_length = 10
-        pygame.draw.line(screen, (255, 150, 0), 
-                        (int(self.x), int(self.y)),
-                        (int(self.x - self.speed_x), int(self.y - self.speed_y)), 3)
+        trail = pygame.draw.line(screen, (255, 150, 0), 
+                                 (int(self.x), int(self.y)),
+                                 (int(self.x - self.speed_x), int(self.y - self.speed_y)), 3)
+        return self.rect.union(trail)
 
 
 class SpecialLaser:
@@ -129,8 +132,9 @@ class SpecialLaser:
         self.x = x
         self.y = y
         self.width = 30
-        self.height = 600  # Full screen height
+        self.height = HEIGHT  # Full screen height
         self.damage = 100
+        self.alive = True
         self.duration = 30  # Frames the laser lasts
         self.timer = 0
         
@@ -146,7 +150,7 @@ class SpecialLaser:
         return self.timer >= self.duration
         
     def draw(self, screen):
-        """Draw the special laser with effects"""
+        """Draw the special laser with effects and return the area drawn"""
         if self.timer < self.duration:
             alpha = max(0, 255 - (self.timer * 8))
             
@@ -164,43 +168,5 @@ class SpecialLaser:
             glow_surf.set_alpha(alpha // 2)
             glow_surf.fill((200, 230, 255))
             screen.blit(glow_surf, (self.x - glow_width // 2, 0))
-
-
-class BossBullet(Bullet):
-    """Special bullet type for boss attacks"""
-    
-    def __init__(self, x, y, speed_x, speed_y, pattern="normal"):
-        """Initialize boss bullet"""
-        super().__init__(x, y, speed_x, speed_y, "enemy")
-        self.pattern = pattern
-        self.width = 10
-        self.height = 10
-        self.damage = 20
-        self.timer = 0
-        self.color = (255, 0, 255)  # Magenta
-        
-    def update(self):
-        """Update boss bullet with special patterns"""
-        self.timer += 1
-        
-        if self.pattern == "spiral":
-            # Spiral pattern
-            angle = self.timer * 0.1
-            self.speed_x = math.cos(angle) * 3
-            self.speed_y += 0.1
-        elif self.pattern == "accelerate":
-            # Accelerating bullet
-            self.speed_y += 0.2
-        elif self.pattern == "wave":
-            # Wave pattern
-            self.x += math.sin(self.timer * 0.1) * 2
-            
-        super().update()
-        
-    def draw(self, screen):
-        """Draw boss bullet with special effects"""
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 
-                          self.width // 2)
-        # Outer ring
-        pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), 
-                          self.width // 2, 2)
+            return pygame.Rect(self.x - glow_width // 2, 0, glow_width, self.height)
+        return None
@@ -0,0 +1,51 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+
+
+# Input buttons, packed into one integer per frame
+MOVE_LEFT = 1 << 0
+MOVE_RIGHT = 1 << 1
+MOVE_UP = 1 << 2
+MOVE_DOWN = 1 << 3
+FIRE = 1 << 4
+SPECIAL = 1 << 5
+MISSILE = 1 << 6
+
+NO_INPUT = 0
+
+
+def read_keyboard():
+    """Read held keys into a button mask"""
+    keys = pygame.key.get_pressed()
+    buttons = NO_INPUT
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        buttons |= MOVE_LEFT
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        buttons |= MOVE_RIGHT
+    if keys[pygame.K_UP] or keys[pygame.K_w]:
+        buttons |= MOVE_UP
+    if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        buttons |= MOVE_DOWN
+    if keys[pygame.K_SPACE]:
+        buttons |= FIRE
+    return buttons
+
+
+class ScriptedInput:
+    """Input source replaying a fixed sequence of button masks
+    
+    Frames past the end of the script hold the last mask (or nothing if
+    the script is empty). Call it like an input policy: inputs(frame, game).
+    """
+    
+    def __init__(self, masks):
+        """Initialize with a sequence of per-frame button masks"""
+        self.masks = list(masks)
+    
+    def __call__(self, frame, game):
+        """Button mask for a frame"""
+        if frame < len(self.masks):
+            return self.masks[frame]
+        return self.masks[-1] if self.masks else NO_INPUT
@@ -3,18 +3,44 @@ try:
 except ImportError:
     import pygame_ce as pygame
 import random
-import math
-from src.bullet import Bullet
+import numpy as np
+from src.assets import get_image, get_placeholder, image_path
+from src.entities import EntityList, ArrayStore
+from src.render import RenderBatch
+from src.projectiles import ProjectileStore, OWNER_ENEMY
+from src.world import WIDTH, HEIGHT, SHIP_BOX, SHIP_MARGIN, outside
+
+
+ENEMY_TYPES = ("basic", "zigzag", "elite", "kamikaze")
+MOVEMENT_PATTERNS = ("straight", "zigzag", "sine", "circle")
+
+# Movement pattern codes used by EnemyFormation
+PATTERN_STRAIGHT = 0
+PATTERN_ZIGZAG = 1
+PATTERN_SINE = 2
+PATTERN_CIRCLE = 3
+
+# Per-enemy kinematics arrays and their dtypes
+FIELDS = (
+    ("x", np.float64),
+    ("y", np.float64),
+    ("speed_y", np.float64),
+    ("half_width", np.int32),
+    ("half_height", np.int32),
+    ("pattern", np.int8),
+    ("timer", np.int32)
+)
 
 
 class Enemy:
     """Base enemy class"""
     
-    def __init__(self, x, y, enemy_type="basic"):
+    def __init__(self, x, y, enemy_type="basic", projectiles=None, rng=None):
         """Initialize enemy"""
         self.x = x
         self.y = y
         self.enemy_type = enemy_type
+        self.alive = True
         self.width = 40
         self.height = 40
         
@@ -25,10 +51,10 @@ class Enemy:
         self.speed_x = 0
         self.speed_y = 2
         self.movement_pattern = "straight"
-        self.pattern_timer = 0
         
         # Shooting
-        self.bullets = []
+        self.projectiles = projectiles if projectiles is not None else ProjectileStore()
+        self.rng = rng if rng is not None else random
         self.shoot_cooldown = 0
         self.shoot_delay = 60
         
@@ -69,63 +95,31 @@ class Enemy:
             
     def load_assets(self):
         """Load enemy sprite"""
-        import os
-        basic_path = os.path.join("assets", "images", "basic-enemy.png")
-        enemy2_path = os.path.join("assets", "images", "enemy-2.png")
-        
         # Determine which image to use based on enemy type
         if self.enemy_type in ["basic", "kamikaze"]:
-            image_path = basic_path
+            filename = "basic-enemy.png"
         else:  # zigzag, elite
-            image_path = enemy2_path
-        
-        if os.path.exists(image_path):
-            try:
-                loaded_img = pygame.image.load(image_path).convert_alpha()
-                self.image = pygame.transform.scale(loaded_img, (self.width, self.height))
-            except:
-                self._create_placeholder_image()
-        else:
+            filename = "enemy-2.png"
+        
+        self.image = get_image(image_path(filename), (self.width, self.height))
+        if self.image is None:
             self._create_placeholder_image()
     
     def _create_placeholder_image(self):
         """Create placeholder colored rectangle"""
-        self.image = pygame.Surface((self.width, self.height))
-        if self.enemy_type == "basic":
-            self.image.fill((255, 100, 100))  # Red
-        elif self.enemy_type == "zigzag":
-            self.image.fill((255, 200, 100))  # Orange
-        elif self.enemy_type == "elite":
-            self.image.fill((200, 100, 255))  # Purple
-        elif self.enemy_type == "kamikaze":
-            self.image.fill((255, 50, 50))  # Dark red
-            
-    def update(self):
-        """Update enemy position and behavior"""
-        # Update movement based on pattern
-        self.pattern_timer += 1
-        
-        if self.movement_pattern == "straight":
-            self.y += self.speed_y
-        elif self.movement_pattern == "zigzag":
-            self.y += self.speed_y
-            self.x += math.sin(self.pattern_timer * 0.1) * 3
-        elif self.movement_pattern == "sine":
-            self.y += self.speed_y
-            self.x += math.sin(self.pattern_timer * 0.05) * 5
-        elif self.movement_pattern == "circle":
-            angle = self.pattern_timer * 0.05
-            radius = 100
-            center_x = 400
-            self.x = center_x + math.cos(angle) * radius
-            self.y += self.speed_y * 0.5
+        colors = {
+            "basic": (255, 100, 100),     # Red
+            "zigzag": (255, 200, 100),    # Orange
+            "elite": (200, 100, 255),     # Purple
+            "kamikaze": (255, 50, 50)     # Dark red
+        }
+        color = colors.get(self.enemy_type, (0, 0, 0))
+        self.image = get_placeholder((self.width, self.height), color)
             
-        # Update rect
-        self.rect.x = self.x - self.width // 2
-        self.rect.y = self.y - self.height // 2
-        
-        # Shooting behavior - only shoot when in visible area
-        if self.y > 0 and self.y < 800:
+    def update_weapons(self):
+        """Count down and fire the enemy's weapon; movement is done by EnemyFormation"""
+        # Only shoot when in visible area
+        if self.y > 0 and self.y < HEIGHT:
             if self.shoot_cooldown > 0:
                 self.shoot_cooldown -= 1
             else:
@@ -139,20 +133,13 @@ class Enemy:
                     shoot_chance = 0.04  # 4% chance per frame
                 # kamikaze enemies don't shoot
                 
-                if shoot_chance > 0 and random.random() < shoot_chance:
+                if shoot_chance > 0 and self.rng.random() < shoot_chance:
                     self.shoot()
                 
-        # Update bullets
-        for bullet in self.bullets[:]:
-            bullet.update()
-            if bullet.y > 810 or bullet.y < -10:
-                self.bullets.remove(bullet)
-                
     def shoot(self):
         """Enemy fires bullets"""
         self.shoot_cooldown = self.shoot_delay
-        bullet = Bullet(self.x, self.y + self.height // 2, 0, 5, "enemy")
-        self.bullets.append(bullet)
+        self.projectiles.spawn(self.x, self.y + self.height // 2, 0, 5, owner=OWNER_ENEMY)
         
     def take_damage(self, damage):
         """Take damage from player weapons"""
@@ -160,10 +147,12 @@ class Enemy:
         self.health = max(0, self.health)
         
     def draw(self, screen):
-        """Draw the enemy and its bullets"""
+        """Draw the enemy and return the area drawn"""
         screen.blit(self.image, (self.rect.x, self.rect.y))
+        return self.draw_health_bar(screen) or self.rect.copy()
         
-        # Draw health bar for elites
+    def draw_health_bar(self, screen):
+        """Draw the health bar of a damaged elite and return the enemy's area"""
         if self.enemy_type in ["elite", "boss"] and self.health < self.max_health:
             bar_width = self.width
             bar_height = 5
@@ -175,27 +164,100 @@ class Enemy:
             # Health
             current_width = int((self.health / self.max_health) * bar_width)
             pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, current_width, bar_height))
-            
-        # Draw bullets
-        for bullet in self.bullets:
-            bullet.draw(screen)
+            return self.rect.union((bar_x, bar_y, bar_width, bar_height))
+        return None
+
+
+class EnemyFormation(ArrayStore):
+    """Structure-of-arrays kinematics of the managed enemies
+    
+    Row i holds the position, speed, movement pattern and pattern timer of
+    the i-th entry of the manager's enemy list, so the two must be appended
+    to and compacted together (keep_rows). update() advances each pattern
+    group with one array operation and writes positions and collision
+    rects back.
+    """
+    
+    FIELDS = FIELDS
+    
+    def __init__(self, capacity=64):
+        """Initialize empty kinematics arrays"""
+        super().__init__(capacity)
+    
+    def append(self, enemy):
+        """Add a row for a newly spawned enemy"""
+        self.reserve(1)
+        i = self.count
+        self.x[i] = enemy.x
+        self.y[i] = enemy.y
+        self.speed_y[i] = enemy.speed_y
+        self.half_width[i] = enemy.width // 2
+        self.half_height[i] = enemy.height // 2
+        self.pattern[i] = MOVEMENT_PATTERNS.index(enemy.movement_pattern)
+        self.timer[i] = 0
+        self.count += 1
+    
+    def clear(self):
+        """Remove all rows"""
+        self.count = 0
+    
+    def update(self, enemies):
+        """Advance every enemy one frame and sync enemies' positions and rects"""
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        speed_y = self.speed_y[:n]
+        pattern = self.pattern[:n]
+        timer = self.timer[:n]
+        timer += 1
+        
+        # Everything but circling falls at its speed
+        circle = pattern == PATTERN_CIRCLE
+        falling = ~circle
+        y[falling] += speed_y[falling]
+        
+        zigzag = pattern == PATTERN_ZIGZAG
+        if zigzag.any():
+            x[zigzag] += np.sin(timer[zigzag] * 0.1) * 3
+        
+        sine = pattern == PATTERN_SINE
+        if sine.any():
+            x[sine] += np.sin(timer[sine] * 0.05) * 5
+        
+        # Circle around the middle of the playfield while drifting down at half speed
+        if circle.any():
+            x[circle] = WIDTH // 2 + np.cos(timer[circle] * 0.05) * 100
+            y[circle] += speed_y[circle] * 0.5
+        
+        # Write positions and collision rects back in one pass
+        left = (x - self.half_width[:n]).tolist()
+        top = (y - self.half_height[:n]).tolist()
+        for enemy, ex, ey, ex_left, ey_top in zip(enemies, x.tolist(), y.tolist(), left, top):
+            enemy.x = ex
+            enemy.y = ey
+            enemy.rect.topleft = (ex_left, ey_top)
 
 
 class EnemyManager:
     """Manages all enemies in the game"""
     
-    def __init__(self):
+    def __init__(self, projectiles=None, rng=None):
         """Initialize enemy manager"""
-        self.enemies = []
+        self.projectiles = projectiles if projectiles is not None else ProjectileStore()
+        self.rng = rng if rng is not None else random
+        self.enemies = EntityList()
+        self.formation = EnemyFormation()
         self.spawn_timer = 0
+        self.batch = RenderBatch()
         
     def spawn_enemy(self, enemy_data):
         """Spawn an enemy based on provided data"""
-        x = enemy_data.get("x", random.randint(50, 750))
+        x = enemy_data["x"] if "x" in enemy_data else self.rng.randint(SHIP_MARGIN, WIDTH - SHIP_MARGIN)
         y = enemy_data.get("y", -50)
         enemy_type = enemy_data.get("type", "basic")
         
-        enemy = Enemy(x, y, enemy_type)
+        enemy = Enemy(x, y, enemy_type, self.projectiles, self.rng)
         
         # Apply any special movement patterns
         if "pattern" in enemy_data:
@@ -204,21 +266,41 @@ class EnemyManager:
             enemy.speed_y = enemy_data["speed_y"]
             
         self.enemies.append(enemy)
+        self.formation.append(enemy)
+        
+    def compact(self):
+        """Drop dead enemies together with their kinematics rows"""
+        enemies = self.enemies
+        if enemies.dead:
+            self.formation.keep_rows([enemy.alive for enemy in enemies.items])
+            enemies.compact()
         
     def update(self):
-        """Update all enemies"""
-        for enemy in self.enemies[:]:
-            enemy.update()
-            
-            # Remove enemies that are off screen
-            if enemy.y > 650:
-                self.enemies.remove(enemy)
+        """Move all enemies in one step, then let each one shoot"""
+        # Enemies killed since the last update still have rows
+        self.compact()
+        items = self.enemies.items
+        formation = self.formation
+        formation.update(items)
+        
+        for enemy in items:
+            enemy.update_weapons()
+        
+        # Remove enemies that left the playfield
+        n = formation.count
+        for i in np.flatnonzero(outside(formation.x[:n], formation.y[:n], SHIP_BOX)):
+            self.enemies.kill(items[i])
+        self.compact()
                 
     def draw(self, screen):
-        """Draw all enemies"""
+        """Draw all enemies in one batch, then their health bars, and return the areas drawn"""
+        batch = self.batch
         for enemy in self.enemies:
-            enemy.draw(screen)
+            batch.add(enemy.image, enemy.rect.topleft)
+        batch.flush(screen)
+        return [enemy.draw_health_bar(screen) or enemy.rect.copy() for enemy in self.enemies]
             
     def clear_all(self):
         """Remove all enemies"""
         self.enemies.clear()
+        self.formation.clear()
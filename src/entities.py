@@ -0,0 +1,99 @@
+import numpy as np
+
+
+class EntityList:
+    """Container of game entities with deferred, mark-dead removal
+    
+    kill() only flags an entity, so it is safe to call while iterating;
+    dead entities are skipped by iteration and dropped in a single pass
+    by compact(), which managers call once per frame.
+    """
+    
+    def __init__(self, entities=()):
+        """Initialize the container"""
+        self.items = []
+        self.dead = 0
+        self.extend(entities)
+    
+    def append(self, entity):
+        """Add a live entity"""
+        entity.alive = True
+        self.items.append(entity)
+    
+    def extend(self, entities):
+        """Add several live entities"""
+        for entity in entities:
+            self.append(entity)
+    
+    def kill(self, entity):
+        """Mark an entity as dead; it is removed on the next compact"""
+        if entity.alive:
+            entity.alive = False
+            self.dead += 1
+    
+    def compact(self):
+        """Drop every dead entity in one pass"""
+        if self.dead:
+            self.items = [entity for entity in self.items if entity.alive]
+            self.dead = 0
+    
+    def clear(self):
+        """Remove all entities"""
+        for entity in self.items:
+            entity.alive = False
+        self.items = []
+        self.dead = 0
+    
+    def __iter__(self):
+        """Iterate over live entities"""
+        return (entity for entity in self.items if entity.alive)
+    
+    def __len__(self):
+        """Number of live entities"""
+        return len(self.items) - self.dead
+    
+    def __bool__(self):
+        """True if any entity is alive"""
+        return len(self.items) > self.dead
+
+
+class ArrayStore:
+    """Rows of parallel NumPy arrays that grow by doubling
+    
+    Subclasses list their columns in FIELDS as (name, dtype) pairs; each
+    becomes an array attribute. The first count rows are in use.
+    """
+    
+    FIELDS = ()
+    
+    def __init__(self, capacity):
+        """Initialize empty arrays with room for capacity rows"""
+        self.count = 0
+        self.capacity = 0
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity):
+        """Grow the backing arrays to hold capacity rows"""
+        for name, dtype in self.FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+    
+    def reserve(self, n):
+        """Make room for n more rows, doubling the capacity as needed"""
+        if self.count + n > self.capacity:
+            capacity = self.capacity
+            while self.count + n > capacity:
+                capacity *= 2
+            self._allocate(capacity)
+    
+    def keep_rows(self, keep):
+        """Pack the rows where keep (one bool per row) is true to the front"""
+        keep = np.flatnonzero(keep)
+        m = len(keep)
+        for name, _ in self.FIELDS:
+            array = getattr(self, name)
+            array[:m] = array[keep]
+        self.count = m
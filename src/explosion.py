@@ -0,0 +1,172 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+import numpy as np
+from src.assets import get_image, image_path
+from src.render import RenderBatch
+
+
+# Frames of the bundled explosion sequence
+SEQUENCE = tuple(image_path(f"Explosion/explosion{i}.png") for i in range(1, 16))
+DESTRUCTION_IMAGE = image_path("destruction.png")
+
+# Explosion kinds
+EXPLOSION_SMALL = 0   # Enemy kill
+EXPLOSION_LARGE = 1   # Boss kill
+EXPLOSION_BOOM = 2    # "BOOM!" burst over a boss kill
+
+# Per kind: frame source, size of the largest frame, frame count and
+# ticks each frame is shown. The destruction image is grown from 40% to
+# full size over its frames.
+KINDS = (
+    ("sequence", 64, len(SEQUENCE), 2),
+    ("sequence", 200, len(SEQUENCE), 3),
+    ("destruction", 240, 12, 5)
+)
+
+
+def _fit(image, size):
+    """Scale an image so its larger side is size, keeping its aspect ratio"""
+    width, height = image.get_size()
+    scale = size / max(width, height)
+    return pygame.transform.smoothscale(image, (max(1, round(width * scale)), max(1, round(height * scale))))
+
+
+def _placeholder_frames(size, count):
+    """Expanding orange circles used when the explosion images are missing"""
+    frames = []
+    for i in range(count):
+        frame = pygame.Surface((size, size), pygame.SRCALPHA)
+        radius = max(1, size // 2 * (i + 1) // count)
+        pygame.draw.circle(frame, (255, 160, 40, 255 - 200 * i // count), (size // 2, size // 2), radius)
+        frames.append(frame)
+    return frames
+
+
+def build_frames(kind):
+    """Scaled frames of an explosion kind"""
+    source, size, count, _ = KINDS[kind]
+    if source == "sequence":
+        images = [get_image(path) for path in SEQUENCE]
+        if None in images:
+            return _placeholder_frames(size, count)
+        # Frames grow through the sequence; scale them all by the last one
+        scale = size / max(images[-1].get_size())
+        return [_fit(image, max(image.get_size()) * scale) for image in images]
+    
+    image = get_image(DESTRUCTION_IMAGE)
+    if image is None:
+        return _placeholder_frames(size, count)
+    frames = [_fit(image, size * (0.4 + 0.6 * i / (count - 1))) for i in range(count)]
+    # Fade out over the last third
+    fade = count // 3
+    for i in range(fade):
+        frames[count - fade + i].set_alpha(255 * (fade - i) // (fade + 1))
+    return frames
+
+
+class ExplosionAtlas:
+    """Every explosion frame packed into one surface
+    
+    frames[kind][i] is (subsurface, left, top, width, height): a view into
+    the atlas, so all frames share one block of pixels, and the frame's
+    offset from the explosion's center and size.
+    """
+    
+    def __init__(self):
+        """Scale every frame and pack the frames in rows, one row per kind"""
+        rows = [build_frames(kind) for kind in range(len(KINDS))]
+        width = max(sum(frame.get_width() for frame in row) for row in rows)
+        height = sum(max(frame.get_height() for frame in row) for row in rows)
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.frames = []
+        y = 0
+        for row in rows:
+            x = 0
+            frames = []
+            for frame in row:
+                w, h = frame.get_size()
+                self.surface.blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+                sub = self.surface.subsurface((x, y, w, h))
+                # Fading frames keep their surface alpha
+                alpha = frame.get_alpha()
+                if alpha is not None and alpha < 255:
+                    sub.set_alpha(alpha)
+                frames.append((sub, -(w // 2), -(h // 2), w, h))
+                x += w
+            self.frames.append(frames)
+            y += max(frame.get_height() for frame in row)
+
+
+class ExplosionPool:
+    """Fixed-capacity ring buffer of running explosions
+    
+    spawn() writes the next slot, reusing the oldest explosion's when the
+    pool is full, so bursts of kills never allocate. update() ages every
+    explosion in one step and draw() blits the running ones in one batch.
+    load() builds the frame atlas and must run before the first draw, so
+    the first explosion on screen does not stall the frame.
+    """
+    
+    def __init__(self, capacity=128):
+        """Initialize an empty pool"""
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.age = np.zeros(capacity, dtype=np.int32)
+        # Ticks each kind runs for; slots whose age reached it are free
+        self.ticks = np.array([ticks for _, _, _, ticks in KINDS], dtype=np.int32)
+        self.durations = np.array([count * ticks for _, _, count, ticks in KINDS], dtype=np.int32)
+        self.duration = self.durations[self.kind]
+        self.age[:] = self.duration
+        self.head = 0
+        self.atlas = None
+        self.batch = RenderBatch()
+    
+    def load(self):
+        """Build the frame atlas once"""
+        if self.atlas is None:
+            self.atlas = ExplosionAtlas()
+    
+    def spawn(self, x, y, kind=EXPLOSION_SMALL):
+        """Start an explosion centered on (x, y)"""
+        i = self.head
+        self.x[i] = x
+        self.y[i] = y
+        self.kind[i] = kind
+        self.duration[i] = self.durations[kind]
+        self.age[i] = 0
+        self.head = (i + 1) % self.capacity
+    
+    def update(self):
+        """Advance every running explosion one tick"""
+        self.age += 1
+        np.minimum(self.age, self.duration, out=self.age)
+    
+    def clear(self):
+        """Stop every explosion"""
+        self.age[:] = self.duration
+    
+    def __len__(self):
+        """Number of running explosions"""
+        return int(np.count_nonzero(self.age < self.duration))
+    
+    def draw(self, screen):
+        """Draw every running explosion in one batch and return the areas drawn"""
+        live = np.flatnonzero(self.age < self.duration)
+        if len(live) == 0:
+            return []
+        assert self.atlas is not None, "ExplosionPool.load() must run before draw()"
+        frames = self.atlas.frames
+        kinds = self.kind[live].tolist()
+        indices = (self.age[live] // self.ticks[self.kind[live]]).tolist()
+        batch = self.batch
+        areas = []
+        for kind, index, x, y in zip(kinds, indices, self.x[live].tolist(), self.y[live].tolist()):
+            surface, left, top, width, height = frames[kind][index]
+            batch.add(surface, (x + left, y + top))
+            areas.append(pygame.Rect(x + left, y + top, width, height))
+        batch.flush(screen)
+        return areas
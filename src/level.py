@@ -2,248 +2,221 @@ try:
     import pygame
 except ImportError:
     import pygame_ce as pygame
-from src.boss import Boss
+import os
+import json
+import heapq
+import warnings
+from functools import lru_cache
+from src.boss import Boss, BOSS_TYPES
+from src.enemy import ENEMY_TYPES, MOVEMENT_PATTERNS
+from src.world import WIDTH, HEIGHT, SPAWN_MARGIN_TOP
+
+
+LEVEL_PATH = os.path.join("assets", "levels")
+
+# Keys allowed in an enemy spawn entry
+ENEMY_KEYS = {"x", "y", "type", "pattern", "speed_y"}
+
+
+def level_path(level_num):
+    """Path of the file defining a level"""
+    return os.path.join(LEVEL_PATH, f"level_{level_num}.json")
+
+
+@lru_cache(maxsize=None)
+def level_count():
+    """Number of levels, counting level files from level 1 until one is missing"""
+    count = 0
+    while os.path.exists(level_path(count + 1)):
+        count += 1
+    return count
 
 
 class Wave:
-    """Represents a wave of enemies"""
+    """A group of enemies spawned one after another"""
     
-    def __init__(self, wave_data):
-        """Initialize wave with enemy spawn data"""
-        self.enemies = wave_data.get("enemies", [])
-        self.spawn_delay = wave_data.get("spawn_delay", 60)  # Frames between spawns
-        self.spawn_timer = 0
-        self.current_spawn_index = 0
-        self.completed = False
-        
-    def update(self):
-        """Update wave and return enemies to spawn"""
-        if self.completed:
-            return []
-            
-        self.spawn_timer += 1
-        enemies_to_spawn = []
-        
-        if self.spawn_timer >= self.spawn_delay and self.current_spawn_index < len(self.enemies):
-            enemies_to_spawn.append(self.enemies[self.current_spawn_index])
-            self.current_spawn_index += 1
-            self.spawn_timer = 0
-            
-            if self.current_spawn_index >= len(self.enemies):
-                self.completed = True
-                
-        return enemies_to_spawn
+    def __init__(self, enemies, spawn_delay):
+        """Initialize wave with enemy spawn data and the frames between spawns"""
+        self.enemies = enemies
+        self.spawn_delay = spawn_delay
+
+
+class LevelData:
+    """A validated level file compiled into a spawn timeline
+    
+    The timeline is a sorted tuple of (frame, order, wave index, enemy
+    spec) entries; the boss is the last entry, with None as its spec.
+    Frames count level updates from 1.
+    """
+    
+    def __init__(self, name, waves, wave_delay, boss):
+        """Initialize level data and compile its timeline"""
+        self.name = name
+        self.waves = waves
+        self.wave_delay = wave_delay
+        self.boss = boss
         
-    def is_completed(self):
-        """Check if wave is complete"""
-        return self.completed
+        # A wave's first enemy spawns spawn_delay frames after the wave
+        # starts, then one every spawn_delay frames; the next wave starts
+        # wave_delay frames after the last spawn (counting that frame)
+        timeline = []
+        start = 0
+        for index, wave in enumerate(waves):
+            for i, spec in enumerate(wave.enemies):
+                frame = start + (i + 1) * wave.spawn_delay
+                timeline.append((frame, len(timeline), index, spec))
+            start = frame + wave_delay - 1
+        timeline.append((start + 1, len(timeline), len(waves), None))
+        self.timeline = tuple(timeline)
+    
+    def spawn_points(self):
+        """(description, spec) of every enemy and the boss, for checks"""
+        for w, wave in enumerate(self.waves, 1):
+            for e, spec in enumerate(wave.enemies, 1):
+                yield f"wave {w}, enemy {e}", spec
+        yield "boss", self.boss
+
+
+def _check(condition, path, message):
+    """Raise ValueError naming the level file if condition is false"""
+    if not condition:
+        raise ValueError(f"{path}: {message}")
+
+
+def _is_number(value):
+    """True for ints and floats (but not bools)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _spawns_off_playfield(x, y):
+    """True if a spawn point is beside or below the playfield, or too far above to fly in"""
+    return not (0 <= x <= WIDTH and -SPAWN_MARGIN_TOP <= y <= HEIGHT)
+
+
+def parse_level(data, path="<level>"):
+    """Validate the contents of a level file and compile it
+    
+    Spawn points off the playfield are reported as warnings: such enemies
+    would never be seen, or would be culled the moment they appear.
+    """
+    level = _parse_level(data, path)
+    for where, spec in level.spawn_points():
+        if _spawns_off_playfield(spec.get("x", WIDTH // 2), spec.get("y", -50)):
+            warnings.warn(f"{path}: {where} spawns off the playfield at "
+                          f"({spec.get('x')}, {spec.get('y', -50)})", stacklevel=2)
+    return level
+
+
+def _parse_level(data, path):
+    """Check the structure of a level file and compile it"""
+    _check(isinstance(data, dict), path, "level must be an object")
+    waves_data = data.get("waves")
+    _check(isinstance(waves_data, list) and waves_data, path, "level needs a non-empty list of waves")
+    wave_delay = data.get("wave_delay", 180)
+    _check(isinstance(wave_delay, int) and wave_delay > 0, path, "wave_delay must be a positive integer")
+    
+    waves = []
+    for w, wave_data in enumerate(waves_data, 1):
+        _check(isinstance(wave_data, dict), path, f"wave {w} must be an object")
+        spawn_delay = wave_data.get("spawn_delay", 60)
+        _check(isinstance(spawn_delay, int) and spawn_delay > 0, path,
+               f"wave {w}: spawn_delay must be a positive integer")
+        enemies = wave_data.get("enemies")
+        _check(isinstance(enemies, list) and enemies, path, f"wave {w} needs a non-empty list of enemies")
+        for e, enemy in enumerate(enemies, 1):
+            where = f"wave {w}, enemy {e}"
+            _check(isinstance(enemy, dict), path, f"{where} must be an object")
+            unknown = set(enemy) - ENEMY_KEYS
+            _check(not unknown, path, f"{where}: unknown keys {', '.join(sorted(unknown))}")
+            _check(enemy.get("type", "basic") in ENEMY_TYPES, path,
+                   f"{where}: type must be one of {', '.join(ENEMY_TYPES)}")
+            _check(enemy.get("pattern", "straight") in MOVEMENT_PATTERNS, path,
+                   f"{where}: pattern must be one of {', '.join(MOVEMENT_PATTERNS)}")
+            for key in ("x", "y", "speed_y"):
+                _check(key not in enemy or _is_number(enemy[key]), path, f"{where}: {key} must be a number")
+        waves.append(Wave(enemies, spawn_delay))
+    
+    boss = data.get("boss")
+    _check(isinstance(boss, dict), path, "level needs a boss")
+    _check(boss.get("type") in BOSS_TYPES, path, f"boss type must be one of {', '.join(BOSS_TYPES)}")
+    for key in ("x", "y"):
+        _check(_is_number(boss.get(key)), path, f"boss {key} must be a number")
+    
+    return LevelData(data.get("name", ""), tuple(waves), wave_delay, boss)
+
+
+@lru_cache(maxsize=None)
+def load_level(level_num):
+    """Load, validate and compile a level file once, on first use"""
+    path = level_path(level_num)
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except OSError as error:
+        raise ValueError(f"{path}: cannot read level file ({error.strerror})")
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{path}: invalid JSON ({error})")
+    return parse_level(data, path)
 
 
 class Level:
     """Represents a game level with multiple waves"""
     
-    def __init__(self, level_num):
+    def __init__(self, level_num, projectiles=None, particles=None):
         """Initialize level"""
         self.level_num = level_num
-        self.waves = []
+        self.projectiles = projectiles
+        self.particles = particles
+        self.data = load_level(level_num)
+        self.waves = self.data.waves
+        # The compiled timeline is sorted, so a copy is already a heap
+        self.timeline = list(self.data.timeline)
+        self.frame = 0
         self.current_wave_index = 0
-        self.wave_delay_timer = 0
-        self.wave_delay = 180  # Frames between waves
         self.boss_spawned = False
         self.boss = None
         self.completed = False
-        
-        # Build level waves
-        self.build_level()
-        
-    def build_level(self):
-        """Build waves for this level"""
-        if self.level_num == 1:
-            self.build_level_1()
-        elif self.level_num == 2:
-            self.build_level_2()
-        elif self.level_num == 3:
-            self.build_level_3()
-            
-    def build_level_1(self):
-        """Level 1: Initial Contact - 3 waves + mini-boss"""
-        # Wave 1: Basic enemies
-        wave1_data = {
-            "enemies": [
-                {"x": 200, "y": -50, "type": "basic"},
-                {"x": 400, "y": -50, "type": "basic"},
-                {"x": 600, "y": -50, "type": "basic"},
-                {"x": 300, "y": -100, "type": "basic"},
-                {"x": 500, "y": -100, "type": "basic"},
-            ],
-            "spawn_delay": 40
-        }
-        self.waves.append(Wave(wave1_data))
-        
-        # Wave 2: More basic enemies in formation
-        wave2_data = {
-            "enemies": [
-                {"x": 150, "y": -50, "type": "basic"},
-                {"x": 250, "y": -50, "type": "basic"},
-                {"x": 350, "y": -50, "type": "basic"},
-                {"x": 450, "y": -50, "type": "basic"},
-                {"x": 550, "y": -50, "type": "basic"},
-                {"x": 650, "y": -50, "type": "basic"},
-            ],
-            "spawn_delay": 35
-        }
-        self.waves.append(Wave(wave2_data))
-        
-        # Wave 3: Mixed enemies
-        wave3_data = {
-            "enemies": [
-                {"x": 200, "y": -50, "type": "basic"},
-                {"x": 400, "y": -50, "type": "zigzag"},
-                {"x": 600, "y": -50, "type": "basic"},
-                {"x": 300, "y": -100, "type": "zigzag"},
-                {"x": 500, "y": -100, "type": "basic"},
-                {"x": 400, "y": -150, "type": "elite"},
-            ],
-            "spawn_delay": 45
-        }
-        self.waves.append(Wave(wave3_data))
-        
-    def build_level_2(self):
-        """Level 2: Advanced Threats - Zig-zag enemies and elite shooters"""
-        # Wave 1: Zig-zag formation
-        wave1_data = {
-            "enemies": [
-                {"x": 100, "y": -50, "type": "zigzag"},
-                {"x": 300, "y": -50, "type": "zigzag"},
-                {"x": 500, "y": -50, "type": "zigzag"},
-                {"x": 700, "y": -50, "type": "zigzag"},
-                {"x": 200, "y": -100, "type": "basic"},
-                {"x": 400, "y": -100, "type": "basic"},
-                {"x": 600, "y": -100, "type": "basic"},
-            ],
-            "spawn_delay": 40
-        }
-        self.waves.append(Wave(wave1_data))
-        
-        # Wave 2: Elite shooters
-        wave2_data = {
-            "enemies": [
-                {"x": 200, "y": -50, "type": "elite"},
-                {"x": 400, "y": -50, "type": "elite"},
-                {"x": 600, "y": -50, "type": "elite"},
-                {"x": 300, "y": -100, "type": "zigzag"},
-                {"x": 500, "y": -100, "type": "zigzag"},
-            ],
-            "spawn_delay": 50
-        }
-        self.waves.append(Wave(wave2_data))
-        
-        # Wave 3: Mixed advanced
-        wave3_data = {
-            "enemies": [
-                {"x": 150, "y": -50, "type": "elite"},
-                {"x": 350, "y": -50, "type": "zigzag"},
-                {"x": 550, "y": -50, "type": "elite"},
-                {"x": 250, "y": -100, "type": "kamikaze"},
-                {"x": 450, "y": -100, "type": "kamikaze"},
-                {"x": 650, "y": -100, "type": "zigzag"},
-                {"x": 400, "y": -150, "type": "elite"},
-            ],
-            "spawn_delay": 45
-        }
-        self.waves.append(Wave(wave3_data))
-        
-    def build_level_3(self):
-        """Level 3: The Final Showdown - Mixed waves leading to final boss"""
-        # Wave 1: Heavy assault
-        wave1_data = {
-            "enemies": [
-                {"x": 100, "y": -50, "type": "elite"},
-                {"x": 250, "y": -50, "type": "zigzag"},
-                {"x": 400, "y": -50, "type": "elite"},
-                {"x": 550, "y": -50, "type": "zigzag"},
-                {"x": 700, "y": -50, "type": "elite"},
-                {"x": 175, "y": -100, "type": "kamikaze"},
-                {"x": 325, "y": -100, "type": "kamikaze"},
-                {"x": 475, "y": -100, "type": "kamikaze"},
-                {"x": 625, "y": -100, "type": "kamikaze"},
-            ],
-            "spawn_delay": 35
-        }
-        self.waves.append(Wave(wave1_data))
-        
-        # Wave 2: Elite squadron
-        wave2_data = {
-            "enemies": [
-                {"x": 200, "y": -50, "type": "elite"},
-                {"x": 400, "y": -50, "type": "elite"},
-                {"x": 600, "y": -50, "type": "elite"},
-                {"x": 300, "y": -100, "type": "elite"},
-                {"x": 500, "y": -100, "type": "elite"},
-                {"x": 400, "y": -150, "type": "elite"},
-            ],
-            "spawn_delay": 60
-        }
-        self.waves.append(Wave(wave2_data))
-        
-        # Wave 3: Final wave before boss
-        wave3_data = {
-            "enemies": [
-                {"x": 150, "y": -50, "type": "zigzag"},
-                {"x": 300, "y": -50, "type": "elite"},
-                {"x": 450, "y": -50, "type": "zigzag"},
-                {"x": 600, "y": -50, "type": "elite"},
-                {"x": 200, "y": -100, "type": "kamikaze"},
-                {"x": 400, "y": -100, "type": "kamikaze"},
-                {"x": 600, "y": -100, "type": "kamikaze"},
-            ],
-            "spawn_delay": 40
-        }
-        self.waves.append(Wave(wave3_data))
-        
+    
     def update(self, enemy_manager):
         """Update level progression and return enemies to spawn"""
         if self.completed:
             return []
-            
-        enemies_to_spawn = []
         
         # Handle boss
         if self.boss_spawned:
             if self.boss and self.boss.health <= 0:
                 self.completed = True
             return []
-            
-        # Handle waves
-        if self.current_wave_index < len(self.waves):
-            current_wave = self.waves[self.current_wave_index]
-            enemies_to_spawn = current_wave.update()
-            
-            if current_wave.is_completed():
-                # Wait before next wave
-                self.wave_delay_timer += 1
-                if self.wave_delay_timer >= self.wave_delay:
-                    self.current_wave_index += 1
-                    self.wave_delay_timer = 0
-        else:
-            # All waves complete, spawn boss
-            if not self.boss_spawned:
+        
+        # Pop everything scheduled up to this frame
+        self.frame += 1
+        timeline = self.timeline
+        enemies_to_spawn = []
+        while timeline and timeline[0][0] <= self.frame:
+            _, _, self.current_wave_index, spec = heapq.heappop(timeline)
+            if spec is None:
                 self.spawn_boss()
-                
-        return enemies_to_spawn
+            else:
+                enemies_to_spawn.append(spec)
         
+        return enemies_to_spawn
+    
     def spawn_boss(self):
         """Spawn the level boss"""
         self.boss_spawned = True
-        if self.level_num == 1:
-            self.boss = Boss(400, -100, "mini")
-        elif self.level_num >= 2:
-            self.boss = Boss(400, -100, "final")
-            
+        boss = self.data.boss
+        self.boss = Boss(boss["x"], boss["y"], boss["type"], self.projectiles, self.particles)
+    
+    def skip_to_boss(self):
+        """Drop the remaining waves and spawn the boss now"""
+        self.timeline.clear()
+        self.current_wave_index = len(self.waves)
+        self.spawn_boss()
+    
     def is_completed(self):
         """Check if level is complete"""
         return self.completed
-        
+    
     def get_boss(self):
         """Get the current boss if active"""
         return self.boss if self.boss_spawned else None
@@ -252,18 +225,20 @@ class Level:
 class LevelManager:
     """Manages level progression and transitions"""
     
-    def __init__(self, starting_level=1):
+    def __init__(self, starting_level=1, projectiles=None, particles=None):
         """Initialize level manager"""
+        self.projectiles = projectiles
+        self.particles = particles
         self.current_level_num = starting_level
-        self.current_level = Level(self.current_level_num)
-        self.max_levels = 3
+        self.current_level = Level(self.current_level_num, self.projectiles, self.particles)
+        self.max_levels = level_count()
         self.all_levels_complete = False
-        
+    
     def update(self, enemy_manager):
         """Update current level and return enemies to spawn"""
         if self.all_levels_complete:
             return []
-            
+        
         # Update current level with enemy manager
         enemies_to_spawn = self.current_level.update(enemy_manager)
         
@@ -273,18 +248,22 @@ class LevelManager:
             if boss is None or boss.health <= 0:
                 if self.current_level_num >= self.max_levels:
                     self.all_levels_complete = True
-                
-        return enemies_to_spawn
         
+        return enemies_to_spawn
+    
+    def has_next_level(self):
+        """Check if there is a level after the current one"""
+        return self.current_level_num < self.max_levels
+    
     def advance_level(self):
         """Move to the next level"""
         self.current_level_num += 1
-        self.current_level = Level(self.current_level_num)
-        
+        self.current_level = Level(self.current_level_num, self.projectiles, self.particles)
+    
     def get_current_level(self):
         """Get the current level object"""
         return self.current_level
-        
+    
     def is_game_complete(self):
         """Check if all levels are complete"""
         return self.all_levels_complete
@@ -0,0 +1,178 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+import numpy as np
+from src.world import PLAYFIELD_BOX
+
+
+# Per-particle arrays and their dtypes
+FIELDS = (
+    ("x", np.float32),
+    ("y", np.float32),
+    ("vx", np.float32),
+    ("vy", np.float32),
+    ("drag", np.float32),
+    ("life", np.int16),
+    ("max_life", np.int16),
+    ("color", np.uint8, 3),
+    ("size", np.int8)
+)
+
+# Side of the square tiles drawn areas are reported in, in pixels
+DIRTY_TILE = 32
+
+# Effect presets: (speed range, life range in ticks, colors, size, drag)
+EFFECTS = {
+    "thruster": ((1.5, 3.0), (8, 16), ((255, 170, 60), (255, 230, 140), (120, 200, 255)), 1, 0.9),
+    "impact": ((1.0, 4.0), (6, 14), ((255, 255, 200), (255, 200, 80)), 1, 0.85),
+    "debris": ((0.5, 3.0), (25, 45), ((255, 120, 40), (200, 200, 200), (255, 220, 120)), 2, 0.97),
+    "phase": ((2.0, 7.0), (30, 60), ((255, 80, 255), (255, 255, 255), (160, 80, 255)), 2, 0.96)
+}
+
+
+class ParticleSystem:
+    """Fixed-budget particle store advanced and drawn as arrays
+    
+    At most capacity particles exist at once: emit() spawns only as many
+    as there are free slots and drops the rest, so no burst can exceed the
+    budget. density (0.1..1) scales every emit count; adapt() lowers it
+    when frames run over budget and raises it again when they are cheap.
+    Particles are drawn by writing pixels straight into the target
+    surface. They are cosmetic and use their own RNG, so they never
+    change the game's random sequence.
+    """
+    
+    def __init__(self, capacity=2048, bounds=PLAYFIELD_BOX):
+        """Initialize empty particle arrays; particles leaving bounds are culled"""
+        self.capacity = capacity
+        self.count = 0
+        for field in FIELDS:
+            name, dtype = field[0], field[1]
+            shape = (capacity,) + field[2:]
+            setattr(self, name, np.zeros(shape, dtype=dtype))
+        self.bounds = bounds
+        self.density = 1.0
+        self.rng = np.random.default_rng()
+    
+    def __len__(self):
+        """Number of live particles"""
+        return self.count
+    
+    def emit(self, effect, x, y, count, direction=None, spread=np.pi * 2):
+        """Spawn up to count particles of an effect preset at (x, y)
+        
+        Particles fly out within spread radians around direction (an angle
+        in radians, screen coordinates), or in every direction if None.
+        """
+        count = min(int(count * self.density + 0.5), self.capacity - self.count)
+        if count <= 0:
+            return
+        (speed_lo, speed_hi), (life_lo, life_hi), colors, size, drag = EFFECTS[effect]
+        rng = self.rng
+        start, end = self.count, self.count + count
+        angle = rng.uniform(-spread / 2, spread / 2, count)
+        if direction is not None:
+            angle += direction
+        speed = rng.uniform(speed_lo, speed_hi, count)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.cos(angle) * speed
+        self.vy[start:end] = np.sin(angle) * speed
+        life = rng.integers(life_lo, life_hi + 1, count)
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.color[start:end] = np.array(colors, dtype=np.uint8)[rng.integers(0, len(colors), count)]
+        self.size[start:end] = size
+        self.drag[start:end] = drag
+        self.count = end
+    
+    def update(self):
+        """Move, slow down and age every particle, then drop the dead ones"""
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        x += vx
+        y += vy
+        drag = self.drag[:n]
+        vx *= drag
+        vy *= drag
+        self.life[:n] -= 1
+        
+        left, top, right, bottom = self.bounds
+        live = (self.life[:n] > 0) & (x >= left) & (x < right) & (y >= top) & (y < bottom)
+        if not live.all():
+            keep = np.flatnonzero(live)
+            m = len(keep)
+            for field in FIELDS:
+                array = getattr(self, field[0])
+                array[:m] = array[keep]
+            self.count = m
+    
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+    
+    def adapt(self, frame_time, budget=1 / 60):
+        """Scale effect density to the last frame's time in seconds"""
+        if frame_time > budget:
+            self.density = max(0.1, self.density * 0.8)
+        elif frame_time < budget * 0.7:
+            self.density = min(1.0, self.density + 0.02)
+    
+    def draw(self, screen):
+        """Write every particle into screen's pixels and return the areas covered
+        
+        Areas are the occupied DIRTY_TILE square tiles, joined into one
+        rect per vertical run, so effects far apart do not mark the screen
+        between them.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        width, height = screen.get_size()
+        px = self.x[:n].astype(np.intp)
+        py = self.y[:n].astype(np.intp)
+        # Fade out over the particle's life
+        fade = (self.life[:n].astype(np.float32) / self.max_life[:n])[:, None]
+        color = (self.color[:n] * fade).astype(np.uint8)
+        
+        # Large particles cover a 2x2 block
+        big = np.flatnonzero(self.size[:n] > 1)
+        if len(big):
+            px = np.concatenate((px, px[big] + 1, px[big], px[big] + 1))
+            py = np.concatenate((py, py[big], py[big] + 1, py[big] + 1))
+            color = np.concatenate((color, color[big], color[big], color[big]))
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        px, py, color = px[inside], py[inside], color[inside]
+        if len(px) == 0:
+            return []
+        
+        try:
+            pixels = pygame.surfarray.pixels3d(screen)
+        except (ValueError, pygame.error):
+            # Surfaces without a 24/32-bit layout: fill pixel by pixel
+            for x, y, c in zip(px.tolist(), py.tolist(), color.tolist()):
+                screen.fill(c, (x, y, 1, 1))
+        else:
+            # Glow over what is behind instead of painting dark fringes
+            pixels[px, py] = np.maximum(pixels[px, py], color)
+            del pixels
+        
+        # Mark occupied tiles, then report each column's runs of them
+        rows = (height + DIRTY_TILE - 1) // DIRTY_TILE
+        tile = (px // DIRTY_TILE) * rows + py // DIRTY_TILE
+        occupied = np.flatnonzero(np.bincount(tile)).tolist()
+        areas = []
+        run_start = previous = occupied[0]
+        for index in occupied[1:] + [None]:
+            # Runs end at gaps and at the bottom of each column
+            if index != previous + 1 or index % rows == 0:
+                column, row = divmod(run_start, rows)
+                areas.append(pygame.Rect(column * DIRTY_TILE, row * DIRTY_TILE,
+                                         DIRTY_TILE, (previous - run_start + 1) * DIRTY_TILE))
+                run_start = index
+            previous = index
+        return areas
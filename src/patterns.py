@@ -0,0 +1,38 @@
+import math
+import numpy as np
+from functools import lru_cache
+
+
+# Volley shapes as tables of unit direction vectors, computed once per
+# shape and reused by every volley that fires it. Angles are in degrees,
+# 0 pointing right and 90 straight down.
+
+
+@lru_cache(maxsize=1024)
+def _table(count, offset, step):
+    """Read-only (cos, sin) arrays for angles offset + i * step"""
+    angles = [(offset + i * step) % 360 for i in range(count)]
+    cos = np.array([math.cos(math.radians(angle)) for angle in angles])
+    sin = np.array([math.sin(math.radians(angle)) for angle in angles])
+    cos.flags.writeable = False
+    sin.flags.writeable = False
+    return cos, sin
+
+
+def fan(count, start=0, span=180, rotation=0):
+    """Directions of count bullets spread evenly over span degrees from start
+    
+    A span of 0 fires every bullet the same way.
+    """
+    step = span / (count - 1) if count > 1 else 0
+    return _table(count, (start + rotation) % 360, step)
+
+
+def ring(count, rotation=0):
+    """Directions of count bullets spaced evenly around a full circle"""
+    return _table(count, rotation % 360, 360 / count)
+
+
+def spiral(arms, timer, rate=3):
+    """Directions of a ring of arms turning rate degrees per frame"""
+    return ring(arms, timer * rate)
@@ -2,14 +2,20 @@ try:
     import pygame
 except ImportError:
     import pygame_ce as pygame
-from src.bullet import Bullet, HomingMissile, SpecialLaser
+import math
+from src.assets import get_image, get_placeholder, image_path
+from src.bullet import HomingMissile, SpecialLaser
+from src.controls import read_keyboard, MOVE_LEFT, MOVE_RIGHT, MOVE_UP, MOVE_DOWN, FIRE, SPECIAL, MISSILE
+from src.entities import EntityList
+from src.projectiles import ProjectileStore, OWNER_PLAYER
+from src.world import WIDTH, HEIGHT, SHOT_BOX, outside
 
 
 class Player:
     """Player spacecraft class"""
     
-    def __init__(self, x, y):
-        """Initialize the player"""
+    def __init__(self, x, y, projectiles=None, targets=None, particles=None):
+        """Initialize the player; missiles pick targets from targets (a TargetGrid)"""
         self.x = x
         self.y = y
         self.width = 50
@@ -19,14 +25,21 @@ class Player:
         # Health system
         self.max_health = 100
         self.health = self.max_health
+        self.damage_taken = 0  # Health lost over the session
         
         # Weapon systems
-        self.bullets = []
+        # Regular shots live in the shared projectile store; missiles and
+        # the special laser keep per-object behavior in self.bullets
+        self.projectiles = projectiles if projectiles is not None else ProjectileStore()
+        self.bullets = EntityList()
         self.shoot_cooldown = 0
         self.shoot_delay = 10  # Frames between shots
         
         # Special weapons
         self.homing_missiles = 3
+        self.targets = targets
+        # Thruster exhaust goes to this ParticleSystem, if any
+        self.particles = particles
         self.special_laser_charges = 1
         
         # Power-ups and status
@@ -44,62 +57,55 @@ class Player:
         
     def load_assets(self):
         """Load player sprite"""
-        import os
-        player_path = os.path.join("assets", "images", "main-spacecraft.png")
-        shield_path = os.path.join("assets", "images", "shield.png")
-        
-        if os.path.exists(player_path):
-            try:
-                loaded_img = pygame.image.load(player_path).convert_alpha()
-                self.image = pygame.transform.scale(loaded_img, (self.width, self.height))
-            except:
-                self.image = pygame.Surface((self.width, self.height))
-                self.image.fill((0, 200, 255))
-        else:
-            self.image = pygame.Surface((self.width, self.height))
-            self.image.fill((0, 200, 255))
+        self.image = get_image(image_path("main-spacecraft.png"), (self.width, self.height))
+        if self.image is None:
+            self.image = get_placeholder((self.width, self.height), (0, 200, 255))
         
         # Load shield image
-        if os.path.exists(shield_path):
-            try:
-                self.shield_image = pygame.image.load(shield_path).convert_alpha()
-                self.shield_image = pygame.transform.scale(self.shield_image, (self.width + 20, self.height + 20))
-            except:
-                self.shield_image = None
-        else:
-            self.shield_image = None
-        
-    def update(self):
-        """Update player state"""
-        # Handle keyboard input for movement
-        keys = pygame.key.get_pressed()
+        self.shield_image = get_image(image_path("shield.png"), (self.width + 20, self.height + 20))
+        
+    def update(self, buttons=None):
+        """Update player state from a button mask (keyboard if None)"""
+        if buttons is None:
+            buttons = read_keyboard()
         
         # Four-directional movement
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if buttons & MOVE_LEFT:
             self.x -= self.speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if buttons & MOVE_RIGHT:
             self.x += self.speed
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if buttons & MOVE_UP:
             self.y -= self.speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if buttons & MOVE_DOWN:
             self.y += self.speed
             
         # Keep player on screen
-        self.x = max(self.width // 2, min(600 - self.width // 2, self.x))
-        self.y = max(self.height // 2, min(800 - self.height // 2, self.y))
+        self.x = max(self.width // 2, min(WIDTH - self.width // 2, self.x))
+        self.y = max(self.height // 2, min(HEIGHT - self.height // 2, self.y))
         
         # Update rect position
         self.rect.x = self.x - self.width // 2
         self.rect.y = self.y - self.height // 2
         
+        # Thruster exhaust
+        if self.particles is not None:
+            self.particles.emit("thruster", self.x, self.y + self.height // 2 - 8, 2,
+                                direction=math.pi / 2, spread=0.6)
+            
         # Update shoot cooldown
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
             
         # Auto-fire if space is held
-        if keys[pygame.K_SPACE] and self.shoot_cooldown == 0:
+        if buttons & FIRE and self.shoot_cooldown == 0:
             self.shoot()
             
+        # Special weapons
+        if buttons & SPECIAL:
+            self.use_special_weapon()
+        if buttons & MISSILE:
+            self.fire_homing_missile()
+            
         # Update shield duration
         if self.shield_active:
             self.shield_duration -= 1
@@ -107,11 +113,13 @@ class Player:
                 self.shield_active = False
                 
         # Update bullets
-        for bullet in self.bullets[:]:
+        for bullet in self.bullets:
             bullet.update()
-            # Remove bullets that are off screen
-            if bullet.y < -10 or bullet.y > 810:
-                self.bullets.remove(bullet)
+            # Remove bullets that left the playfield
+            if outside(bullet.x, bullet.y, SHOT_BOX):
+                self.bullets.kill(bullet)
+                
+        self.bullets.compact()
                 
     def shoot(self):
         """Fire player weapons based on weapon level"""
@@ -120,26 +128,23 @@ class Player:
             
         self.shoot_cooldown = self.shoot_delay
         
+        y = self.y - self.height // 2
         if self.weapon_level == 1:
             # Single shot
-            bullet = Bullet(self.x, self.y - self.height // 2, 0, -10, "player")
-            self.bullets.append(bullet)
+            self.projectiles.spawn(self.x, y, 0, -10, owner=OWNER_PLAYER)
         elif self.weapon_level == 2:
             # Double shot
-            bullet1 = Bullet(self.x - 15, self.y - self.height // 2, 0, -10, "player")
-            bullet2 = Bullet(self.x + 15, self.y - self.height // 2, 0, -10, "player")
-            self.bullets.extend([bullet1, bullet2])
+            self.projectiles.spawn_batch([self.x - 15, self.x + 15], y, [0, 0], -10,
+                                         owner=OWNER_PLAYER)
         elif self.weapon_level >= 3:
             # Triple shot with spread
-            bullet1 = Bullet(self.x, self.y - self.height // 2, 0, -10, "player")
-            bullet2 = Bullet(self.x - 15, self.y - self.height // 2, -2, -10, "player")
-            bullet3 = Bullet(self.x + 15, self.y - self.height // 2, 2, -10, "player")
-            self.bullets.extend([bullet1, bullet2, bullet3])
+            self.projectiles.spawn_batch([self.x, self.x - 15, self.x + 15], y, [0, -2, 2], -10,
+                                         owner=OWNER_PLAYER)
             
     def fire_homing_missile(self, target=None):
-        """Fire a homing missile at a target"""
+        """Fire a homing missile at a target, or the nearest one ahead if None"""
         if self.homing_missiles > 0:
-            missile = HomingMissile(self.x, self.y, target)
+            missile = HomingMissile(self.x, self.y, target, self.targets)
             self.bullets.append(missile)
             self.homing_missiles -= 1
             
@@ -153,8 +158,10 @@ class Player:
     def take_damage(self, damage):
         """Take damage if not shielded"""
         if not self.shield_active:
+            health = self.health
             self.health -= damage
             self.health = max(0, self.health)
+            self.damage_taken += health - self.health
             
     def heal(self, amount):
         """Restore health"""
@@ -187,9 +194,10 @@ class Player:
             self.special_laser_charges += 1
             
     def draw(self, screen):
-        """Draw the player and its bullets"""
+        """Draw the player and its missiles and return the areas drawn"""
         # Draw player ship
         screen.blit(self.image, (self.rect.x, self.rect.y))
+        areas = [self.rect.inflate(20, 20) if self.shield_active else self.rect.copy()]
         
         # Draw shield effect if active
         if self.shield_active:
@@ -203,4 +211,5 @@ class Player:
                              
         # Draw bullets
         for bullet in self.bullets:
-            bullet.draw(screen)
+            areas.append(bullet.draw(screen))
+        return areas
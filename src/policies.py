@@ -0,0 +1,102 @@
+import random
+import importlib
+import numpy as np
+from src.controls import ScriptedInput, NO_INPUT, FIRE, MOVE_LEFT, MOVE_RIGHT, MOVE_UP, MOVE_DOWN
+from src.projectiles import OWNER_ENEMY
+
+
+# Input policies are callables (frame, game) -> button mask, built per
+# session from a seed so every session is reproducible
+
+
+class SweepPolicy:
+    """Hold fire while sweeping across the screen and back"""
+    
+    def __init__(self, seed=0, period=240):
+        """Initialize with the frames taken by one sweep and back"""
+        self.period = period
+        self.phase = seed % period
+        
+    def __call__(self, frame, game):
+        """Button mask for a frame"""
+        if (frame + self.phase) % self.period < self.period // 2:
+            return FIRE | MOVE_LEFT
+        return FIRE | MOVE_RIGHT
+
+
+class RandomPolicy:
+    """Hold fire and a random direction, changing every few frames"""
+    
+    def __init__(self, seed=0, min_hold=10, max_hold=40):
+        """Initialize policy"""
+        self.rng = random.Random(seed)
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self.buttons = FIRE
+        self.until = 0
+        
+    def __call__(self, frame, game):
+        """Button mask for a frame"""
+        if frame >= self.until:
+            self.buttons = FIRE | self.rng.choice(
+                (NO_INPUT, MOVE_LEFT, MOVE_RIGHT, MOVE_UP, MOVE_DOWN))
+            self.until = frame + self.rng.randint(self.min_hold, self.max_hold)
+        return self.buttons
+
+
+class DodgePolicy:
+    """Hold fire, sidestep shots and ships closing in, otherwise line up under the nearest enemy"""
+    
+    def __init__(self, seed=0, lookahead=300, margin=45):
+        """Initialize with how far above and beside the ship threats count"""
+        self.lookahead = lookahead
+        self.margin = margin
+        
+    def __call__(self, frame, game):
+        """Button mask for a frame"""
+        player = game.player
+        store = game.projectiles
+        n = store.count
+        x, y = store.x[:n], store.y[:n]
+        threat = (store.alive[:n] & (store.owner[:n] == OWNER_ENEMY) &
+                  (y < player.y) & (y > player.y - self.lookahead) &
+                  (np.abs(x - player.x) < self.margin))
+        threat_x = x[threat].tolist()
+        
+        target = None
+        for enemy in game.enemy_manager.enemies:
+            if player.y - self.lookahead < enemy.y < player.y + player.height:
+                if abs(enemy.x - player.x) < self.margin + enemy.width // 2:
+                    threat_x.append(enemy.x)
+            elif 0 < enemy.y and (target is None or enemy.y > target.y):
+                target = enemy
+                
+        if threat_x:
+            away = MOVE_LEFT if sum(threat_x) / len(threat_x) > player.x else MOVE_RIGHT
+            return FIRE | away
+        if target is not None and abs(target.x - player.x) > player.speed:
+            return FIRE | (MOVE_LEFT if target.x < player.x else MOVE_RIGHT)
+        return FIRE
+
+
+POLICIES = {
+    "idle": lambda seed: ScriptedInput([NO_INPUT]),
+    "autofire": lambda seed: ScriptedInput([FIRE]),
+    "sweep": SweepPolicy,
+    "random": RandomPolicy,
+    "dodge": DodgePolicy
+}
+
+
+def make_policy(name, seed=0):
+    """Build an input policy for one session
+    
+    name is a key of POLICIES or "module:factory", where factory(seed)
+    returns the policy; it must be importable by worker processes.
+    """
+    if name in POLICIES:
+        return POLICIES[name](seed)
+    if ":" not in name:
+        raise ValueError(f"unknown policy {name!r} (choose from {', '.join(POLICIES)} or module:factory)")
+    module_name, attr = name.split(":", 1)
+    return getattr(importlib.import_module(module_name), attr)(seed)
@@ -3,6 +3,36 @@ try:
 except ImportError:
     import pygame_ce as pygame
 import random
+from src.entities import EntityList
+from src.text import render_text
+from src.render import RenderBatch
+from src.world import SHIP_BOX, outside
+
+
+# Icon drawn on each power-up type (placeholder)
+SYMBOLS = {
+    "health": "H",
+    "shield": "S",
+    "weapon_upgrade": "W",
+    "missiles": "M",
+    "special_laser": "L",
+    "speed": ">>",
+    "score": "$"
+}
+
+# Translucent glow surfaces keyed by (size, color)
+_glow_cache = {}
+
+
+def get_glow(size, color):
+    """Get a cached translucent glow surface"""
+    glow = _glow_cache.get((size, color))
+    if glow is None:
+        glow = pygame.Surface(size)
+        glow.set_alpha(100)
+        glow.fill(color)
+        _glow_cache[(size, color)] = glow
+    return glow
 
 
 class PowerUp:
@@ -13,6 +43,7 @@ class PowerUp:
         self.x = x
         self.y = y
         self.type = powerup_type
+        self.alive = True
         self.width = 30
         self.height = 30
         self.speed_y = 2
@@ -57,8 +88,13 @@ class PowerUp:
         self.rect.x = self.x - self.width // 2
         self.rect.y = self.y - self.height // 2
         
-    def draw(self, screen):
-        """Draw the power-up with pulsing effect"""
+    def draw(self, screen, batch=None):
+        """Draw the power-up with pulsing effect and return the area drawn
+        
+        With a batch, the blits are queued on it instead of drawn at once.
+        """
+        blit = screen.blit if batch is None else batch.add
+        
         # Pulsing animation
         pulse = abs(math.sin(self.pulse_timer * 0.1))
         size_mod = int(5 * pulse)
@@ -70,29 +106,17 @@ class PowerUp:
             self.width + size_mod * 2,
             self.height + size_mod * 2
         )
-        glow_surf = pygame.Surface((glow_rect.width, glow_rect.height))
-        glow_surf.set_alpha(100)
-        glow_surf.fill(self.color)
-        screen.blit(glow_surf, (glow_rect.x, glow_rect.y))
+        blit(get_glow(glow_rect.size, self.color), glow_rect.topleft)
         
         # Draw main power-up
-        screen.blit(self.image, (self.rect.x, self.rect.y))
+        blit(self.image, self.rect.topleft)
         
         # Draw icon/symbol (placeholder)
-        font = pygame.font.Font(None, 20)
-        symbols = {
-            "health": "H",
-            "shield": "S",
-            "weapon_upgrade": "W",
-            "missiles": "M",
-            "special_laser": "L",
-            "speed": ">>",
-            "score": "$"
-        }
-        symbol = symbols.get(self.type, "?")
-        text = font.render(symbol, True, (0, 0, 0))
-        screen.blit(text, (self.rect.x + self.width // 2 - text.get_width() // 2,
-                          self.rect.y + self.height // 2 - text.get_height() // 2))
+        symbol = SYMBOLS.get(self.type, "?")
+        text = render_text(symbol, 20, (0, 0, 0))
+        blit(text, (self.rect.x + self.width // 2 - text.get_width() // 2,
+                    self.rect.y + self.height // 2 - text.get_height() // 2))
+        return glow_rect
 
 
 import math
@@ -101,9 +125,11 @@ import math
 class PowerUpManager:
     """Manages all power-ups in the game"""
     
-    def __init__(self):
+    def __init__(self, rng=None):
         """Initialize power-up manager"""
-        self.powerups = []
+        self.rng = rng if rng is not None else random
+        self.powerups = EntityList()
+        self.batch = RenderBatch()
         self.spawn_chance = 0.15  # 15% chance to drop from enemies
         
         # Power-up drop weights (higher = more common)
@@ -119,7 +145,7 @@ class PowerUpManager:
         
     def try_spawn(self, x, y):
         """Attempt to spawn a power-up at the given position"""
-        if random.random() < self.spawn_chance:
+        if self.rng.random() < self.spawn_chance:
             powerup_type = self.weighted_random_choice()
             powerup = PowerUp(x, y, powerup_type)
             self.powerups.append(powerup)
@@ -127,7 +153,7 @@ class PowerUpManager:
     def weighted_random_choice(self):
         """Choose a power-up type based on weights"""
         total_weight = sum(self.drop_weights.values())
-        rand_val = random.uniform(0, total_weight)
+        rand_val = self.rng.uniform(0, total_weight)
         
         current_weight = 0
         for powerup_type, weight in self.drop_weights.items():
@@ -144,17 +170,20 @@ class PowerUpManager:
         
     def update(self):
         """Update all power-ups"""
-        for powerup in self.powerups[:]:
+        for powerup in self.powerups:
             powerup.update()
             
-            # Remove power-ups that are off screen
-            if powerup.y > 650:
-                self.powerups.remove(powerup)
+            # Remove power-ups that left the playfield
+            if outside(powerup.x, powerup.y, SHIP_BOX):
+                self.powerups.kill(powerup)
+                
+        self.powerups.compact()
                 
     def draw(self, screen):
-        """Draw all power-ups"""
-        for powerup in self.powerups:
-            powerup.draw(screen)
+        """Draw all power-ups in one batch and return the areas drawn"""
+        areas = [powerup.draw(screen, self.batch) for powerup in self.powerups]
+        self.batch.flush(screen)
+        return areas
             
     def clear_all(self):
         """Remove all power-ups"""
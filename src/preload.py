@@ -0,0 +1,91 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+import os
+from concurrent.futures import ThreadPoolExecutor
+from src.assets import store_source
+from src.audio import store_sound
+
+
+ASSET_ROOT = "assets"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+# Music is streamed by pygame.mixer.music, so only effects are decoded
+SOUND_EXTENSIONS = (".wav", ".ogg")
+
+
+def discover(root=ASSET_ROOT):
+    """Image and sound files under root, as two sorted lists of paths"""
+    images, sounds = [], []
+    for folder, _, files in os.walk(root):
+        for filename in files:
+            extension = os.path.splitext(filename)[1].lower()
+            if extension in IMAGE_EXTENSIONS:
+                images.append(os.path.join(folder, filename))
+            elif extension in SOUND_EXTENSIONS:
+                sounds.append(os.path.join(folder, filename))
+    return sorted(images), sorted(sounds)
+
+
+def _decode_image(path):
+    """Decode an image file; runs on a loader thread"""
+    try:
+        return pygame.image.load(path)
+    except:
+        return None
+
+
+def _decode_sound(path):
+    """Decode a sound file; runs on a loader thread"""
+    try:
+        return pygame.mixer.Sound(path)
+    except:
+        return None
+
+
+class AssetPreloader:
+    """Decodes every asset file on a thread pool
+    
+    pygame releases the GIL while decoding, so files load in parallel.
+    Results are handed to the asset and sound caches by poll(), on the
+    calling thread, because converting surfaces to the display format
+    must happen on the main thread. Set sounds to False when the mixer
+    is not running.
+    """
+    
+    def __init__(self, root=ASSET_ROOT, sounds=True, workers=None):
+        """Start decoding everything under root"""
+        images, sound_files = discover(root)
+        self.pool = ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1))
+        self.pending = [(store_source, path, self.pool.submit(_decode_image, path)) for path in images]
+        if sounds:
+            self.pending += [(store_sound, path, self.pool.submit(_decode_sound, path))
+                             for path in sound_files]
+        self.total = len(self.pending)
+        self.loaded = 0
+    
+    @property
+    def progress(self):
+        """Fraction of files loaded, 0..1"""
+        return self.loaded / self.total if self.total else 1.0
+    
+    def poll(self):
+        """Store the files decoded so far; True once every file is loaded"""
+        remaining = []
+        for store, path, future in self.pending:
+            if future.done():
+                store(path, future.result())
+                self.loaded += 1
+            else:
+                remaining.append((store, path, future))
+        self.pending = remaining
+        if not remaining:
+            self.pool.shutdown()
+            return True
+        return False
+    
+    def wait(self):
+        """Block until every file is decoded, then store them all"""
+        for _, _, future in self.pending:
+            future.result()
+        self.poll()
@@ -0,0 +1,179 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+import csv
+from collections import deque
+from time import perf_counter
+from src.text import get_font
+
+
+# Timed phases of a frame; nested spans are included in their parent
+SPANS = ("handle_events", "update", "level_update", "enemy_update",
+         "collisions", "draw", "flip")
+
+# Entity counts recorded alongside the timings
+COUNTS = ("enemies", "player_shots", "enemy_shots", "boss_shots", "missiles", "powerups")
+
+# Overlay graph colors for the top-level phases
+GRAPH_COLORS = {
+    "handle_events": (120, 120, 255),
+    "update": (80, 220, 120),
+    "draw": (255, 180, 60),
+}
+
+
+class _Span:
+    """Reusable timing context manager for one named phase"""
+    
+    __slots__ = ("times", "name", "start")
+    
+    def __init__(self, times, name):
+        """Initialize span"""
+        self.times = times
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.times[self.name] += perf_counter() - self.start
+        return False
+
+
+class FrameProfiler:
+    """Lightweight per-phase frame timer with overlay graph and CSV export"""
+    
+    def __init__(self, history=180, csv_path=None):
+        """Initialize profiler; rows are streamed to csv_path if given"""
+        self.times = dict.fromkeys(SPANS, 0.0)
+        self.counts = dict.fromkeys(COUNTS, 0)
+        self.history = deque(maxlen=history)
+        self.spans = {name: _Span(self.times, name) for name in SPANS}
+        self.frame = 0
+        self.frame_start = None
+        self.frame_time = 0.0
+        self.interval = 0.0
+        self.overlay_visible = False
+        
+        self.csv_file = None
+        self.csv_writer = None
+        if csv_path:
+            self.csv_file = open(csv_path, "w", newline="")
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(["frame", "frame_ms", "interval_ms"] +
+                                     [f"{name}_ms" for name in SPANS] + list(COUNTS))
+    
+    def span(self, name):
+        """Context manager timing one phase of the current frame"""
+        return self.spans[name]
+    
+    def begin_frame(self):
+        """Start timing a new frame"""
+        now = perf_counter()
+        if self.frame_start is not None:
+            self.interval = now - self.frame_start
+        self.frame_start = now
+        for name in SPANS:
+            self.times[name] = 0.0
+    
+    def end_frame(self, counts=None):
+        """Finish the current frame and record its timings and entity counts"""
+        self.frame_time = perf_counter() - self.frame_start
+        if counts:
+            self.counts.update(counts)
+        self.history.append((self.frame_time, dict(self.times)))
+        
+        if self.csv_writer:
+            self.csv_writer.writerow(
+                [self.frame, f"{self.frame_time * 1000:.3f}", f"{self.interval * 1000:.3f}"] +
+                [f"{self.times[name] * 1000:.3f}" for name in SPANS] +
+                [self.counts[name] for name in COUNTS])
+        self.frame += 1
+    
+    def toggle_overlay(self):
+        """Show or hide the on-screen graph"""
+        self.overlay_visible = not self.overlay_visible
+    
+    def draw_overlay(self, screen, budget_ms=1000 / 60):
+        """Draw a rolling graph of recent frame times and return its area"""
+        if not self.overlay_visible:
+            return None
+        width, height = self.history.maxlen, 90
+        x0 = 10
+        y0 = screen.get_height() - height - 40
+        panel = pygame.Surface((width, height + 36), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        screen.blit(panel, (x0, y0 - 36))
+        
+        # Graph spans twice the frame budget
+        scale = height / (budget_ms * 2)
+        bottom = y0 + height
+        for i, (frame_time, times) in enumerate(self.history):
+            y = bottom
+            for name, color in GRAPH_COLORS.items():
+                bar = int(times[name] * 1000 * scale)
+                if bar > 0:
+                    pygame.draw.line(screen, color, (x0 + i, y), (x0 + i, y - bar))
+                    y -= bar
+            # Time outside the measured phases
+            rest = int(frame_time * 1000 * scale) - (bottom - y)
+            if rest > 0:
+                pygame.draw.line(screen, (150, 150, 150), (x0 + i, y), (x0 + i, y - rest))
+        
+        budget_y = bottom - int(budget_ms * scale)
+        pygame.draw.line(screen, (255, 60, 60), (x0, budget_y), (x0 + width, budget_y))
+        
+        # Numbers from the last completed frame
+        frame_time, times = self.history[-1] if self.history else (0.0, self.times)
+        lines = [
+            f"frame {frame_time * 1000:.2f} ms  update {times['update'] * 1000:.2f}  "
+            f"draw {times['draw'] * 1000:.2f}",
+            f"collide {times['collisions'] * 1000:.2f}  flip {times['flip'] * 1000:.2f}  "
+            f"enemies {self.counts['enemies']}  shots {self.counts['player_shots']}/"
+            f"{self.counts['enemy_shots'] + self.counts['boss_shots']}",
+        ]
+        for i, line in enumerate(lines):
+            text = get_font(18).render(line, True, (255, 255, 255))
+            screen.blit(text, (x0 + 4, y0 - 32 + i * 15))
+        return pygame.Rect(x0, y0 - 36, width, height + 36)
+    
+    def close(self):
+        """Flush and close the CSV file"""
+        if self.csv_file:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+
+
+class StartupTimer:
+    """Splits the time from process start to the first frame into phases"""
+    
+    def __init__(self, start=None):
+        """Initialize; start is the perf_counter() value startup began at"""
+        self.start = start if start is not None else perf_counter()
+        self.last = self.start
+        self.phases = []
+        self.finished = False
+    
+    def mark(self, name):
+        """End the current phase, naming it"""
+        now = perf_counter()
+        self.phases.append((name, now - self.last))
+        self.last = now
+    
+    def finish(self):
+        """End the last phase at the first frame"""
+        self.mark("first_frame")
+        self.finished = True
+    
+    def report(self):
+        """Startup breakdown as printable lines"""
+        total = self.last - self.start
+        lines = [f"Startup: {total * 1000:.1f} ms to first frame"]
+        for name, seconds in self.phases:
+            share = seconds / total * 100 if total > 0 else 0
+            lines.append(f"  {name:<14}{seconds * 1000:>9.1f} ms {share:>5.1f}%")
+        return "\n".join(lines)
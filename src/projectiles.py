@@ -0,0 +1,265 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+import numpy as np
+from src.assets import get_image, image_path
+from src.entities import ArrayStore
+from src.render import RenderBatch
+from src.world import SHOT_BOX, outside
+
+
+# Projectile owners
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+# Movement patterns (see ProjectileStore.update)
+PATTERN_NORMAL = 0
+PATTERN_SPIRAL = 1
+PATTERN_ACCELERATE = 2
+PATTERN_WAVE = 3
+
+PATTERNS = {
+    "normal": PATTERN_NORMAL,
+    "spiral": PATTERN_SPIRAL,
+    "accelerate": PATTERN_ACCELERATE,
+    "wave": PATTERN_WAVE
+}
+
+# Visual kinds
+KIND_BULLET = 0
+KIND_BOSS = 1
+
+# Per-projectile arrays and their dtypes
+FIELDS = (
+    ("x", np.float64),
+    ("y", np.float64),
+    ("prev_x", np.float64),
+    ("prev_y", np.float64),
+    ("vx", np.float64),
+    ("vy", np.float64),
+    ("width", np.int32),
+    ("height", np.int32),
+    ("damage", np.int32),
+    ("owner", np.int8),
+    ("pattern", np.int8),
+    ("kind", np.int8),
+    ("timer", np.int32),
+    ("alive", np.bool_)
+)
+
+
+# Projectile sprites keyed by (width, height, owner, kind)
+_sprites = {}
+
+
+def projectile_sprite(width, height, owner, kind):
+    """Render the sprite for one size, owner and kind of projectile"""
+    if kind == KIND_BOSS:
+        # Magenta orb with a white outer ring
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+        center = (width // 2, height // 2)
+        pygame.draw.circle(sprite, (255, 0, 255), center, width // 2)
+        pygame.draw.circle(sprite, (255, 255, 255), center, width // 2, 2)
+        return sprite.convert_alpha()
+    
+    rotation = 180 if owner == OWNER_ENEMY else 0
+    image = get_image(image_path("bullet1.png"), (width, height), rotation)
+    if image:
+        return image
+    sprite = pygame.Surface((width, height))
+    sprite.fill((100, 255, 100) if owner == OWNER_PLAYER else (255, 100, 100))
+    # Add glow effect
+    pygame.draw.rect(sprite, (255, 255, 255), (0, 0, width, height), 1)
+    return sprite.convert()
+
+
+class ProjectileStore(ArrayStore):
+    """Structure-of-arrays store advancing every projectile in one step"""
+    
+    FIELDS = FIELDS
+    
+    def __init__(self, capacity=256):
+        """Initialize empty projectile arrays"""
+        super().__init__(capacity)
+        self.batch = RenderBatch()
+    
+    def __len__(self):
+        """Number of live projectiles"""
+        return int(np.count_nonzero(self.alive[:self.count]))
+    
+    def spawn(self, x, y, speed_x, speed_y, width=8, height=16, damage=10,
+              owner=OWNER_PLAYER, pattern=PATTERN_NORMAL, kind=KIND_BULLET):
+        """Add a single projectile and return its index"""
+        self.reserve(1)
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = speed_x
+        self.vy[i] = speed_y
+        self.width[i] = width
+        self.height[i] = height
+        self.damage[i] = damage
+        self.owner[i] = owner
+        self.pattern[i] = pattern
+        self.kind[i] = kind
+        self.timer[i] = 0
+        self.alive[i] = True
+        self.count += 1
+        return i
+    
+    def spawn_batch(self, xs, ys, speeds_x, speeds_y, width=8, height=16, damage=10,
+                    owner=OWNER_PLAYER, pattern=PATTERN_NORMAL, kind=KIND_BULLET):
+        """Add several projectiles sharing size, damage, owner and pattern"""
+        speeds_x = np.asarray(speeds_x, dtype=np.float64)
+        n = len(speeds_x)
+        if n == 0:
+            return
+        self.reserve(n)
+        start, end = self.count, self.count + n
+        self.x[start:end] = self.prev_x[start:end] = xs
+        self.y[start:end] = self.prev_y[start:end] = ys
+        self.vx[start:end] = speeds_x
+        self.vy[start:end] = speeds_y
+        self.width[start:end] = width
+        self.height[start:end] = height
+        self.damage[start:end] = damage
+        self.owner[start:end] = owner
+        self.pattern[start:end] = pattern
+        self.kind[start:end] = kind
+        self.timer[start:end] = 0
+        self.alive[start:end] = True
+        self.count = end
+    
+    def save_positions(self):
+        """Remember current positions as the previous tick's, for interpolation"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+    
+    def update(self):
+        """Advance all projectiles one frame and drop the ones off screen"""
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        pattern = self.pattern[:n]
+        timer = self.timer[:n]
+        timer += 1
+        
+        if pattern.any():
+            # Spiral: sideways oscillation while falling faster
+            spiral = pattern == PATTERN_SPIRAL
+            if spiral.any():
+                vx[spiral] = np.cos(timer[spiral] * 0.1) * 3
+                vy[spiral] += 0.1
+            
+            # Accelerating bullet
+            accelerate = pattern == PATTERN_ACCELERATE
+            if accelerate.any():
+                vy[accelerate] += 0.2
+            
+            # Wave: sideways drift on top of the velocity
+            wave = pattern == PATTERN_WAVE
+            if wave.any():
+                x[wave] += np.sin(timer[wave] * 0.1) * 2
+        
+        x += vx
+        y += vy
+        
+        # Remove projectiles that left the screen
+        self.alive[:n] &= ~outside(x, y, SHOT_BOX)
+        self.compact()
+    
+    def kill(self, indices):
+        """Mark projectiles as dead; they are dropped on the next compact"""
+        self.alive[indices] = False
+    
+    def compact(self):
+        """Pack live projectiles to the front of the arrays"""
+        n = self.count
+        live = self.alive[:n]
+        if live.all():
+            return
+        self.keep_rows(live)
+        self.alive[self.count:n] = False
+    
+    def clear(self):
+        """Remove all projectiles"""
+        self.alive[:self.count] = False
+        self.count = 0
+    
+    def count_of(self, owner, kind):
+        """Number of live projectiles of an owner and kind"""
+        n = self.count
+        return int(np.count_nonzero(self.alive[:n] & (self.owner[:n] == owner) &
+                                    (self.kind[:n] == kind)))
+    
+    def boxes(self, owner):
+        """Indices and (left, top, right, bottom) edges of live projectiles of an owner"""
+        n = self.count
+        ids = np.flatnonzero(self.alive[:n] & (self.owner[:n] == owner))
+        left = self.x[ids] - self.width[ids] // 2
+        top = self.y[ids] - self.height[ids] // 2
+        return ids, left, top, left + self.width[ids], top + self.height[ids]
+    
+    def hits(self, rect, owner, candidates=None):
+        """Indices of live projectiles of an owner overlapping a rect
+        
+        When candidates is given (e.g. from a broadphase query) only those
+        indices are tested.
+        """
+        if candidates is None:
+            candidates = np.arange(self.count)
+        if len(candidates) == 0:
+            return candidates
+        width = self.width[candidates]
+        height = self.height[candidates]
+        left = self.x[candidates] - width // 2
+        top = self.y[candidates] - height // 2
+        overlap = ((left < rect.right) & (left + width > rect.left) &
+                   (top < rect.bottom) & (top + height > rect.top))
+        overlap &= self.alive[candidates] & (self.owner[candidates] == owner)
+        return candidates[overlap]
+    
+    def get_rect(self, i):
+        """Build the collision rect of a single projectile"""
+        width, height = int(self.width[i]), int(self.height[i])
+        return pygame.Rect(int(self.x[i]) - width // 2, int(self.y[i]) - height // 2,
+                           width, height)
+    
+    def draw(self, screen, alpha=1.0):
+        """Draw all live projectiles in one batch and return the areas drawn
+        
+        alpha below 1 draws them that far between their previous and
+        current positions.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        live = np.flatnonzero(self.alive[:n])
+        widths = self.width[live]
+        heights = self.height[live]
+        xs = self.x[live]
+        ys = self.y[live]
+        if alpha < 1.0:
+            xs = self.prev_x[live] + (xs - self.prev_x[live]) * alpha
+            ys = self.prev_y[live] + (ys - self.prev_y[live]) * alpha
+        lefts = (xs.astype(np.int32) - widths // 2).tolist()
+        tops = (ys.astype(np.int32) - heights // 2).tolist()
+        widths = widths.tolist()
+        heights = heights.tolist()
+        owners = self.owner[live].tolist()
+        kinds = self.kind[live].tolist()
+        
+        sprites = _sprites
+        append = self.batch.items.append
+        for left, top, width, height, owner, kind in zip(lefts, tops, widths, heights, owners, kinds):
+            key = (width, height, owner, kind)
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = sprites[key] = projectile_sprite(width, height, owner, kind)
+            append((sprite, (left, top)))
+        self.batch.flush(screen)
+        return list(zip(lefts, tops, widths, heights))
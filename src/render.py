@@ -0,0 +1,113 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+
+
+class DirtyRenderer:
+    """Presents only the screen areas that changed since the last frame
+    
+    Sprites are drawn over a static background. Each frame the areas
+    drawn on the previous frame are restored from it, the new frame is
+    drawn and its areas recorded with add(), and present() pushes the old
+    and new areas to the display.
+    """
+    
+    def __init__(self, size, full_update_ratio=0.5):
+        """Initialize renderer
+        
+        When the dirty areas add up to more than full_update_ratio of the
+        screen a plain flip is cheaper, so present() falls back to it.
+        """
+        self.background = pygame.Surface(size).convert()
+        self.bounds = pygame.Rect((0, 0), size)
+        self.full_update_area = size[0] * size[1] * full_update_ratio
+        self.previous = []
+        self.dirty = []
+        self.full_redraw = True
+        
+    def invalidate(self):
+        """Redraw and present the whole screen on the next frame"""
+        self.full_redraw = True
+        
+    def begin(self, screen):
+        """Erase the previous frame's sprites from the screen"""
+        if self.full_redraw:
+            screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous:
+                screen.blit(self.background, rect, rect)
+                
+    def add(self, areas):
+        """Record drawn areas: a rect, a list of rects, or None"""
+        if areas is None:
+            return
+        if isinstance(areas, pygame.Rect):
+            areas = (areas,)
+        bounds = self.bounds
+        for area in areas:
+            if area is None:
+                continue
+            rect = bounds.clip(area)
+            if rect.width and rect.height:
+                self.dirty.append(rect)
+                
+    def present(self):
+        """Push this frame's and last frame's areas to the display"""
+        rects = self.previous + self.dirty
+        if self.full_redraw or sum(r.width * r.height for r in rects) > self.full_update_area:
+            pygame.display.flip()
+            self.full_redraw = False
+        elif rects:
+            pygame.display.update(rects)
+        self.previous = self.dirty
+        self.dirty = []
+
+
+# pygame-ce's fblits skips building the list of affected rects
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+class RenderBatch:
+    """Collects (surface, position) pairs and blits them in a single call"""
+    
+    def __init__(self):
+        """Initialize an empty batch"""
+        self.items = []
+        
+    def add(self, surface, dest):
+        """Queue a surface to blit at dest"""
+        self.items.append((surface, dest))
+        
+    def flush(self, screen):
+        """Blit everything queued, in order, and empty the batch"""
+        if not self.items:
+            return
+        if _HAS_FBLITS:
+            screen.fblits(self.items)
+        else:
+            screen.blits(self.items, doreturn=False)
+        self.items.clear()
+
+
+def flatten(parts):
+    """Composite (surface, position) parts into one premultiplied layer
+    
+    Plain alpha blits onto a transparent surface do not stack the way they
+    do on the screen, so every part is premultiplied and composited with
+    BLEND_PREMULTIPLIED. Returns the layer, cropped to the parts, and its
+    position; blit it with special_flags=pygame.BLEND_PREMULTIPLIED.
+    """
+    bounds = pygame.Rect(parts[0][1], parts[0][0].get_size())
+    bounds.unionall_ip([pygame.Rect(pos, surface.get_size()) for surface, pos in parts[1:]])
+    layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    for surface, (x, y) in parts:
+        part = surface.convert_alpha()
+        alpha = surface.get_alpha()
+        if alpha is not None and alpha < 255:
+            # Fold the surface-wide alpha into the pixels before premultiplying
+            part.set_alpha(None)
+            part.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        layer.blit(part.premul_alpha(), (x - bounds.x, y - bounds.y),
+                   special_flags=pygame.BLEND_PREMULTIPLIED)
+    return layer, bounds.topleft
@@ -0,0 +1,85 @@
+import struct
+
+
+REPLAY_MAGIC = b"NSRP"
+REPLAY_VERSION = 1
+
+# magic, version, seed, starting level, frame count, final state checksum
+HEADER = struct.Struct("<4sHQHII")
+
+# Seeds are stored unsigned in 64 bits
+MAX_SEED = (1 << 64) - 1
+
+
+class InputRecorder:
+    """Records one button mask byte per simulated frame of a session"""
+    
+    def __init__(self, seed, level):
+        """Initialize an empty recording for a seeded session"""
+        if not 0 <= seed <= MAX_SEED:
+            raise ValueError(f"cannot record seed {seed}: replay seeds must be between 0 and {MAX_SEED}")
+        self.seed = seed
+        self.level = level
+        self.masks = bytearray()
+        self.checksum = 0
+    
+    def record(self, buttons):
+        """Append the button mask of one frame"""
+        self.masks.append(buttons & 0xFF)
+    
+    def __len__(self):
+        """Number of recorded frames"""
+        return len(self.masks)
+    
+    def save(self, path, checksum=None):
+        """Write the recording to a file
+        
+        checksum is the game state checksum after the last frame, checked
+        again when the recording is replayed; by default the one last set
+        on the recorder is written.
+        """
+        if checksum is not None:
+            self.checksum = checksum
+        checksum = self.checksum
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.level,
+                                len(self.masks), checksum))
+            f.write(self.masks)
+
+
+class InputReplay:
+    """Input source feeding back a recorded session frame by frame"""
+    
+    def __init__(self, seed, level, masks, checksum=0):
+        """Initialize from recorded data"""
+        self.seed = seed
+        self.level = level
+        self.masks = bytes(masks)
+        self.checksum = checksum
+    
+    @classmethod
+    def load(cls, path):
+        """Read a recording written by InputRecorder.save"""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path}: not a replay file")
+        magic, version, seed, level, frames, checksum = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"{path}: not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"{path}: unsupported replay version {version}")
+        masks = data[HEADER.size:HEADER.size + frames]
+        if len(masks) != frames:
+            raise ValueError(f"{path}: replay is truncated")
+        return cls(seed, level, masks, checksum)
+    
+    def __len__(self):
+        """Number of recorded frames"""
+        return len(self.masks)
+    
+    def __call__(self, frame, game):
+        """Button mask recorded for a frame"""
+        if frame < len(self.masks):
+            return self.masks[frame]
+        return 0
@@ -0,0 +1,234 @@
+import math
+import numpy as np
+
+
+# Cell coordinates are offset so negative positions still map to positive keys
+CELL_OFFSET = 1 << 10
+CELL_STRIDE = 1 << 16
+
+
+def cell_key(cx, cy):
+    """Pack a cell coordinate pair into a single integer key"""
+    return (cx + CELL_OFFSET) * CELL_STRIDE + (cy + CELL_OFFSET)
+
+
+class SpatialHash:
+    """Uniform grid broadphase rebuilt every frame
+    
+    Objects with a rect are stored per layer with insert()/query(); array
+    backed entities such as projectiles are stored as index arrays with
+    insert_batch()/query_ids(). Only items sharing a cell are returned as
+    collision candidates.
+    """
+    
+    def __init__(self, cell_size=64):
+        """Initialize an empty grid"""
+        self.cell_size = cell_size
+        self.cells = {}
+        self.id_cells = {}
+    
+    def clear(self):
+        """Remove everything from the grid"""
+        self.cells.clear()
+        self.id_cells.clear()
+    
+    def cell_range(self, rect):
+        """Cell coordinates covered by a rect as (x0, y0, x1, y1), inclusive"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+    
+    def insert(self, layer, item, rect):
+        """Add an object to every cell its rect overlaps"""
+        cells = self.cells.setdefault(layer, {})
+        x0, y0, x1, y1 = self.cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                key = cell_key(cx, cy)
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [item]
+                else:
+                    bucket.append(item)
+    
+    def query(self, layer, rect):
+        """Objects of a layer sharing at least one cell with rect"""
+        cells = self.cells.get(layer)
+        if not cells:
+            return []
+        x0, y0, x1, y1 = self.cell_range(rect)
+        if x0 == x1 and y0 == y1:
+            return list(cells.get(cell_key(x0, y0), ()))
+        
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                for item in cells.get(cell_key(cx, cy), ()):
+                    found[id(item)] = item
+        return list(found.values())
+    
+    def insert_batch(self, layer, ids, lefts, tops, rights, bottoms):
+        """Add many index-identified boxes at once (right/bottom exclusive)"""
+        if len(ids) == 0:
+            return
+        size = self.cell_size
+        x0 = np.floor_divide(lefts, size).astype(np.int64)
+        y0 = np.floor_divide(tops, size).astype(np.int64)
+        x1 = np.floor_divide(np.ceil(rights) - 1, size).astype(np.int64)
+        y1 = np.floor_divide(np.ceil(bottoms) - 1, size).astype(np.int64)
+        span_x = x1 - x0 + 1
+        spans = span_x * (y1 - y0 + 1)
+        
+        # Expand boxes that straddle cell borders into one entry per cell
+        if (spans == 1).all():
+            keys = (x0 + CELL_OFFSET) * CELL_STRIDE + (y0 + CELL_OFFSET)
+            entries = np.asarray(ids)
+        else:
+            owner = np.repeat(np.arange(len(ids)), spans)
+            starts = np.cumsum(spans) - spans
+            offset = np.arange(len(owner)) - starts[owner]
+            cx = x0[owner] + offset % span_x[owner]
+            cy = y0[owner] + offset // span_x[owner]
+            keys = (cx + CELL_OFFSET) * CELL_STRIDE + (cy + CELL_OFFSET)
+            entries = np.asarray(ids)[owner]
+        
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        entries = entries[order]
+        bounds = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        starts = [0] + bounds.tolist()
+        ends = bounds.tolist() + [len(keys)]
+        cells = self.id_cells.setdefault(layer, {})
+        for key, start, end in zip(keys[starts].tolist(), starts, ends):
+            chunk = entries[start:end]
+            existing = cells.get(key)
+            cells[key] = chunk if existing is None else np.concatenate((existing, chunk))
+    
+    def query_ids(self, layer, rect):
+        """Indices of a batch layer sharing at least one cell with rect"""
+        cells = self.id_cells.get(layer)
+        if not cells:
+            return np.empty(0, dtype=np.intp)
+        x0, y0, x1, y1 = self.cell_range(rect)
+        chunks = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                chunk = cells.get(cell_key(cx, cy))
+                if chunk is not None:
+                    chunks.append(chunk)
+        if not chunks:
+            return np.empty(0, dtype=np.intp)
+        if len(chunks) == 1:
+            return chunks[0]
+        return np.unique(np.concatenate(chunks))
+
+
+def is_live_target(target):
+    """True while a target can still be homed in on"""
+    return target.health > 0 and getattr(target, "alive", True)
+
+
+class TargetGrid:
+    """Nearest-target queries over a uniform grid of target positions
+    
+    reset() hands over this frame's targets (anything with x, y and
+    health); the grid is built from their positions on the first query.
+    nearest() then searches rings of cells outward from the query point
+    and stops as soon as no unvisited cell can hold anything closer, so
+    a query only looks at targets near the answer.
+    """
+    
+    def __init__(self, cell_size=96):
+        """Initialize an empty grid"""
+        self.cell_size = cell_size
+        self.groups = ()
+        self.cells = {}
+        self.bounds = None
+        self.built = True
+    
+    def reset(self, *groups):
+        """Replace the targets with the given iterables of objects"""
+        self.groups = groups
+        self.built = False
+    
+    def build(self):
+        """Bucket the live targets by cell"""
+        size = self.cell_size
+        cells = self.cells
+        cells.clear()
+        x0 = y0 = x1 = y1 = None
+        for group in self.groups:
+            for target in group:
+                if not is_live_target(target):
+                    continue
+                cx, cy = int(target.x // size), int(target.y // size)
+                key = cell_key(cx, cy)
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [target]
+                else:
+                    bucket.append(target)
+                if x0 is None:
+                    x0, y0, x1, y1 = cx, cy, cx, cy
+                else:
+                    x0, y0, x1, y1 = min(x0, cx), min(y0, cy), max(x1, cx), max(y1, cy)
+        self.bounds = (x0, y0, x1, y1) if x0 is not None else None
+        self.built = True
+    
+    def nearest(self, x, y, direction=None, cone=180, max_range=None):
+        """Closest live target to (x, y), or None
+        
+        With direction (dx, dy) only targets within cone degrees of it on
+        either side are considered; max_range limits the distance.
+        """
+        if not self.built:
+            self.build()
+        if self.bounds is None:
+            return None
+        
+        cos_cone = None
+        if direction is not None and cone < 180:
+            dx, dy = direction
+            length = math.hypot(dx, dy)
+            if length > 0:
+                dx, dy = dx / length, dy / length
+                cos_cone = math.cos(math.radians(cone))
+        
+        size = self.cell_size
+        cells = self.cells
+        bx0, by0, bx1, by1 = self.bounds
+        qx, qy = int(x // size), int(y // size)
+        # Rings beyond this cover no occupied cell
+        last_ring = max(qx - bx0, bx1 - qx, qy - by0, by1 - qy)
+        if max_range is not None:
+            last_ring = min(last_ring, int(max_range // size) + 1)
+            best_distance = max_range * max_range
+        else:
+            best_distance = math.inf
+        best = None
+        
+        for ring in range(last_ring + 1):
+            # Cells of this ring: the square's top and bottom rows, then its sides
+            if ring == 0:
+                keys = (cell_key(qx, qy),)
+            else:
+                keys = [cell_key(cx, cy) for cx in range(qx - ring, qx + ring + 1)
+                        for cy in (qy - ring, qy + ring)]
+                keys += [cell_key(cx, cy) for cx in (qx - ring, qx + ring)
+                         for cy in range(qy - ring + 1, qy + ring)]
+            for key in keys:
+                for target in cells.get(key, ()):
+                    tx, ty = target.x - x, target.y - y
+                    distance = tx * tx + ty * ty
+                    if distance >= best_distance or not is_live_target(target):
+                        continue
+                    if cos_cone is not None and distance > 0:
+                        if tx * dx + ty * dy < cos_cone * math.sqrt(distance):
+                            continue
+                    best, best_distance = target, distance
+            
+            # Cells in later rings are at least ring cell widths away
+            reach = ring * size
+            if best is not None and best_distance <= reach * reach:
+                break
+        return best
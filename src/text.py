@@ -0,0 +1,54 @@
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+from functools import lru_cache
+
+
+# Shared default-font instances keyed by point size
+_fonts = {}
+
+
+def get_font(size):
+    """Get the shared default font at a size, creating it once"""
+    font = _fonts.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _fonts[size] = font
+    return font
+
+
+@lru_cache(maxsize=256)
+def render_text(text, size, color, alpha=None):
+    """Render text with the default font, cached by (text, size, color, alpha)
+    
+    The returned surface is shared; do not modify it. Pass alpha to get a
+    separately cached translucent copy.
+    """
+    surface = get_font(size).render(text, True, color)
+    if alpha is not None:
+        surface.set_alpha(alpha)
+    return surface
+
+
+class TextLabel:
+    """Text whose surface is re-rendered only when its value changes
+    
+    Meant for strings like the score that change often; keeping them out
+    of the shared cache stops them from evicting static text.
+    """
+    
+    def __init__(self, template, size, color):
+        """Initialize with a format template such as "Score: {}" """
+        self.template = template
+        self.size = size
+        self.color = color
+        self.value = None
+        self.surface = None
+    
+    def render(self, value):
+        """Surface showing value, reused while the value is unchanged"""
+        if self.surface is None or value != self.value:
+            self.value = value
+            self.surface = get_font(self.size).render(self.template.format(value), True, self.color)
+        return self.surface
@@ -0,0 +1,32 @@
+# Playfield size in pixels; the screen shows exactly the playfield
+WIDTH = 600
+HEIGHT = 800
+
+# How far past the playfield edges entities live before they are culled,
+# enough for their sprites to leave the screen entirely
+SHIP_MARGIN = 60    # Enemies and power-ups (40px sprites)
+SHOT_MARGIN = 20    # Bullets, boss orbs and missiles
+
+# Formations may start this far above the playfield and fly in
+SPAWN_MARGIN_TOP = 200
+
+
+def cull_box(margin, top_margin=None):
+    """(left, top, right, bottom) of the area entities with a margin live in
+    
+    top_margin, if given, replaces the margin above the playfield.
+    """
+    top = margin if top_margin is None else top_margin
+    return (-margin, -top, WIDTH + margin, HEIGHT + margin)
+
+
+def outside(x, y, box):
+    """True if (x, y) lies outside a cull box; works on scalars and arrays"""
+    left, top, right, bottom = box
+    return (x < left) | (x > right) | (y < top) | (y > bottom)
+
+
+# Cull boxes per entity type
+PLAYFIELD_BOX = cull_box(0)   # Particles
+SHIP_BOX = cull_box(SHIP_MARGIN, SPAWN_MARGIN_TOP)
+SHOT_BOX = cull_box(SHOT_MARGIN)
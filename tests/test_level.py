@@ -0,0 +1,81 @@
+import warnings
+import pytest
+from src.level import parse_level, level_count, load_level
+
+
+def make_level(**overrides):
+    """Smallest valid level: two waves and a boss, all on the playfield"""
+    data = {
+        "name": "Test",
+        "wave_delay": 10,
+        "waves": [
+            {"spawn_delay": 5, "enemies": [{"x": 100, "y": -50}, {"x": 200, "y": -50, "type": "elite"}]},
+            {"spawn_delay": 3, "enemies": [{"x": 300, "y": -50, "pattern": "zigzag"}]}
+        ],
+        "boss": {"type": "mini", "x": 300, "y": -100}
+    }
+    data.update(overrides)
+    return data
+
+
+def test_timeline_frames():
+    level = parse_level(make_level())
+    frames = [(frame, wave) for frame, _, wave, _ in level.timeline]
+    # Wave 1 spawns every 5 frames; wave 2 starts wave_delay frames after its
+    # last spawn, counting that frame (10 + 10 - 1), and spawns 3 frames later.
+    # The boss follows the last spawn the same way, one frame later.
+    assert frames == [(5, 0), (10, 0), (22, 1), (32, 2)]
+    assert level.timeline[-1][3] is None
+    assert [spec["x"] for _, _, _, spec in level.timeline[:-1]] == [100, 200, 300]
+
+
+def test_defaults():
+    data = make_level()
+    del data["wave_delay"]
+    for wave in data["waves"]:
+        del wave["spawn_delay"]
+    frames = [frame for frame, _, _, _ in parse_level(data).timeline]
+    assert frames == [60, 120, 359, 539]
+
+
+@pytest.mark.parametrize("overrides, message", [
+    ({"waves": []}, "level needs a non-empty list of waves"),
+    ({"wave_delay": 0}, "wave_delay must be a positive integer"),
+    ({"wave_delay": 1.5}, "wave_delay must be a positive integer"),
+    ({"waves": [{"enemies": [{"x": 1, "colour": "red"}]}]}, "wave 1, enemy 1: unknown keys colour"),
+    ({"waves": [{"enemies": [{"type": "dragon"}]}]}, "wave 1, enemy 1: type must be one of"),
+    ({"waves": [{"enemies": [{"pattern": "loop"}]}]}, "wave 1, enemy 1: pattern must be one of"),
+    ({"waves": [{"enemies": [{"x": "left"}]}]}, "wave 1, enemy 1: x must be a number"),
+    ({"waves": [{"enemies": [{"y": True}]}]}, "wave 1, enemy 1: y must be a number"),
+    ({"waves": [{"spawn_delay": -1, "enemies": [{}]}]}, "wave 1: spawn_delay must be a positive integer"),
+    ({"boss": None}, "level needs a boss"),
+    ({"boss": {"type": "blob", "x": 0, "y": 0}}, "boss type must be one of"),
+    ({"boss": {"type": "mini", "x": 0}}, "boss y must be a number")
+])
+def test_invalid_level(overrides, message):
+    with pytest.raises(ValueError, match=f"^bad.json: {message}"):
+        parse_level(make_level(**overrides), "bad.json")
+
+
+def test_not_an_object():
+    with pytest.raises(ValueError, match="level must be an object"):
+        parse_level([])
+
+
+def test_off_playfield_warnings():
+    data = make_level()
+    data["waves"][0]["enemies"][1]["x"] = -40
+    data["boss"]["y"] = -500
+    with pytest.warns(UserWarning) as caught:
+        parse_level(data, "off.json")
+    messages = [str(warning.message) for warning in caught]
+    assert messages == ["off.json: wave 1, enemy 2 spawns off the playfield at (-40, -50)",
+                        "off.json: boss spawns off the playfield at (300, -500)"]
+
+
+def test_bundled_levels_load_cleanly():
+    assert level_count() > 0
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for level_num in range(1, level_count() + 1):
+            load_level.__wrapped__(level_num)
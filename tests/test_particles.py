@@ -0,0 +1,31 @@
+import numpy as np
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+from src.particles import ParticleSystem
+
+
+def test_draw_areas_cover_particles_tightly():
+    particles = ParticleSystem(512)
+    particles.rng = np.random.default_rng(1)
+    # Two bursts in opposite corners of the playfield
+    particles.emit("debris", 40, 40, 150)
+    particles.emit("impact", 560, 760, 150)
+    for _ in range(5):
+        particles.update()
+    
+    screen = pygame.Surface((600, 800))
+    areas = particles.draw(screen)
+    assert areas
+    # Every lit pixel lies in a reported area
+    lit = np.argwhere(pygame.surfarray.array3d(screen).max(axis=2) > 0)
+    for x, y in lit.tolist():
+        assert any(area.collidepoint(x, y) for area in areas)
+    # The areas stay near the bursts instead of spanning the screen
+    assert sum(area.width * area.height for area in areas) < 600 * 800 // 20
+    assert not pygame.Rect(200, 200, 200, 400).collidelistall(areas)
+
+
+def test_draw_nothing():
+    assert ParticleSystem(16).draw(pygame.Surface((10, 10))) == []
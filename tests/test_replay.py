@@ -0,0 +1,118 @@
+import pytest
+from main import Game, parse_args
+from src.controls import NO_INPUT, MOVE_LEFT, MOVE_RIGHT, MOVE_UP, FIRE, MISSILE
+from src.replay import InputRecorder, InputReplay, MAX_SEED
+
+
+# A few seconds of varied input: weaving, firing and launching missiles
+INPUTS = ([MOVE_LEFT | FIRE] * 40 + [MOVE_RIGHT | FIRE] * 80 + [MOVE_UP] * 20 +
+          [FIRE | MISSILE] * 5 + [NO_INPUT] * 15 + [MOVE_LEFT | FIRE] * 40) * 3
+
+
+def play(seed, level, frames, inputs, record_path=None):
+    """Simulate a headless session and return the game"""
+    game = Game(headless=True, seed=seed, record_path=record_path)
+    game.selected_level = level
+    game.new_game()
+    game.simulate(frames, inputs)
+    return game
+
+
+@pytest.mark.parametrize("level", [1, 3])
+def test_replay_reproduces_checksum(tmp_path, level):
+    path = str(tmp_path / "session.nsr")
+    game = play(1234, level, len(INPUTS), INPUTS, path)
+    checksum = game.state_checksum()
+    game.finish_recording()
+    
+    replay = InputReplay.load(path)
+    assert (replay.seed, replay.level, len(replay)) == (1234, level, len(INPUTS))
+    assert replay.checksum == checksum
+    
+    replayed = play(replay.seed, replay.level, len(replay), replay)
+    assert replayed.state_checksum() == checksum
+
+
+def test_different_seed_diverges():
+    first = play(1, 1, len(INPUTS), INPUTS)
+    second = play(2, 1, len(INPUTS), INPUTS)
+    assert first.state_checksum() != second.state_checksum()
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "session.nsr")
+    recorder = InputRecorder(99, 2)
+    for buttons in (FIRE, MOVE_LEFT, 0x1FF):
+        recorder.record(buttons)
+    recorder.save(path, 0xDEADBEEF)
+    
+    replay = InputReplay.load(path)
+    assert (replay.seed, replay.level, replay.checksum) == (99, 2, 0xDEADBEEF)
+    # Masks are stored as one byte per frame; past the end there is no input
+    assert [replay(frame, None) for frame in range(4)] == [FIRE, MOVE_LEFT, 0xFF, NO_INPUT]
+
+
+@pytest.mark.parametrize("damage, message", [
+    (lambda data: b"", "not a replay file"),
+    (lambda data: b"XXXX" + data[4:], "not a replay file"),
+    (lambda data: data[:4] + b"\x09\x00" + data[6:], "unsupported replay version 9"),
+    (lambda data: data[:-1], "replay is truncated")
+])
+def test_load_rejects_bad_files(tmp_path, damage, message):
+    path = tmp_path / "session.nsr"
+    recorder = InputRecorder(1, 1)
+    recorder.record(FIRE)
+    recorder.save(str(path))
+    path.write_bytes(damage(path.read_bytes()))
+    with pytest.raises(ValueError, match=message):
+        InputReplay.load(str(path))
+
+
+@pytest.mark.parametrize("seed", ["-1", str(MAX_SEED + 1), "x"])
+def test_seed_option_rejects_unrecordable_seeds(seed, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(["--seed", seed])
+    assert "--seed" in capsys.readouterr().err
+
+
+def test_seed_option_accepts_full_range(tmp_path):
+    assert parse_args(["--seed", "0"]).seed == 0
+    assert parse_args(["--seed", str(MAX_SEED)]).seed == MAX_SEED
+    # The largest seed survives a save and load
+    path = str(tmp_path / "session.nsr")
+    game = play(MAX_SEED, 1, 60, INPUTS, path)
+    game.finish_recording()
+    assert InputReplay.load(path).seed == MAX_SEED
+
+
+def test_recorder_rejects_negative_seed():
+    with pytest.raises(ValueError, match="cannot record seed -1"):
+        InputRecorder(-1, 1)
+
+
+def test_recording_left_from_a_menu_replays(tmp_path):
+    path = str(tmp_path / "session.nsr")
+    game = play(5, 1, 300, INPUTS, path)
+    # Pausing and quitting to the menu runs no ticks
+    game.game_state = "paused"
+    game.finish_recording()
+    
+    replay = InputReplay.load(path)
+    assert len(replay) == 300
+    replayed = play(replay.seed, replay.level, len(replay), replay)
+    assert replayed.state_checksum() == replay.checksum
+
+
+def test_each_session_gets_its_own_recording(tmp_path):
+    path = str(tmp_path / "session.nsr")
+    game = play(5, 1, 30, INPUTS, path)
+    game.game_state = "level_select"
+    game.selected_level = 2
+    game.new_game()
+    game.simulate(20, INPUTS)
+    game.finish_recording()
+    
+    first = InputReplay.load(path)
+    second = InputReplay.load(str(tmp_path / "session-2.nsr"))
+    assert (first.level, len(first)) == (1, 30)
+    assert (second.level, len(second)) == (2, 20)
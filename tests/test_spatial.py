@@ -0,0 +1,166 @@
+import math
+import random
+import numpy as np
+import pytest
+try:
+    import pygame
+except ImportError:
+    import pygame_ce as pygame
+from src.spatial import SpatialHash, TargetGrid, is_live_target
+
+
+def cells_of(left, top, right, bottom, size):
+    """Cells a box covers (right/bottom exclusive), computed directly"""
+    return {(cx, cy) for cx in range(left // size, (right - 1) // size + 1)
+            for cy in range(top // size, (bottom - 1) // size + 1)}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_query_ids_matches_brute_force(seed):
+    rng = random.Random(seed)
+    size = 64
+    grid = SpatialHash(size)
+    # Small shots and wide ones that straddle cell borders, some off screen
+    count = 300
+    lefts = np.array([rng.randint(-100, 700) for _ in range(count)])
+    tops = np.array([rng.randint(-100, 900) for _ in range(count)])
+    widths = np.array([rng.choice((4, 8, 70, 150)) for _ in range(count)])
+    heights = np.array([rng.choice((10, 16, 70)) for _ in range(count)])
+    ids = np.arange(count) * 3 + 1
+    grid.insert_batch("shots", ids, lefts, tops, lefts + widths, tops + heights)
+    
+    for _ in range(200):
+        rect = pygame.Rect(rng.randint(-150, 750), rng.randint(-150, 950),
+                           rng.choice((1, 40, 64, 200)), rng.choice((1, 40, 64, 200)))
+        found = grid.query_ids("shots", rect)
+        assert len(found) == len(set(found.tolist()))
+        
+        query_cells = cells_of(rect.left, rect.top, rect.right, rect.bottom, size)
+        expected = {int(ids[i]) for i in range(count)
+                    if cells_of(lefts[i], tops[i], lefts[i] + widths[i], tops[i] + heights[i], size) & query_cells}
+        assert set(found.tolist()) == expected
+        # Candidates are a superset of the boxes that actually overlap
+        overlapping = {int(ids[i]) for i in range(count)
+                       if rect.colliderect((lefts[i], tops[i], widths[i], heights[i]))}
+        assert overlapping <= expected
+
+
+def test_query_ids_empty():
+    grid = SpatialHash()
+    assert len(grid.query_ids("shots", pygame.Rect(0, 0, 10, 10))) == 0
+    grid.insert_batch("shots", np.array([], dtype=int), *(np.array([]),) * 4)
+    assert len(grid.query_ids("shots", pygame.Rect(0, 0, 10, 10))) == 0
+    grid.insert_batch("shots", np.array([5]), np.array([0]), np.array([0]), np.array([4]), np.array([4]))
+    assert grid.query_ids("shots", pygame.Rect(500, 500, 10, 10)).tolist() == []
+    assert grid.query_ids("shots", pygame.Rect(2, 2, 1, 1)).tolist() == [5]
+    grid.clear()
+    assert len(grid.query_ids("shots", pygame.Rect(0, 0, 10, 10))) == 0
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_query_matches_brute_force(seed):
+    rng = random.Random(seed)
+    grid = SpatialHash(64)
+    rects = [pygame.Rect(rng.randint(-50, 650), rng.randint(-50, 850), rng.choice((20, 40, 100)), 40)
+             for _ in range(150)]
+    for rect in rects:
+        grid.insert("enemies", rect, rect)
+    for _ in range(100):
+        query = pygame.Rect(rng.randint(-50, 650), rng.randint(-50, 850), rng.choice((8, 64, 130)), 30)
+        found = grid.query("enemies", query)
+        assert len(found) == len({id(r) for r in found})
+        for rect in rects:
+            if rect.colliderect(query):
+                assert any(r is rect for r in found)
+
+
+class Target:
+    """Minimal homing target"""
+    
+    def __init__(self, x, y, health=10, alive=True):
+        """Initialize a target at (x, y)"""
+        self.x = x
+        self.y = y
+        self.health = health
+        self.alive = alive
+
+
+def brute_nearest(targets, x, y, direction=None, cone=180, max_range=None):
+    """Distance to the closest target nearest() may return, by linear scan"""
+    best = math.inf if max_range is None else max_range * max_range
+    found = None
+    for target in targets:
+        tx, ty = target.x - x, target.y - y
+        distance = tx * tx + ty * ty
+        if distance >= best or not is_live_target(target):
+            continue
+        if direction is not None and cone < 180 and distance > 0:
+            angle = abs(math.degrees(math.atan2(ty, tx) - math.atan2(direction[1], direction[0])))
+            if min(angle, 360 - angle) > cone:
+                continue
+        best, found = distance, target
+    return None if found is None else best
+
+
+def squared_distance(target, x, y):
+    """Squared distance from (x, y) to a target"""
+    return (target.x - x) ** 2 + (target.y - y) ** 2
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_nearest_matches_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(20):
+        # Clustered and spread targets, some dead, some exactly on cell borders
+        targets = [Target(rng.uniform(-60, 660), rng.uniform(-200, 860),
+                          rng.choice((10, 10, 10, 0)), rng.random() > 0.1)
+                   for _ in range(rng.randint(0, 80))]
+        targets += [Target(96 * rng.randint(-1, 6), 96 * rng.randint(-2, 8)) for _ in range(5)]
+        grid = TargetGrid()
+        half = len(targets) // 2
+        grid.reset(targets[:half], targets[half:])
+        for _ in range(50):
+            x, y = rng.uniform(-100, 700), rng.uniform(-250, 900)
+            angle = rng.uniform(-math.pi, math.pi)
+            direction = (math.cos(angle) * 5, math.sin(angle) * 5)
+            cone = rng.choice((10, 45, 75, 120, 180))
+            max_range = rng.choice((None, 50, 300, 600))
+            found = grid.nearest(x, y, direction, cone, max_range)
+            expected = brute_nearest(targets, x, y, direction, cone, max_range)
+            if expected is None:
+                assert found is None
+            else:
+                # Ties may resolve to either target; the distance must match
+                assert found is not None and is_live_target(found)
+                assert squared_distance(found, x, y) == pytest.approx(expected)
+
+
+def test_nearest_empty_grid():
+    grid = TargetGrid()
+    assert grid.nearest(0, 0) is None
+    grid.reset([], [])
+    assert grid.nearest(0, 0) is None
+    grid.reset([Target(10, 10, health=0), Target(20, 20, alive=False)])
+    assert grid.nearest(0, 0) is None
+
+
+def test_nearest_cone_edges():
+    def at(degrees, distance):
+        """Target at an angle off straight up from (300, 400)"""
+        angle = math.radians(-90 + degrees)
+        return Target(300 + math.cos(angle) * distance, 400 + math.sin(angle) * distance)
+    # Heading straight up: one target 70 degrees off, a closer one 80 degrees
+    # off, and the closest one behind
+    inside, outside = at(70, 200), at(-80, 180)
+    grid = TargetGrid()
+    grid.reset([inside, outside, at(120, 50)])
+    assert grid.nearest(300, 400, (0, -1), 75) is inside
+    assert grid.nearest(300, 400, (0, -1), 65) is None
+    assert grid.nearest(300, 400, (0, -1), 85) is outside
+    # Out of range or with no usable direction
+    assert grid.nearest(300, 400, (0, -1), 75, max_range=150) is None
+    assert grid.nearest(300, 400, (0, 0), 75).health > 0
+    # A target moving away from a cell is still found after a new reset
+    inside.x, inside.y = 900, 900
+    grid.reset([inside])
+    assert grid.nearest(0, 0) is inside